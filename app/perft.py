@@ -0,0 +1,193 @@
+"""
+Perft command: count the leaf nodes of the legal move tree, and time the count
+
+python -m app.perft                        start position, depth 3, divide output
+python -m app.perft --fen "<FEN>" -d 4     any position
+python -m app.perft --position kiwipete    a reference position
+python -m app.perft --check -d 3           compare the reference positions with
+                                           their known counts (exit code 1 if wrong)
+python -m app.perft -d 5 --workers 4       split the root moves between 4 processes
+python -m app.perft -d 5 --hash 64         reuse the counts of the transpositions
+                                           (table of 64 MB)
+"""
+import argparse
+import logging
+import sys
+import time
+
+from app.src.exceptions.fen_error import FenError
+from app.src.logger import LOGGER
+from app.src.model.game.perft import REFERENCE_POSITIONS, perft, perft_divide
+from app.src.model.game.perft_table import REPLACEMENT_POLICIES, PerftTable
+from app.src.model.states.position import Position
+
+REFERENCE_FENS = {name: fen for name, fen, _ in REFERENCE_POSITIONS}
+
+
+def _print_speed(nodes: int, elapsed: float) -> None:
+    """
+    Print the number of nodes, the time and the nodes per second
+    @param nodes:
+    @param elapsed: in seconds
+    """
+    print(f"Nodes: {nodes}")
+    print(f"Time: {elapsed:.3f} s")
+    print(f"Nodes per second: {nodes / elapsed if elapsed else 0:.0f}")
+
+
+def _print_table(table: PerftTable | None, workers: int) -> None:
+    """
+    Print the hit rate of the table
+    (the tables of the processes of a pool are not visible)
+    @param table:
+    @param workers:
+    """
+    if table is None or workers > 1:
+        return
+    info = table.info()
+    print(
+        f"Hash: {info.hits}/{info.probes} hits ({info.hit_rate:.1%}), "
+        f"{info.stores} stores, {info.size} entries"
+    )
+
+
+def run_divide(
+    fen: str,
+    depth: int,
+    workers: int = 1,
+    split_depth: int = 1,
+    table: PerftTable | None = None,
+) -> None:
+    """
+    Print the count of each root move, then the total and the speed
+    @param fen:
+    @param depth:
+    @param workers: number of processes
+    @param split_depth: depth of the positions sent to the processes
+    @param table: transposition table (optional)
+    """
+    position = Position.from_fen(fen)
+    start = time.perf_counter()
+    divide = perft_divide(position, depth, workers, split_depth, table)
+    elapsed = time.perf_counter() - start
+    for move, nodes in divide.items():
+        print(f"{move!r}: {nodes}")
+    print(f"Moves: {len(divide)}")
+    _print_speed(sum(divide.values()), elapsed)
+    _print_table(table, workers)
+
+
+def _timed_perft(
+    position: Position,
+    depth: int,
+    workers: int,
+    table_config: tuple[float, str] | None,
+) -> tuple[int, float]:
+    """
+    Count the leaf nodes under position, with a new transposition table
+    @param position:
+    @param depth:
+    @param workers: number of processes
+    @param table_config: (memory in MB, replacement policy) of the table
+    (None: no table)
+    @return: (number of nodes, time in seconds)
+    """
+    table = None if table_config is None else PerftTable(*table_config)
+    start = time.perf_counter()
+    nodes = perft(position, depth, workers, table)
+    return nodes, time.perf_counter() - start
+
+
+def run_check(
+    max_depth: int,
+    workers: int = 1,
+    table_config: tuple[float, str] | None = None,
+) -> bool:
+    """
+    Count the reference positions up to max_depth and compare with the known counts
+    @param max_depth:
+    @param workers: number of processes
+    @param table_config: (memory in MB, replacement policy) of the transposition
+    table, a new one for each count (None: no table)
+    @return: True if all the counts are right
+    """
+    success = True
+    total_nodes, total_time = 0, 0.0
+    for name, fen, counts in REFERENCE_POSITIONS:
+        position = Position.from_fen(fen)
+        for depth, expected in counts.items():
+            if depth > max_depth:
+                break
+            nodes, elapsed = _timed_perft(position, depth, workers, table_config)
+            total_nodes += nodes
+            total_time += elapsed
+            status = "ok" if nodes == expected else f"FAILED (expected {expected})"
+            print(f"{name} depth {depth}: {nodes} {status} [{elapsed:.3f} s]")
+            success &= nodes == expected
+    _print_speed(total_nodes, total_time)
+    return success
+
+
+def main(argv: [str] = None) -> int:
+    """
+    Entry point
+    @param argv: command arguments (default: sys.argv)
+    @return: exit code
+    """
+    parser = argparse.ArgumentParser(prog="python -m app.perft", description=__doc__)
+    parser.add_argument("-d", "--depth", type=int, default=3)
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1, help="number of processes"
+    )
+    parser.add_argument(
+        "--split-depth",
+        type=int,
+        default=1,
+        help="depth of the positions sent to the processes",
+    )
+    parser.add_argument(
+        "--hash",
+        type=float,
+        default=0,
+        metavar="MB",
+        help="memory of the transposition table (0: no table)",
+    )
+    parser.add_argument(
+        "--replacement",
+        choices=REPLACEMENT_POLICIES,
+        default="depth",
+        help="replacement policy of the transposition table",
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--fen", help="position to count")
+    source.add_argument(
+        "--position", choices=sorted(REFERENCE_FENS), help="reference position"
+    )
+    source.add_argument(
+        "--check",
+        action="store_true",
+        help="check the reference positions up to the depth",
+    )
+    args = parser.parse_args(argv)
+    if args.depth < 1 or args.workers < 1 or args.split_depth < 1:
+        parser.error("the depth, workers and split depth must be at least 1")
+    table_config = (args.hash, args.replacement) if args.hash > 0 else None
+    # The move generation logs every call: it would be timed with the moves
+    LOGGER.setLevel(logging.WARNING)
+    if args.check:
+        return 0 if run_check(args.depth, args.workers, table_config) else 1
+    try:
+        run_divide(
+            args.fen or REFERENCE_FENS[args.position or "start"],
+            args.depth,
+            args.workers,
+            args.split_depth,
+            None if table_config is None else PerftTable(*table_config),
+        )
+    except FenError as error:
+        parser.error(str(error))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
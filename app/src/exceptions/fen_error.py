@@ -0,0 +1,27 @@
+"""
+fen error
+"""
+
+
+class FenError(Exception):
+    """
+    Exception raised when a FEN string can't be parsed
+    """
+
+    def __init__(self, fen: str, reason: str):
+        """
+        Constructor
+        Creates the error message
+        @param fen: problematic FEN string (used for the error message)
+        @param reason: what is wrong in the FEN string
+        """
+        self.fen = fen
+        self.message = f"Invalid FEN {fen!r}: {reason}"
+        super().__init__(self.message)
+
+    def __str__(self):
+        """
+        str function
+        @return: error message
+        """
+        return self.message
@@ -0,0 +1,47 @@
+"""
+Bitboard helpers.
+A bitboard is a 64 bits int, with one bit per square:
+bit 0 is A1, bit 1 is B1, ..., bit 7 is H1, bit 8 is A2, ..., bit 63 is H8
+"""
+from typing import Iterator
+
+from app.src.model.classes.pieces.bishop import Bishop
+from app.src.model.classes.pieces.king import King
+from app.src.model.classes.pieces.knight import Knight
+from app.src.model.classes.pieces.pawn import Pawn
+from app.src.model.classes.pieces.queen import Queen
+from app.src.model.classes.pieces.rook import Rook
+from app.src.model.classes.square import Square
+
+# Piece types with a bitboard (one bitboard per type and per color)
+PIECE_TYPES = (Bishop, King, Knight, Pawn, Queen, Rook)
+
+
+def square_bit(square: Square) -> int:
+    """
+    Return the bitboard with only the bit of square set
+    @param square:
+    @return: bitboard
+    """
+    return 1 << square.index
+
+
+def bitboard_indexes(bitboard: int) -> Iterator[int]:
+    """
+    Iterate on the indexes of the bits set in bitboard (lowest first)
+    @param bitboard:
+    @return: iterator of int between 0 and 63
+    """
+    while bitboard:
+        lowest_bit = bitboard & -bitboard
+        yield lowest_bit.bit_length() - 1
+        bitboard ^= lowest_bit
+
+
+def bitboard_squares(bitboard: int) -> Iterator[Square]:
+    """
+    Iterate on the squares of the bits set in bitboard (A1 first, H8 last)
+    @param bitboard:
+    @return: iterator of squares
+    """
+    return map(Square.from_index, bitboard_indexes(bitboard))
@@ -0,0 +1,27 @@
+"""
+Castling rights, stored in a 4 bits mask
+"""
+from app.src.model.classes.const.color import Color
+
+WHITE_SHORT_CASTLING = 0b0001
+WHITE_LONG_CASTLING = 0b0010
+BLACK_SHORT_CASTLING = 0b0100
+BLACK_LONG_CASTLING = 0b1000
+ALL_CASTLING = 0b1111
+
+# Rights lost when a move starts from or arrives on a square (square index: rights)
+# The king squares (E1, E8) and the rook squares (A1, H1, A8, H8)
+CASTLING_RIGHTS_LOST = {
+    4: WHITE_SHORT_CASTLING | WHITE_LONG_CASTLING,
+    0: WHITE_LONG_CASTLING,
+    7: WHITE_SHORT_CASTLING,
+    60: BLACK_SHORT_CASTLING | BLACK_LONG_CASTLING,
+    56: BLACK_LONG_CASTLING,
+    63: BLACK_SHORT_CASTLING,
+}
+
+# {color: (long castling right, short castling right)}
+CASTLING_RIGHTS = {
+    Color.WHITE: (WHITE_LONG_CASTLING, WHITE_SHORT_CASTLING),
+    Color.BLACK: (BLACK_LONG_CASTLING, BLACK_SHORT_CASTLING),
+}
@@ -11,20 +11,42 @@ from app.src.model.classes.const.column import Column
 class Square:
     """
     Class tha represent a square in a chass game
-    Contains coordinates, and the piece on it if there is one
+    Contains coordinates, and the index used for the bitboards
+    The 64 squares are built once: Square(column, row) and Square.from_index
+    return the same immutable instance, so two squares are equal
+    only if they are the same object
     """
 
-    def __init__(self, column: Column, row: int):
+    __slots__ = ("column", "row", "index")
+    column: Column
+    row: int
+    # Index of the square, used for the bitboards
+    # A1 = 0, B1 = 1, ..., H1 = 7, A2 = 8, ..., H8 = 63
+    index: int
+
+    def __new__(cls, column: Column, row: int) -> "Square":
         """
-        Build the instance
+        Return the square with coordinates column and row
         @param column: column value (between 1 and 8)
         @param row: row Value
         """
         if not 1 <= row <= 8:
             LOGGER.error("Row must be between 1 and 8 to initiate square")
             raise RowError(row)
-        self.column: Column = column
-        self.row = row
+        return _SQUARES[column._value_ - 1 + 8 * (row - 1)]
+
+    @classmethod
+    def _build(cls, index: int) -> "Square":
+        """
+        Build the square of index (only called to fill _SQUARES)
+        @param index: int between 0 and 63
+        @return: the new square
+        """
+        square = object.__new__(cls)
+        object.__setattr__(square, "column", Column(index % 8 + 1))
+        object.__setattr__(square, "row", index // 8 + 1)
+        object.__setattr__(square, "index", index)
+        return square
 
     @staticmethod
     def add_square(column: int, row: int, available_squares: ["Square"]) -> None:
@@ -36,7 +58,16 @@ class Square:
         @param available_squares: a list of square where the square will be added
         """
         if 1 <= column <= 8 and 1 <= row <= 8:
-            available_squares.append(Square(Column(column), row))
+            available_squares.append(_SQUARES[column - 1 + 8 * (row - 1)])
+
+    @staticmethod
+    def from_index(index: int) -> "Square":
+        """
+        Return the square from its bitboard index
+        @param index: int between 0 and 63
+        @return: the square
+        """
+        return _SQUARES[index]
 
     def square_color(self) -> Color:
         """
@@ -48,11 +79,24 @@ class Square:
         # white
         return Color.WHITE if (self.column.value + self.row) % 2 else Color.BLACK
 
+    def __setattr__(self, name, value):
+        raise AttributeError("Square is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Square is immutable")
+
     def __repr__(self):
         return f"({self.column.name},{self.row})"
 
-    def __eq__(self, other):
-        return self.column == other.column and self.row == other.row
+    # The squares are unique: the default identity __eq__ and __hash__ are used
+    def __reduce__(self):
+        return Square.from_index, (self.index,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
 
-    def __hash__(self):
-        return hash((self.column, self.row))
+_SQUARES = tuple(Square._build(index) for index in range(64))
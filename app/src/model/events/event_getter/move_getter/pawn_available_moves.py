@@ -3,8 +3,10 @@ Getter for the moves from origin
 """
 
 from app.src.model.classes.const.color import Color
-from app.src.model.classes.const.column import Column
 from app.src.model.classes.square import Square
+from app.src.model.events.event_getter.square_getter.leaper_tables import (
+    PAWN_CAPTURE_SQUARES,
+)
 from app.src.model.events.event_getter.square_getter.utils_available_squares_getter import (
     step_next_move,
 )
@@ -32,41 +34,21 @@ def get_pawn_forward_moves(
     @return:
     """
     available_moves = []
-    if (
-        Square(origin.column, origin.row + step_next_move(origin, board.piece_dict))
-        not in board.piece_dict
-    ):
+    destination = Square.from_index(
+        origin.index + 8 * step_next_move(origin, board.piece_dict)
+    )
+    if destination not in board.piece_dict:
         # Promotion:
-        if origin.row + step_next_move(origin, board.piece_dict) in [1, 8]:
+        if destination.row in [1, 8]:
             available_moves.extend(
                 (
-                    QueenPromotion(
-                        origin,
-                        Square(
-                            origin.column,
-                            origin.row + step_next_move(origin, board.piece_dict),
-                        ),
-                    ),
-                    KnightPromotion(
-                        origin,
-                        Square(
-                            origin.column,
-                            origin.row + step_next_move(origin, board.piece_dict),
-                        ),
-                    ),
+                    QueenPromotion(origin, destination),
+                    KnightPromotion(origin, destination),
                 )
             )
         # classic moves
         else:
-            available_moves.append(
-                PawnMove(
-                    origin,
-                    Square(
-                        origin.column,
-                        origin.row + step_next_move(origin, board.piece_dict),
-                    ),
-                )
-            )
+            available_moves.append(PawnMove(origin, destination))
     return available_moves
 
 
@@ -80,30 +62,18 @@ def get_pawn_first_movement(
     @param origin:
     @return:
     """
-    # pylint: disable=R0916
     available_moves = []
     color = board.get_current_color(origin)
-    if (
-        (
-            (color == Color.WHITE and origin.row == 2)
-            or (color == Color.BLACK and origin.row == 7)
-        )
-        and Square(origin.column, origin.row + step_next_move(origin, board.piece_dict))
-        not in board.piece_dict
-        and Square(
-        origin.column, origin.row + 2 * step_next_move(origin, board.piece_dict)
-    )
-        not in board.piece_dict
+    if (color == Color.WHITE and origin.row == 2) or (
+        color == Color.BLACK and origin.row == 7
     ):
-        available_moves.append(
-            Pawn2SquareMove(
-                origin,
-                Square(
-                    origin.column,
-                    origin.row + 2 * step_next_move(origin, board.piece_dict),
-                ),
-            )
-        )
+        step = 8 * step_next_move(origin, board.piece_dict)
+        destination = Square.from_index(origin.index + 2 * step)
+        if (
+            Square.from_index(origin.index + step) not in board.piece_dict
+            and destination not in board.piece_dict
+        ):
+            available_moves.append(Pawn2SquareMove(origin, destination))
     return available_moves
 
 
@@ -118,42 +88,49 @@ def get_pawn_capture_moves(
     @return:
     """
     available_moves = []
-    if origin.column != Column.H:
-        destination = Square(
-            Column(origin.column.value + 1),
-            origin.row + step_next_move(origin, board.piece_dict),
-        )
-        _add_pawn_capture_move(origin, destination, board, available_moves)
-    # capture on the left
-    if origin.column != Column.A:
-        destination = Square(
-            Column(origin.column.value - 1),
-            origin.row + step_next_move(origin, board.piece_dict),
-        )
-        # Promotion
+    # capture on the right, then on the left
+    for destination in PAWN_CAPTURE_SQUARES[board.get_current_color(origin)][
+        origin.index
+    ]:
         _add_pawn_capture_move(origin, destination, board, available_moves)
     return available_moves
 
 
-def get_pawn_enpassant_moves(origin, board: Board, historic: GameHistoric) -> [Move]:
+def get_pawn_enpassant_moves(
+    origin, board: Board, historic: GameHistoric = None
+) -> [Move]:
     """
     Get the en passant moves if available
+    The last move is read in historic, or without historic,
+    the en passant square kept by the board is used
     @param origin:
+    @param board:
+    @param historic:
     @return:
     """
     available_moves = []
+    if historic is None:
+        en_passant_square = board.en_passant_square
+        if (
+            en_passant_square is not None
+            and en_passant_square.row
+            == origin.row + step_next_move(origin, board.piece_dict)
+            and abs(origin.column.value - en_passant_square.column.value) == 1
+        ):
+            available_moves.append(EnPassant(origin, en_passant_square))
+        return available_moves
     last_move = historic.move_historic[-1]
     if (
-        type(historic.move_historic[-1]) == Pawn2SquareMove
+        type(last_move) == Pawn2SquareMove
         and last_move.destination.row == origin.row
         and abs(origin.column.value - last_move.destination.column.value) == 1
     ):
         available_moves.append(
             EnPassant(
                 origin,
-                Square(
-                    last_move.destination.column,
-                    origin.row + step_next_move(origin, board.piece_dict),
+                Square.from_index(
+                    last_move.destination.index
+                    + 8 * step_next_move(origin, board.piece_dict)
                 ),
             )
         )
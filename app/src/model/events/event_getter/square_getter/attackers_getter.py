@@ -0,0 +1,65 @@
+"""
+Reverse square getter: pieces that attack a square.
+Looks outward from the target square (attack tables of each piece type),
+instead of generating the moves of every opponent piece
+"""
+from typing import Iterator
+
+from app.src.model.classes.bitboard import bitboard_squares
+from app.src.model.classes.const.color import Color
+from app.src.model.classes.pieces.bishop import Bishop
+from app.src.model.classes.pieces.king import King
+from app.src.model.classes.pieces.knight import Knight
+from app.src.model.classes.pieces.pawn import Pawn
+from app.src.model.classes.pieces.queen import Queen
+from app.src.model.classes.pieces.rook import Rook
+from app.src.model.classes.square import Square
+from app.src.model.events.event_getter.square_getter.leaper_tables import (
+    KING_ATTACKS,
+    KNIGHT_ATTACKS,
+    PAWN_ATTACKS,
+)
+from app.src.model.events.event_getter.square_getter.slider_attack_tables import (
+    bishop_attacks,
+    rook_attacks,
+)
+from app.src.model.states.board import Board
+
+
+def attackers_to(
+    square: Square, color: Color, board: Board, occupancy: int | None = None
+) -> Iterator[Square]:
+    """
+    Iterate on the squares of the pieces with a different color than *color*
+    that attack square (the pieces that could take a piece of color *color* on square).
+    The cheapest attackers (pawns, knights, king) are looked for first,
+    so the iteration can be stopped at the first attacker.
+    @param square: the attacked square
+    @param color: color of the piece that is attacked
+    @param board:
+    @param occupancy: bitboard of the pieces that block the rays
+    (default: all the pieces of the board)
+    @return: iterator of the attacker squares
+    """
+    if occupancy is None:
+        occupancy = board.all_occupancy
+    opponent_bitboards = board.bitboards[
+        Color.BLACK if color == Color.WHITE else Color.WHITE
+    ]
+    # An opponent pawn attacks square from the squares that a pawn
+    # of color *color* on square would attack
+    yield from bitboard_squares(
+        PAWN_ATTACKS[color][square.index] & opponent_bitboards[Pawn]
+    )
+    yield from bitboard_squares(
+        KNIGHT_ATTACKS[square.index] & opponent_bitboards[Knight]
+    )
+    yield from bitboard_squares(KING_ATTACKS[square.index] & opponent_bitboards[King])
+    yield from bitboard_squares(
+        rook_attacks(square.index, occupancy)
+        & (opponent_bitboards[Rook] | opponent_bitboards[Queen])
+    )
+    yield from bitboard_squares(
+        bishop_attacks(square.index, occupancy)
+        & (opponent_bitboards[Bishop] | opponent_bitboards[Queen])
+    )
@@ -2,11 +2,14 @@
 Square getter for a bishop (available square from origin}
 """
 from app.src.model.classes.square import Square
+from app.src.model.events.event_getter.square_getter.ray_tables import (
+    DIAGONAL_DIRECTIONS,
+)
+from app.src.model.events.event_getter.square_getter.slider_attack_tables import (
+    bishop_attacks,
+)
 from app.src.model.events.event_getter.square_getter.utils_available_squares_getter import (
-    available_squares_diagonal_right_up,
-    available_squares_diagonal_right_down,
-    available_squares_diagonal_left_up,
-    available_squares_diagonal_left_down,
+    available_squares_from_attacks,
 )
 from app.src.model.states.board import Board
 
@@ -18,13 +21,9 @@ def bishop_available_squares(origin: Square, board: Board):
     Can take a piece with different color
     @return: list of reachable squares
     """
-    available_squares_list: list[Square] = []
-    # diagonal right up squares
-    available_squares_list.extend(available_squares_diagonal_right_up(origin, board))
-    # diagonal right down squares
-    available_squares_list.extend(available_squares_diagonal_right_down(origin, board))
-    # diagonal left up squares
-    available_squares_list.extend(available_squares_diagonal_left_up(origin, board))
-    # diagonal left down squares
-    available_squares_list.extend(available_squares_diagonal_left_down(origin, board))
-    return available_squares_list
+    return available_squares_from_attacks(
+        origin,
+        board,
+        bishop_attacks(origin.index, board.all_occupancy),
+        DIAGONAL_DIRECTIONS,
+    )
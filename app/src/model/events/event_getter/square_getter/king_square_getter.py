@@ -1,9 +1,8 @@
 """
 Square getter for king, form origin
 """
-from copy import copy
-
 from app.src.model.classes.square import Square
+from app.src.model.events.event_getter.square_getter.leaper_tables import KING_SQUARES
 from app.src.model.states.board import Board
 
 
@@ -15,21 +14,10 @@ def king_available_squares(origin: Square, board: Board):
     @param board:
     @return:
     """
-    available_squares_list = []
-    color = board.piece_dict[origin].color
-    Square.add_square(
-        origin.column.value - 1,
-        origin.row - 1,
-        available_squares_list,
-    )
-    Square.add_square(origin.column.value - 1, origin.row, available_squares_list)
-    Square.add_square(origin.column.value - 1, origin.row + 1, available_squares_list)
-    Square.add_square(origin.column.value, origin.row - 1, available_squares_list)
-    Square.add_square(origin.column.value, origin.row + 1, available_squares_list)
-    Square.add_square(origin.column.value + 1, origin.row - 1, available_squares_list)
-    Square.add_square(origin.column.value + 1, origin.row, available_squares_list)
-    Square.add_square(origin.column.value + 1, origin.row + 1, available_squares_list)
-    for square in copy(available_squares_list):
-        if square in board.piece_dict and board.piece_dict[square].color == color:
-            available_squares_list.remove(square)
-    return available_squares_list
+    own_occupancy = board.occupancy[board.piece_dict[origin].color]
+    # Remove the squares with a piece of the same color
+    return [
+        square
+        for square in KING_SQUARES[origin.index]
+        if not own_occupancy >> square.index & 1
+    ]
@@ -1,9 +1,8 @@
 """
 Square getter for knight, from origin
 """
-from copy import copy
-
 from app.src.model.classes.square import Square
+from app.src.model.events.event_getter.square_getter.leaper_tables import KNIGHT_SQUARES
 from app.src.model.states.board import Board
 
 
@@ -18,54 +17,10 @@ def knight_available_squares(origin: Square, board: Board) -> [Square]:
     @param board:
     @return:
     """
-    available_squares_list: list[Square] = []
-    color = board.get_current_color(origin)
-    # up squares
-    Square.add_square(
-        origin.column.value - 1,
-        origin.row + 2,
-        available_squares_list,
-    )
-    Square.add_square(
-        origin.column.value + 1,
-        origin.row + 2,
-        available_squares_list,
-    )
-    # down squares
-    Square.add_square(
-        origin.column.value - 1,
-        origin.row - 2,
-        available_squares_list,
-    )
-    Square.add_square(
-        origin.column.value + 1,
-        origin.row - 2,
-        available_squares_list,
-    )
-    # right squares
-    Square.add_square(
-        origin.column.value + 2,
-        origin.row - 1,
-        available_squares_list,
-    )
-    Square.add_square(
-        origin.column.value + 2,
-        origin.row + 1,
-        available_squares_list,
-    )
-    # left squares
-    Square.add_square(
-        origin.column.value - 2,
-        origin.row - 1,
-        available_squares_list,
-    )
-    Square.add_square(
-        origin.column.value - 2,
-        origin.row + 1,
-        available_squares_list,
-    )
-    # Remove squares in available_squares if there is a piece with the same color
-    for square in copy(available_squares_list):
-        if square in board.piece_dict and board.piece_dict[square].color == color:
-            available_squares_list.remove(square)
-    return available_squares_list
+    own_occupancy = board.occupancy[board.get_current_color(origin)]
+    # Remove the squares with a piece of the same color
+    return [
+        square
+        for square in KNIGHT_SQUARES[origin.index]
+        if not own_occupancy >> square.index & 1
+    ]
@@ -0,0 +1,64 @@
+"""
+Attack tables of the pieces that jump (knight, king, pawn captures).
+Built once at import: for each square index (0 to 63),
+the attacked squares as a tuple of squares and as a bitboard
+"""
+from app.src.model.classes.const.color import Color
+from app.src.model.classes.square import Square
+
+# (column, row) steps, in the order the squares are returned by the getters
+KNIGHT_OFFSETS = (
+    (-1, 2),
+    (1, 2),
+    (-1, -2),
+    (1, -2),
+    (2, -1),
+    (2, 1),
+    (-2, -1),
+    (-2, 1),
+)
+KING_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+# capture on the right, then on the left
+WHITE_PAWN_CAPTURE_OFFSETS = ((1, 1), (-1, 1))
+BLACK_PAWN_CAPTURE_OFFSETS = ((1, -1), (-1, -1))
+
+
+def _leaper_squares(offsets: tuple[tuple[int, int], ...]) -> tuple[tuple[Square]]:
+    """
+    Build the table of the squares at offsets from each square (inside the board)
+    @param offsets: (column, row) steps
+    @return: tuple of 64 tuples of squares
+    """
+    table = []
+    for index in range(64):
+        squares = []
+        for column_step, row_step in offsets:
+            Square.add_square(
+                index % 8 + 1 + column_step, index // 8 + 1 + row_step, squares
+            )
+        table.append(tuple(squares))
+    return tuple(table)
+
+
+def _bitboards(squares_table: tuple[tuple[Square]]) -> tuple[int]:
+    """
+    Convert a table of squares into a table of bitboards
+    @param squares_table: tuple of 64 tuples of squares
+    @return: tuple of 64 bitboards
+    """
+    return tuple(
+        sum(1 << square.index for square in squares) for squares in squares_table
+    )
+
+
+KNIGHT_SQUARES = _leaper_squares(KNIGHT_OFFSETS)
+KING_SQUARES = _leaper_squares(KING_OFFSETS)
+PAWN_CAPTURE_SQUARES = {
+    Color.WHITE: _leaper_squares(WHITE_PAWN_CAPTURE_OFFSETS),
+    Color.BLACK: _leaper_squares(BLACK_PAWN_CAPTURE_OFFSETS),
+}
+KNIGHT_ATTACKS = _bitboards(KNIGHT_SQUARES)
+KING_ATTACKS = _bitboards(KING_SQUARES)
+PAWN_ATTACKS = {
+    color: _bitboards(squares) for color, squares in PAWN_CAPTURE_SQUARES.items()
+}
@@ -2,15 +2,15 @@
 Square getter for queen
 """
 from app.src.model.classes.square import Square
+from app.src.model.events.event_getter.square_getter.ray_tables import (
+    DIAGONAL_DIRECTIONS,
+    LINE_DIRECTIONS,
+)
+from app.src.model.events.event_getter.square_getter.slider_attack_tables import (
+    queen_attacks,
+)
 from app.src.model.events.event_getter.square_getter.utils_available_squares_getter import (
-    available_squares_on_right,
-    available_squares_on_left,
-    available_squares_upper,
-    available_squares_below,
-    available_squares_diagonal_right_up,
-    available_squares_diagonal_right_down,
-    available_squares_diagonal_left_up,
-    available_squares_diagonal_left_down,
+    available_squares_from_attacks,
 )
 from app.src.model.states.board import Board
 
@@ -21,21 +21,9 @@ def queen_available_squares(origin: Square, board: Board) -> [Square]:
     but can take a piece with a different color.
     @return: list of reachable squares
     """
-    available_squares_list: list[Square] = []
-    # right squares
-    available_squares_list.extend(available_squares_on_right(origin, board))
-    # left squares
-    available_squares_list.extend(available_squares_on_left(origin, board))
-    # up squares
-    available_squares_list.extend(available_squares_upper(origin, board))
-    # down squares
-    available_squares_list.extend(available_squares_below(origin, board))
-    # diagonal right up squares
-    available_squares_list.extend(available_squares_diagonal_right_up(origin, board))
-    # diagonal right down squares
-    available_squares_list.extend(available_squares_diagonal_right_down(origin, board))
-    # diagonal left up squares
-    available_squares_list.extend(available_squares_diagonal_left_up(origin, board))
-    # diagonal left down squares
-    available_squares_list.extend(available_squares_diagonal_left_down(origin, board))
-    return available_squares_list
+    return available_squares_from_attacks(
+        origin,
+        board,
+        queen_attacks(origin.index, board.all_occupancy),
+        LINE_DIRECTIONS + DIAGONAL_DIRECTIONS,
+    )
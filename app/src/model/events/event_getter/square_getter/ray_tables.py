@@ -0,0 +1,56 @@
+"""
+Ray tables of the sliding pieces (rook, bishop, queen).
+Built once at import: for each direction and each square index (0 to 63),
+the squares from the square to the border of the board (square excluded),
+as a tuple of squares (closest first) and as a bitboard
+"""
+from app.src.model.classes.square import Square
+
+# (column, row) steps
+LINE_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+DIAGONAL_DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def _ray_squares(direction: tuple[int, int]) -> tuple[tuple[Square]]:
+    """
+    Build the table of the rays of direction from each square
+    @param direction: (column, row) step
+    @return: tuple of 64 tuples of squares
+    """
+    table = []
+    for index in range(64):
+        squares = []
+        column, row = index % 8 + direction[0], index // 8 + direction[1]
+        while 0 <= column < 8 and 0 <= row < 8:
+            squares.append(Square.from_index(column + 8 * row))
+            column += direction[0]
+            row += direction[1]
+        table.append(tuple(squares))
+    return tuple(table)
+
+
+RAY_SQUARES = {
+    direction: _ray_squares(direction)
+    for direction in LINE_DIRECTIONS + DIAGONAL_DIRECTIONS
+}
+RAY_MASKS = {
+    direction: tuple(sum(1 << square.index for square in squares) for squares in table)
+    for direction, table in RAY_SQUARES.items()
+}
+
+
+def first_blocker(direction: tuple[int, int], index: int, occupancy: int) -> int | None:
+    """
+    Return the index of the first piece met on the ray of direction from index
+    @param direction: (column, row) step
+    @param index: index of the origin square
+    @param occupancy: bitboard of the pieces
+    @return: None if there is no piece on the ray
+    """
+    blockers = RAY_MASKS[direction][index] & occupancy
+    if not blockers:
+        return None
+    # The index grows along the ray: the closest piece is the lowest bit
+    if direction[0] + 8 * direction[1] > 0:
+        return (blockers & -blockers).bit_length() - 1
+    return blockers.bit_length() - 1
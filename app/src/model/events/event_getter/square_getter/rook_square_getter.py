@@ -2,11 +2,14 @@
 Rook square getter, form, origin@
 """
 from app.src.model.classes.square import Square
+from app.src.model.events.event_getter.square_getter.ray_tables import (
+    LINE_DIRECTIONS,
+)
+from app.src.model.events.event_getter.square_getter.slider_attack_tables import (
+    rook_attacks,
+)
 from app.src.model.events.event_getter.square_getter.utils_available_squares_getter import (
-    available_squares_on_right,
-    available_squares_on_left,
-    available_squares_upper,
-    available_squares_below,
+    available_squares_from_attacks,
 )
 from app.src.model.states.board import Board
 
@@ -19,13 +22,6 @@ def rook_available_squares(origin: Square, board: Board) -> [Square]:
     @param board:
     @return: list of reachable squares
     """
-    available_squares_list: list[Square] = []
-    # right squares
-    available_squares_list.extend(available_squares_on_right(origin, board))
-    # left squares
-    available_squares_list.extend(available_squares_on_left(origin, board))
-    # up squares
-    available_squares_list.extend(available_squares_upper(origin, board))
-    # down squares
-    available_squares_list.extend(available_squares_below(origin, board))
-    return available_squares_list
+    return available_squares_from_attacks(
+        origin, board, rook_attacks(origin.index, board.all_occupancy), LINE_DIRECTIONS
+    )
@@ -0,0 +1,114 @@
+"""
+Attack tables of the sliding pieces (rook, bishop, queen), PEXT-style.
+For each square, only the pieces on the rays (border excluded) can block:
+the attacks are stored for every occupancy of these relevant squares,
+in a dict keyed by the masked occupancy (an int is its own hash,
+so the dict is a perfect hash and no magic number has to be searched).
+An attack set is then one mask and one lookup away.
+Built once at import
+"""
+from app.src.model.events.event_getter.square_getter.ray_tables import (
+    DIAGONAL_DIRECTIONS,
+    LINE_DIRECTIONS,
+    RAY_MASKS,
+    RAY_SQUARES,
+    first_blocker,
+)
+
+
+def _relevant_mask(index: int, directions: tuple[tuple[int, int], ...]) -> int:
+    """
+    Return the bitboard of the squares that can block a slider on index
+    (the rays, without the last square before the border)
+    @param index: index of the slider
+    @param directions: (column, row) steps of the slider
+    @return: bitboard
+    """
+    mask = 0
+    for direction in directions:
+        for square in RAY_SQUARES[direction][index][:-1]:
+            mask |= 1 << square.index
+    return mask
+
+
+def sliding_attacks(
+    index: int, occupancy: int, directions: tuple[tuple[int, int], ...]
+) -> int:
+    """
+    Compute the attacks of a slider by looking for the first blocker on each ray
+    (used to build the tables)
+    @param index: index of the slider
+    @param occupancy: bitboard of the pieces
+    @param directions: (column, row) steps of the slider
+    @return: bitboard of the attacked squares (the blockers included)
+    """
+    attacks = 0
+    for direction in directions:
+        ray = RAY_MASKS[direction][index]
+        blocker = first_blocker(direction, index, occupancy)
+        # The squares behind the blocker are not attacked
+        if blocker is not None:
+            ray &= ~RAY_MASKS[direction][blocker]
+        attacks |= ray
+    return attacks
+
+
+def _attack_tables(
+    directions: tuple[tuple[int, int], ...]
+) -> tuple[tuple[int], tuple[dict[int, int]]]:
+    """
+    Build the relevant masks and the attack tables of a slider for every square
+    @param directions: (column, row) steps of the slider
+    @return: (64 masks, 64 {masked occupancy: attacks} dicts)
+    """
+    masks, tables = [], []
+    for index in range(64):
+        mask = _relevant_mask(index, directions)
+        table = {}
+        # Enumerate the subsets of mask (carry-rippler)
+        subset = 0
+        while True:
+            table[subset] = sliding_attacks(index, subset, directions)
+            subset = (subset - mask) & mask
+            if not subset:
+                break
+        masks.append(mask)
+        tables.append(table)
+    return tuple(masks), tuple(tables)
+
+
+ROOK_MASKS, ROOK_TABLES = _attack_tables(LINE_DIRECTIONS)
+BISHOP_MASKS, BISHOP_TABLES = _attack_tables(DIAGONAL_DIRECTIONS)
+
+
+def rook_attacks(index: int, occupancy: int) -> int:
+    """
+    Return the squares attacked by a rook
+    @param index: index of the rook
+    @param occupancy: bitboard of the pieces
+    @return: bitboard of the attacked squares (the blockers included)
+    """
+    return ROOK_TABLES[index][occupancy & ROOK_MASKS[index]]
+
+
+def bishop_attacks(index: int, occupancy: int) -> int:
+    """
+    Return the squares attacked by a bishop
+    @param index: index of the bishop
+    @param occupancy: bitboard of the pieces
+    @return: bitboard of the attacked squares (the blockers included)
+    """
+    return BISHOP_TABLES[index][occupancy & BISHOP_MASKS[index]]
+
+
+def queen_attacks(index: int, occupancy: int) -> int:
+    """
+    Return the squares attacked by a queen
+    @param index: index of the queen
+    @param occupancy: bitboard of the pieces
+    @return: bitboard of the attacked squares (the blockers included)
+    """
+    return (
+        ROOK_TABLES[index][occupancy & ROOK_MASKS[index]]
+        | BISHOP_TABLES[index][occupancy & BISHOP_MASKS[index]]
+    )
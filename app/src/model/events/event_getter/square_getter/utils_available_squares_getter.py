@@ -3,206 +3,37 @@ Auxiliaries function for available_moves
 """
 
 from app.src.model.classes.const.color import Color
-from app.src.model.classes.const.column import Column
 from app.src.model.classes.square import Square
+from app.src.model.events.event_getter.square_getter.ray_tables import (
+    RAY_MASKS,
+    RAY_SQUARES,
+)
 from app.src.model.states.board import Board
 
 
-def available_squares_diagonal_left_down(
+def available_squares_from_attacks(
     origin: Square,
     board: Board,
-):
+    attacks: int,
+    directions: tuple[tuple[int, int], ...],
+) -> [Square]:
     """
-    Returns the available squares on the right on the piece
-    @return:
+    Returns the available squares of a slider from its attack bitboard.
+    The squares are returned ray by ray (in the order of directions),
+    from the closest to origin to the farthest
+    @param origin: square of the slider
+    @param board:
+    @param attacks: bitboard of the squares attacked by the slider
+    @param directions: (column, row) steps of the slider
+    @return: list of available squares
     """
-    return _available_square_on_side_line(
-        origin,
-        [
-            Square(column, row)
-            for column, row in zip(
-            map(Column, range(origin.column.value - 1, 0, -1)),
-            range(origin.row - 1, 0, -1),
-        )
-        ],
-        board,
-    )
-
-
-def available_squares_diagonal_left_up(
-    origin: Square,
-    board: Board,
-):
-    """
-    Returns the available squares on the right on the piece
-    @return:
-    """
-    return _available_square_on_side_line(
-        origin,
-        [
-            Square(column, row)
-            for column, row in zip(
-            map(Column, range(origin.column.value - 1, 0, -1)),
-            range(origin.row + 1, 9),
-        )
-        ],
-        board,
-    )
-
-
-def available_squares_diagonal_right_down(
-    origin: Square,
-    board: Board,
-):
-    """
-    Returns the available squares on the right on the piece
-    @return:
-    """
-    return _available_square_on_side_line(
-        origin,
-        [
-            Square(column, row)
-            for column, row in zip(
-            map(Column, range(origin.column.value + 1, 9)),
-            range(origin.row - 1, 0, -1),
-        )
-        ],
-        board,
-    )
-
-
-def available_squares_diagonal_right_up(
-    origin: Square,
-    board: Board,
-):
-    """
-    Returns the available squares on the right on the piece
-    @return:
-    """
-    return _available_square_on_side_line(
-        origin,
-        [
-            Square(column, row)
-            for column, row in zip(
-            map(Column, range(origin.column.value + 1, 9)),
-            range(origin.row + 1, 9),
-        )
-        ],
-        board,
-    )
-
-
-def available_squares_below(
-    origin: Square,
-    board: Board,
-):
-    """
-    Returns the available squares on the right on the piece
-    @return:
-    """
-    return _available_square_on_side_line(
-        origin,
-        [
-            Square(column, row)
-            for column, row in zip(
-            [origin.column] * (origin.row - 1),
-            range(origin.row - 1, 0, -1),
-        )
-        ],
-        board,
-    )
-
-
-def available_squares_upper(
-    origin: Square,
-    board: Board,
-):
-    """
-    Returns the available squares on the right on the piece
-    @return:
-    """
-    return _available_square_on_side_line(
-        origin,
-        [
-            Square(column, row)
-            for column, row in zip(
-            [origin.column] * (8 - origin.row),
-            range(origin.row + 1, 9),
-        )
-        ],
-        board,
-    )
-
-
-def available_squares_on_left(
-    origin: Square,
-    board: Board,
-):
-    """
-    Returns the available squares on the right on the piece
-
-    """
-    return _available_square_on_side_line(
-        origin,
-        [
-            Square(column, row)
-            for column, row in zip(
-            map(
-                Column,
-                range(origin.column.value - 1, 0, -1),
-            ),
-            [origin.row] * (origin.column.value - 1),
-        )
-        ],
-        board,
-    )
-
-
-def available_squares_on_right(
-    origin: Square,
-    board: Board,
-):
-    """
-    Returns the available squares on the right on the piece
-    @param piece_dict: {(Column, row): Piece} dict of the pieces in the game
-    @return:
-    """
-    return _available_square_on_side_line(
-        origin,
-        [
-            Square(column, row)
-            for column, row in zip(
-            map(
-                Column,
-                range(origin.column.value + 1, 9),
-            ),
-            [origin.row] * (8 - origin.column.value),
-        )
-        ],
-        board,
-    )
-
-
-def _available_square_on_side_line(origin: Square, squares: [Square], board: Board):
-    """
-    Returns the available squares on only one side.
-    (for ex on the right side, or diagonal right).
-    (iterate on a square list)
-    @params squares:
-    @param piece_dict: a list of pieces (represents the pieces in the game)
-    @return: square_list of available squares designated by the product of columns and rows
-    """
-    color = board.get_current_color(origin)
+    attacks &= ~board.occupancy[board.get_current_color(origin)]
     available_squares = []
-    for square in squares:
-        # if there is a piece on the square
-        if square in board.piece_dict:
-            # if the piece can take the other piece
-            if board.piece_dict[square].color != color:
-                available_squares.append(square)
-            break
-        # if there is no piece on the square
-        available_squares.append(square)
+    for direction in directions:
+        # The reachable squares of a ray are the closest ones
+        count = (attacks & RAY_MASKS[direction][origin.index]).bit_count()
+        if count:
+            available_squares.extend(RAY_SQUARES[direction][origin.index][:count])
     return available_squares
 
 
@@ -0,0 +1,172 @@
+"""
+Legality checker.
+Computes the checkers and the pinned pieces once per position,
+then tells if a pseudo-legal move is legal without playing it
+"""
+from app.src.model.classes.const.color import Color
+from app.src.model.classes.pieces.bishop import Bishop
+from app.src.model.classes.pieces.queen import Queen
+from app.src.model.classes.pieces.rook import Rook
+from app.src.model.classes.square import Square
+from app.src.model.events.event_getter.square_getter.attackers_getter import (
+    attackers_to,
+)
+from app.src.model.events.event_getter.square_getter.ray_tables import (
+    DIAGONAL_DIRECTIONS,
+    LINE_DIRECTIONS,
+    RAY_MASKS,
+    first_blocker,
+)
+from app.src.model.events.moves.en_passant import EnPassant
+from app.src.model.events.moves.move import Move
+from app.src.model.states.board import Board
+
+
+class LegalityChecker:
+    """
+    Check and pin information for the pieces of one color.
+    king_square: square of the king
+    checkers: squares of the pieces that give check
+    check_mask: bitboard of the destinations that solve the check
+    (capture of the checker, or block of the ray), every square if no check
+    pin_rays: {index of a pinned piece: bitboard of the squares between the king
+    and the pinner, pinner included}
+    The board must not be modified while the checker is used
+    """
+
+    def __init__(self, color: Color, board: Board):
+        """
+        Constructor
+        Raises a MissingKingError if there is no king of color *color*
+        @param color: color of the player that plays
+        @param board:
+        """
+        self.color = color
+        self.board = board
+        self.king_square = board.get_king(color)
+        self.checkers = list(attackers_to(self.king_square, color, board))
+        self.check_mask = (1 << 64) - 1
+        if len(self.checkers) == 1:
+            self.check_mask = _ray_to(self.king_square, self.checkers[0])
+        self.pin_rays = self._get_pin_rays()
+
+    def _get_pin_rays(self) -> dict[int, int]:
+        """
+        Look from the king along the 8 directions for an own piece
+        followed by an opponent slider that moves in this direction
+        @return: {index of the pinned piece: bitboard of the pin ray}
+        """
+        opponent_bitboards = self.board.bitboards[
+            Color.BLACK if self.color == Color.WHITE else Color.WHITE
+        ]
+        pin_rays = {}
+        for sliders, directions in (
+            (opponent_bitboards[Rook] | opponent_bitboards[Queen], LINE_DIRECTIONS),
+            (
+                opponent_bitboards[Bishop] | opponent_bitboards[Queen],
+                DIAGONAL_DIRECTIONS,
+            ),
+        ):
+            if not sliders:
+                continue
+            for direction in directions:
+                pin = self._pin_on_direction(direction, sliders)
+                if pin is not None:
+                    pin_rays[pin[0]] = pin[1]
+        return pin_rays
+
+    def _pin_on_direction(
+        self, direction: tuple[int, int], sliders: int
+    ) -> tuple[int, int] | None:
+        """
+        Look from the king along direction for a pinned piece
+        @param direction: (column, row) step
+        @param sliders: bitboard of the opponent pieces that move along direction
+        @return: (index of the pinned piece, bitboard of the pin ray), None if no pin
+        """
+        occupancy = self.board.all_occupancy
+        # First piece: can be pinned only if it is an own piece
+        pinned_index = first_blocker(direction, self.king_square.index, occupancy)
+        if (
+            pinned_index is None
+            or not self.board.occupancy[self.color] >> pinned_index & 1
+        ):
+            return None
+        pinner_index = first_blocker(direction, pinned_index, occupancy)
+        if pinner_index is None or not sliders >> pinner_index & 1:
+            return None
+        ray_masks = RAY_MASKS[direction]
+        return pinned_index, (
+            ray_masks[self.king_square.index] & ~ray_masks[pinner_index]
+        )
+
+    def is_legal(self, move: Move) -> bool:
+        """
+        Return if a pseudo-legal move (not a castling) leaves the king safe
+        @param move: move of a piece of the color of the checker
+        @return:
+        """
+        if move.origin == self.king_square:
+            return self.is_king_destination_safe(move.destination)
+        # Double check: only the king can move
+        if len(self.checkers) > 1:
+            return False
+        # The captured pawn can uncover a check on the row: the move is played
+        if isinstance(move, EnPassant):
+            return self._is_en_passant_legal(move)
+        destination_bit = 1 << move.destination.index
+        if not destination_bit & self.check_mask:
+            return False
+        pin_ray = self.pin_rays.get(move.origin.index)
+        return pin_ray is None or bool(destination_bit & pin_ray)
+
+    def is_king_destination_safe(self, destination: Square) -> bool:
+        """
+        Return if the king can go to destination without being in check
+        @param destination: square next to the king (empty or opponent piece)
+        @return:
+        """
+        # The king does not block the rays of the sliders that attack it
+        occupancy = self.board.all_occupancy ^ 1 << self.king_square.index
+        return (
+            next(attackers_to(destination, self.color, self.board, occupancy), None)
+            is None
+        )
+
+    def _is_en_passant_legal(self, move: EnPassant) -> bool:
+        """
+        Play the en passant, and check that the king is not in check
+        @param move:
+        @return:
+        """
+        undo = self.board.make_move(move)
+        try:
+            return (
+                next(attackers_to(self.king_square, self.color, self.board), None)
+                is None
+            )
+        finally:
+            self.board.unmake_move(undo)
+
+    def legal_moves(self, moves: [Move]) -> [Move]:
+        """
+        Keep only the legal moves
+        @param moves: pseudo-legal moves (not castling)
+        @return:
+        """
+        return [move for move in moves if self.is_legal(move)]
+
+
+def _ray_to(king_square: Square, checker: Square) -> int:
+    """
+    Return the bitboard of the squares that solve a check given by checker:
+    the checker square, and the squares between the king and the checker
+    if the checker is on the same line or diagonal
+    @param king_square:
+    @param checker:
+    @return: bitboard
+    """
+    for ray_masks in RAY_MASKS.values():
+        if ray_masks[king_square.index] >> checker.index & 1:
+            return ray_masks[king_square.index] & ~ray_masks[checker.index]
+    return 1 << checker.index
@@ -0,0 +1,121 @@
+"""
+Move counter: number of legal moves of a position, computed from the attack
+tables, the checks and the pins with popcounts, without building the moves.
+Used by perft at the last ply, and as a mobility term
+"""
+from app.src.model.classes.bitboard import bitboard_indexes
+from app.src.model.classes.const.castling_rights import CASTLING_RIGHTS
+from app.src.model.classes.const.color import Color
+from app.src.model.classes.pieces.bishop import Bishop
+from app.src.model.classes.pieces.knight import Knight
+from app.src.model.classes.pieces.pawn import Pawn
+from app.src.model.classes.pieces.queen import Queen
+from app.src.model.classes.pieces.rook import Rook
+from app.src.model.classes.square import Square
+from app.src.model.events.event_getter.square_getter.leaper_tables import (
+    KING_ATTACKS,
+    KNIGHT_ATTACKS,
+    PAWN_ATTACKS,
+)
+from app.src.model.events.event_getter.square_getter.slider_attack_tables import (
+    bishop_attacks,
+    queen_attacks,
+    rook_attacks,
+)
+from app.src.model.events.event_processor.legality_checker import LegalityChecker
+from app.src.model.events.moves.en_passant import EnPassant
+from app.src.model.states.board import Board
+from app.src.model.states.castling_state import castling_moves
+
+ALL_SQUARES = (1 << 64) - 1
+# Rows 1 and 8: a pawn arriving there is promoted (queen or knight: 2 moves)
+PROMOTION_ROWS = 0xFF | 0xFF << 56
+# Rows of the pawns that have not moved
+PAWN_START_ROWS = {Color.WHITE: 0xFF << 8, Color.BLACK: 0xFF << 48}
+SLIDER_ATTACKS = (
+    (Bishop, bishop_attacks),
+    (Rook, rook_attacks),
+    (Queen, queen_attacks),
+)
+
+
+def count_legal_moves(board: Board) -> int:
+    """
+    Return the number of legal moves of board.player
+    (the castling rights and the en passant square of the board are used)
+    The count is the length of the list of the legal moves of the board
+    @param board:
+    @return:
+    """
+    player = board.player
+    legality_checker = LegalityChecker(player, board)
+    own = board.occupancy[player]
+    count = sum(
+        legality_checker.is_king_destination_safe(Square.from_index(index))
+        for index in bitboard_indexes(
+            KING_ATTACKS[legality_checker.king_square.index] & ~own
+        )
+    )
+    # Double check: only the king can move
+    if len(legality_checker.checkers) > 1:
+        return count
+    targets = ~own & legality_checker.check_mask & ALL_SQUARES
+    pin_rays = legality_checker.pin_rays
+    bitboards = board.bitboards[player]
+    occupancy = board.all_occupancy
+    # A pinned knight can't leave the ray of the pin
+    for index in bitboard_indexes(bitboards[Knight]):
+        if index not in pin_rays:
+            count += (KNIGHT_ATTACKS[index] & targets).bit_count()
+    for piece_type, attacks in SLIDER_ATTACKS:
+        for index in bitboard_indexes(bitboards[piece_type]):
+            count += (
+                attacks(index, occupancy) & targets & pin_rays.get(index, ALL_SQUARES)
+            ).bit_count()
+    count += _count_pawn_moves(legality_checker, targets)
+    if not legality_checker.checkers:
+        long_right, short_right = CASTLING_RIGHTS[player]
+        count += len(
+            castling_moves(
+                player,
+                board,
+                bool(board.castling_rights & long_right),
+                bool(board.castling_rights & short_right),
+            )
+        )
+    return count
+
+
+def _count_pawn_moves(legality_checker: LegalityChecker, targets: int) -> int:
+    """
+    Count the pawn moves (a promotion counts for 2 moves: queen and knight)
+    @param legality_checker: checks and pins of the player that plays
+    @param targets: squares that the pieces can reach (not own pieces,
+    and solving the check if any)
+    @return:
+    """
+    board = legality_checker.board
+    player = legality_checker.color
+    opponent = Color.BLACK if player == Color.WHITE else Color.WHITE
+    occupancy = board.all_occupancy
+    step = 8 if player == Color.WHITE else -8
+    en_passant_bit = (
+        1 << board.en_passant_square.index if board.en_passant_square else 0
+    )
+    count = 0
+    for index in bitboard_indexes(board.bitboards[player][Pawn]):
+        allowed = targets & legality_checker.pin_rays.get(index, ALL_SQUARES)
+        destinations = PAWN_ATTACKS[player][index] & board.occupancy[opponent]
+        forward = 1 << index + step
+        if not forward & occupancy:
+            destinations |= forward
+            if 1 << index & PAWN_START_ROWS[player]:
+                destinations |= 1 << index + 2 * step & ~occupancy
+        destinations &= allowed
+        count += destinations.bit_count() + (destinations & PROMOTION_ROWS).bit_count()
+        # En passant can uncover a check on the row: the checker plays it
+        if PAWN_ATTACKS[player][index] & en_passant_bit and legality_checker.is_legal(
+            EnPassant(Square.from_index(index), board.en_passant_square)
+        ):
+            count += 1
+    return count
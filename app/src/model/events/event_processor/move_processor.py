@@ -2,8 +2,6 @@
 Move processor.
 Apply a move and update the global state
 """
-import copy
-
 from app.src.logger import LOGGER
 from app.src.model.classes.const.color import Color
 from app.src.model.classes.pieces.bishop import Bishop
@@ -19,9 +17,13 @@ from app.src.model.events.event_getter.move_getter.pawn_available_moves import (
     get_pawn_capture_moves,
     get_pawn_enpassant_moves,
 )
+from app.src.model.events.event_getter.square_getter.attackers_getter import (
+    attackers_to,
+)
 from app.src.model.events.event_getter.square_getter.square_getter import (
     available_squares,
 )
+from app.src.model.events.event_processor.legality_checker import LegalityChecker
 from app.src.model.events.moves.move import Move
 from app.src.model.states.board import Board
 from app.src.model.states.game_historic import GameHistoric
@@ -34,49 +36,36 @@ def apply_move(move: Move, board: Board) -> bool:
     (Does no legal verification
     @return: True if the moves is a capture
     """
-    capture = move.destination in board.piece_dict
-    board.piece_dict[move.destination] = board.piece_dict[move.origin]
-    board.piece_dict.pop(move.origin)
-    return capture
+    return board.make_move(move).captured is not None
 
 
-def is_square_in_check(
-    color: Color, square: Square, board: Board, historic: GameHistoric = None
-) -> bool:
+def is_square_in_check(color: Color, square: Square, board: Board) -> bool:
     """
     Return a boolean indicating if a piece in a different color can moves
     to square (indicates if a piece of color *color* is in check)
-    @param historic:
+    Stops at the first attacker found
     @param board:
     @param color: color of the piece that we check if it can be taken
     @param square: the square where we check if it can be taken
     @return: boolean
     """
-    return any(
-        piece.color != color
-        and square
-        in list(
-            map(
-                lambda x: x.destination,
-                square_available_moves_no_castling(origin, board, historic),
-            )
-        )
-        for origin, piece in board.piece_dict.items()
-    )
+    return next(attackers_to(square, color, board), None) is not None
 
 
-def is_move_legal(move: Move, board: Board, historic=None) -> bool:
+def is_move_legal(move: Move, board: Board) -> bool:
     """
     Return a boolean value indicating whether the moves is legal or not.
-    Applies the moves in a copy, and check if the king is in the destination of opposite moves
+    Applies the moves on the board, check if the king is in the destination
+    of opposite moves, and undo the move
     @return:
     """
-    board_copy = copy.deepcopy(board)
-    current_color = board_copy.piece_dict[move.origin].color
-    apply_move(move, board_copy)
-    king_square = board_copy.get_king(current_color)
-
-    return not is_square_in_check(current_color, king_square, board_copy, historic)
+    current_color = board.piece_dict[move.origin].color
+    undo = board.make_move(move)
+    try:
+        king_square = board.get_king(current_color)
+        return not is_square_in_check(current_color, king_square, board)
+    finally:
+        board.unmake_move(undo)
 
 
 def square_available_moves_no_castling(
@@ -84,13 +73,17 @@ def square_available_moves_no_castling(
     board: Board,
     historic: GameHistoric = None,
     legal_verification=False,
+    legality_checker: LegalityChecker = None,
 ) -> [Move]:
     """
     Return a list with all the available moves from origin
     The castling are in a separate function, to avoid recursion error
-    @param historic: useful only for pawn
+    @param historic: useful only for pawn (without historic, the en passant
+    square of the board is used)
     @param board:
     @param legal_verification: if a legal verification on the moves must be done
+    @param legality_checker: checks and pins of the position, for the legal
+    verification (computed if not given, give it to share it between squares)
     @param origin: Square origin for the moves
     @return: a list with the available moves from origin
     """
@@ -117,7 +110,7 @@ def square_available_moves_no_castling(
         raise ValueError("Unknown pieces in origin")
     # Remove moves if they are illegal
     if legal_verification:
-        return [
-            move for move in available_moves if is_move_legal(move, board, historic)
-        ]
+        if legality_checker is None:
+            legality_checker = LegalityChecker(origin_piece.color, board)
+        return legality_checker.legal_moves(available_moves)
     return available_moves
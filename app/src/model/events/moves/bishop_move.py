@@ -8,3 +8,5 @@ class BishopMove(Move):
     """
     Bishop moves
     """
+
+    __slots__ = ()
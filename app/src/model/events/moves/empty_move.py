@@ -11,6 +11,8 @@ class EmptyMove(Move):
     Empty moves classes
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
     ):
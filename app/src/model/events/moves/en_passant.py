@@ -11,6 +11,8 @@ class EnPassant(Move):
     Class for EnPassant
     """
 
+    __slots__ = ()
+
     def apply_move(self, piece_dict: dict[Square, Piece]) -> bool:
         """
         Apply an En Passant capture
@@ -22,3 +24,10 @@ class EnPassant(Move):
         piece_dict.pop(Square(self.destination.column, self.origin.row))
         piece_dict.pop(self.origin)
         return True
+
+    def captured_square(self) -> Square:
+        """
+        The captured pawn is next to the origin, not on the destination
+        @return:
+        """
+        return Square(self.destination.column, self.origin.row)
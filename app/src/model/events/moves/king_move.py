@@ -8,3 +8,5 @@ class KingMove(Move):
     """
     Class for king moves
     """
+
+    __slots__ = ()
@@ -9,3 +9,5 @@ class KnightMove(Move):
     """
     Knight moves
     """
+
+    __slots__ = ()
@@ -14,6 +14,8 @@ class KnightPromotionCapture(PawnMove):
     Knight promotion classes.
     """
 
+    __slots__ = ()
+
     def __repr__(self):
         return (
             f"{self.origin.column.name}{self.origin.row}"
@@ -30,3 +32,11 @@ class KnightPromotionCapture(PawnMove):
         piece_dict[self.destination] = Knight(piece_dict[self.origin].color)
         piece_dict.pop(self.origin)
         return True
+
+    def promoted_piece(self, piece: Piece) -> Piece:
+        """
+        The pawn is replaced by a knight
+        @param piece: the pawn
+        @return:
+        """
+        return Knight(piece.color)
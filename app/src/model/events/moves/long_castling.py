@@ -13,6 +13,8 @@ class LongCastling(Move):
     origin: the king
     """
 
+    __slots__ = ()
+
     def __init__(self, origin: Square):
         """
         No needto give the destination
@@ -34,3 +36,10 @@ class LongCastling(Move):
             Square(Column.A, self.origin.row)
         )
         return False
+
+    def rook_squares(self) -> tuple[Square, Square]:
+        """
+        The rook goes from A to D
+        @return:
+        """
+        return Square(Column.A, self.origin.row), Square(Column.D, self.origin.row)
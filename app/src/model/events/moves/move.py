@@ -3,14 +3,21 @@ Abstract classes for movements
 """
 from abc import ABC
 
+from app.src.model.classes.pieces.piece import Piece
 from app.src.model.classes.square import Square
 
 
 class Move(ABC):
     """
     Abstract classes
+    A move is immutable and hashable: it can be a dict key or a set element
     """
 
+    __slots__ = ("origin", "destination", "_hash")
+    origin: Square
+    destination: Square
+    _hash: int
+
     def __init__(
         self,
         origin: Square,
@@ -21,16 +28,72 @@ class Move(ABC):
         @param origin: origin square
         @param destination: destination square
         """
-        self.origin = origin
-        self.destination = destination
+        object.__setattr__(self, "origin", origin)
+        object.__setattr__(self, "destination", destination)
+        object.__setattr__(
+            self, "_hash", hash((type(self), origin.index, destination.index))
+        )
+
+    @classmethod
+    def from_squares(cls, origin: Square, destination: Square) -> "Move":
+        """
+        Build a move of the class without calling its constructor
+        (the castling constructors only take the origin)
+        @param origin: origin square
+        @param destination: destination square
+        @return: the move
+        """
+        move = cls.__new__(cls)
+        Move.__init__(move, origin, destination)
+        return move
+
+    def captured_square(self) -> Square:
+        """
+        Return the square of the piece captured by the move (if there is one)
+        @return:
+        """
+        return self.destination
+
+    def promoted_piece(self, piece: Piece) -> Piece:
+        """
+        Return the piece that stands on destination once the move is played
+        @param piece: the piece that moves
+        @return:
+        """
+        return piece
+
+    def rook_squares(self) -> tuple[Square, Square] | None:
+        """
+        Return the origin and the destination of the rook for a castling
+        @return: None if the move is not a castling
+        """
+        return None
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Move is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Move is immutable")
 
     def __eq__(self, other):
         return (
-            self.origin == other.origin
+            type(other) == type(self)
+            and self.origin == other.origin
             and self.destination == other.destination
-            and type(other) == type(self)
         )
 
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return type(self).from_squares, (self.origin, self.destination)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def __repr__(self):
         return (
             f"{self.origin.column.name}{self.origin.row}"
@@ -0,0 +1,151 @@
+"""
+Compact move encoding.
+A move is packed in a 16 bits int:
+bits 0-5: destination index, bits 6-11: origin index,
+bits 12-15: flag, the index of the move class in MOVE_CLASSES
+(the class tells the promotion, the castling, the en passant or the double push)
+"""
+from array import array
+from typing import Iterable, Iterator
+
+from app.src.model.classes.square import Square
+from app.src.model.events.moves.bishop_move import BishopMove
+from app.src.model.events.moves.empty_move import EmptyMove
+from app.src.model.events.moves.en_passant import EnPassant
+from app.src.model.events.moves.king_move import KingMove
+from app.src.model.events.moves.knight_move import KnightMove
+from app.src.model.events.moves.knight_promotion import KnightPromotion
+from app.src.model.events.moves.knight_promotion_capture import KnightPromotionCapture
+from app.src.model.events.moves.long_castling import LongCastling
+from app.src.model.events.moves.move import Move
+from app.src.model.events.moves.pawn_2_square_move import Pawn2SquareMove
+from app.src.model.events.moves.pawn_capture import CaptureMove
+from app.src.model.events.moves.pawn_move import PawnMove
+from app.src.model.events.moves.queen_move import QueenMove
+from app.src.model.events.moves.queen_promotion import QueenPromotion
+from app.src.model.events.moves.queen_promotion_capture import QueenPromotionCapture
+from app.src.model.events.moves.rook_move import RookMove
+from app.src.model.events.moves.short_castling import ShortCastling
+
+# The flag of a move is the index of its class (16 classes for 4 bits)
+MOVE_CLASSES = (
+    EmptyMove,
+    PawnMove,
+    Pawn2SquareMove,
+    CaptureMove,
+    EnPassant,
+    QueenPromotion,
+    KnightPromotion,
+    QueenPromotionCapture,
+    KnightPromotionCapture,
+    KnightMove,
+    BishopMove,
+    RookMove,
+    QueenMove,
+    KingMove,
+    ShortCastling,
+    LongCastling,
+)
+MOVE_FLAGS = {move_class: flag for flag, move_class in enumerate(MOVE_CLASSES)}
+
+
+def encode_move(move: Move) -> int:
+    """
+    Pack a move in a 16 bits int
+    Raises a KeyError if the move class has no flag (the abstract Move)
+    @param move:
+    @return: the move code
+    """
+    return (
+        MOVE_FLAGS[type(move)] << 12 | move.origin.index << 6 | move.destination.index
+    )
+
+
+def decode_move(code: int) -> Move:
+    """
+    Build the Move object of a move code
+    @param code: move code
+    @return: the move
+    """
+    return MOVE_CLASSES[code >> 12].from_squares(
+        Square.from_index(code >> 6 & 63), Square.from_index(code & 63)
+    )
+
+
+def move_code_class(code: int) -> type:
+    """
+    Return the class of the move of a code, without building the move
+    @param code: move code
+    @return: a Move subclass
+    """
+    return MOVE_CLASSES[code >> 12]
+
+
+class MoveArray:
+    """
+    List of moves stored as 16 bits codes in an array('H')
+    The moves are encoded when added, and decoded when read,
+    so the list can be used as a list of Move.
+    The last move is also kept decoded: it is the one read after each move
+    codes: the array of the move codes (to modify with the methods of the list)
+    """
+
+    def __init__(self, moves: Iterable[Move] = ()):
+        """
+        Constructor
+        @param moves: initial moves
+        """
+        moves = list(moves)
+        self.codes = array("H", map(encode_move, moves))
+        self.__last_move: Move | None = moves[-1] if moves else None
+
+    def append(self, move: Move) -> None:
+        """
+        Add a move at the end of the list
+        @param move:
+        @return:
+        """
+        self.codes.append(encode_move(move))
+        self.__last_move = move
+
+    def extend(self, moves: Iterable[Move]) -> None:
+        """
+        Add moves at the end of the list
+        @param moves:
+        @return:
+        """
+        moves = list(moves)
+        self.codes.extend(map(encode_move, moves))
+        if moves:
+            self.__last_move = moves[-1]
+
+    def pop(self, index: int = -1) -> Move:
+        """
+        Remove and return a move (the last one by default)
+        @param index:
+        @return:
+        """
+        move = decode_move(self.codes.pop(index))
+        self.__last_move = decode_move(self.codes[-1]) if self.codes else None
+        return move
+
+    def __getitem__(self, index: int) -> Move:
+        if index in (-1, len(self.codes) - 1):
+            if not self.codes:
+                raise IndexError("MoveArray index out of range")
+            return self.__last_move
+        return decode_move(self.codes[index])
+
+    def __setitem__(self, index: int, move: Move) -> None:
+        self.codes[index] = encode_move(move)
+        if index in (-1, len(self.codes) - 1):
+            self.__last_move = move
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __iter__(self) -> Iterator[Move]:
+        return map(decode_move, self.codes)
+
+    def __repr__(self):
+        return f"MoveArray({list(self)})"
@@ -8,3 +8,5 @@ class Pawn2SquareMove(PawnMove):
     """
     Class for Pawn 2 square moves
     """
+
+    __slots__ = ()
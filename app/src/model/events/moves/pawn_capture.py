@@ -8,3 +8,5 @@ class CaptureMove(PawnMove):
     """
     Capture
     """
+
+    __slots__ = ()
@@ -8,3 +8,5 @@ class PawnMove(Move):
     """
     Pawn moves (one square, no capture)
     """
+
+    __slots__ = ()
@@ -8,3 +8,5 @@ class QueenMove(Move):
     """
     Queen moves
     """
+
+    __slots__ = ()
@@ -14,6 +14,8 @@ class QueenPromotion(PawnMove):
     Queen promotion classes.
     """
 
+    __slots__ = ()
+
     def __repr__(self):
         return (
             f"{self.origin.column.name}{self.origin.row}"
@@ -30,3 +32,11 @@ class QueenPromotion(PawnMove):
         piece_dict[self.destination] = Queen(piece_dict[self.origin].color)
         piece_dict.pop(self.origin)
         return False
+
+    def promoted_piece(self, piece: Piece) -> Piece:
+        """
+        The pawn is replaced by a queen
+        @param piece: the pawn
+        @return:
+        """
+        return Queen(piece.color)
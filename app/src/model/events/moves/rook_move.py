@@ -8,3 +8,5 @@ class RookMove(Move):
     """
     Rook moves
     """
+
+    __slots__ = ()
@@ -13,6 +13,8 @@ class ShortCastling(Move):
     origin: the king
     """
 
+    __slots__ = ()
+
     def __init__(self, origin: Square):
         """
         No need to give the destination
@@ -33,3 +35,10 @@ class ShortCastling(Move):
             Square(Column.H, self.origin.row)
         )
         return False
+
+    def rook_squares(self) -> tuple[Square, Square]:
+        """
+        The rook goes from H to F
+        @return:
+        """
+        return Square(Column.H, self.origin.row), Square(Column.F, self.origin.row)
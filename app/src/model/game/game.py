@@ -2,23 +2,36 @@
 Game implementation.
 Manage the game and store the current state
 """
+from typing import Iterator
 
+from app.src.exceptions.fen_error import FenError
 from app.src.exceptions.invalid_move_error import InvalidMoveError
 from app.src.logger import LOGGER
+from app.src.model.classes.const.castling_rights import CASTLING_RIGHTS
 from app.src.model.classes.const.color import Color
 from app.src.model.classes.pieces.king import King
 from app.src.model.classes.pieces.piece import Piece
 from app.src.model.classes.square import Square
 from app.src.model.events.event_processor.move_processor import (
     apply_move,
+    is_move_legal,
     is_square_in_check,
     square_available_moves_no_castling,
 )
+from app.src.model.events.event_processor.legality_checker import LegalityChecker
+from app.src.model.events.moves.long_castling import LongCastling
 from app.src.model.events.moves.move import Move
+from app.src.model.events.moves.short_castling import ShortCastling
 from app.src.model.states.board import Board
-from app.src.model.states.castling_state import CastlingState
+from app.src.model.states.castling_state import CastlingState, castling_moves
 from app.src.model.states.game_historic import GameHistoric
 from app.src.model.states.game_state import GameState
+from app.src.model.states.legal_move_cache import (
+    SHARED_LEGAL_MOVE_CACHE,
+    LegalMoveCache,
+)
+from app.src.model.states.legal_move_index import LegalMoveIndex
+from app.src.model.states.position import Position, game_castling_rights
 
 
 class Game:
@@ -27,9 +40,11 @@ class Game:
     Also contains the history of the game
     """
 
-    def __init__(self):
+    def __init__(self, legal_move_cache: LegalMoveCache | None = None):
         """
         Build a board instance
+        @param legal_move_cache: cache of the legal moves of the visited positions
+        (default: the cache shared by the games)
         """
         LOGGER.info("Build a game instance")
         self.board = Board()
@@ -37,6 +52,29 @@ class Game:
         self.game_state = GameState()
         self.white_castling_state = CastlingState(Color.WHITE)
         self.black_castling_state = CastlingState(Color.BLACK)
+        # Legal moves of the visited positions
+        self.legal_move_cache = (
+            SHARED_LEGAL_MOVE_CACHE if legal_move_cache is None else legal_move_cache
+        )
+
+    def __getstate__(self) -> dict:
+        """
+        State for pickle (the shared cache is not stored with the game)
+        @return:
+        """
+        state = self.__dict__.copy()
+        if self.legal_move_cache is SHARED_LEGAL_MOVE_CACHE:
+            state["legal_move_cache"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore the game, with the shared cache if it used it
+        @param state:
+        """
+        self.__dict__.update(state)
+        if self.legal_move_cache is None:
+            self.legal_move_cache = SHARED_LEGAL_MOVE_CACHE
 
     @property
     def piece_dict(self) -> dict[Square, Piece]:
@@ -54,22 +92,168 @@ class Game:
         """
         return self.game_state.player
 
+    @staticmethod
+    def from_fen(fen: str, legal_move_cache: LegalMoveCache | None = None) -> "Game":
+        """
+        Build a game from a FEN string (pieces, player, castling, en passant
+        and clocks). Raises a FenError if the string can't be parsed
+        @param fen: e.g. "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1"
+        @param legal_move_cache: cache of the legal moves of the visited positions
+        (default: the cache shared by the games)
+        @return:
+        """
+        position = Position.from_fen(fen)
+        fields = fen.split()
+        fullmove_number = fields[5] if len(fields) == 6 else "1"
+        if (
+            not (fullmove_number.isascii() and fullmove_number.isdigit())
+            or int(fullmove_number) == 0
+        ):
+            raise FenError(fen, f"invalid fullmove number {fullmove_number!r}")
+        game = Game(legal_move_cache)
+        game.board = position.to_board()
+        game.game_state.player = position.player
+        game.game_state.fifty_counter = position.halfmove_clock
+        game.game_state.fullmove_number = int(fullmove_number)
+        for castling_state in (game.white_castling_state, game.black_castling_state):
+            long_right, short_right = CASTLING_RIGHTS[castling_state.color]
+            castling_state.set_castling_flags(
+                bool(position.castling_rights & long_right),
+                bool(position.castling_rights & short_right),
+            )
+        # The state of the loaded position: draw rules, checkmate and stalemate
+        game.game_state.loaded_position_rules(game.board)
+        game.no_legal_move_rule()
+        return game
+
+    def to_fen(self) -> str:
+        """
+        Return the FEN string of the game
+        (the en passant square is given only if a pawn can take en passant)
+        @return:
+        """
+        return self.position().to_fen(self.game_state.fullmove_number)
+
+    def position(self) -> Position:
+        """
+        Return an immutable snapshot of the current position
+        (pieces, player, castling rights, en passant square, halfmove clock)
+        @return:
+        """
+        return Position.from_game(self)
+
     def available_moves_list(self) -> [Move]:
         """
         Return the list of the available moves for the player that plays.
         @return: List of Moves
         """
         LOGGER.info("Call of available_moves")
-        available_moves = []
-        for square, piece in self.piece_dict.items():
-            if piece.color == self.player:
-                available_moves.extend(
-                    self.square_available_moves(
-                        square,
-                        legal_verification=True,
-                    )
-                )
-        return available_moves
+        return list(self.legal_move_index())
+
+    def legal_moves_from(self, origin: Square) -> [Move]:
+        """
+        Return the legal moves from origin, for the player that plays
+        @param origin:
+        @return: list of moves
+        """
+        return self.legal_move_index().from_square(origin)
+
+    def legal_move_map(self) -> dict[Square, list[Square]]:
+        """
+        Return the legal destinations of each piece of the player that plays
+        (for the UI: computed once per position, then read from the cache)
+        @return: {origin square: destination squares}
+        """
+        return self.legal_move_index().destination_map()
+
+    def destination_mask(self, origin: Square) -> int:
+        """
+        Return the legal destinations from origin as a bitboard
+        (bit i for the square of index i, A1 = 0, H8 = 63)
+        @param origin:
+        @return: 0 if there is no legal move from origin
+        """
+        return self.legal_move_index().destination_masks.get(origin, 0)
+
+    def legal_move_index(self) -> LegalMoveIndex:
+        """
+        Return the legal moves of the current position, indexed.
+        They are generated once per position, and kept in the LRU cache
+        @return:
+        """
+        position_key = self._position_key()
+        legal_moves = self.legal_move_cache.get(position_key)
+        if legal_moves is None:
+            legal_moves = LegalMoveIndex(self.iter_legal_moves())
+            self.legal_move_cache.put(position_key, legal_moves)
+        return legal_moves
+
+    def is_legal(self, move: Move) -> bool:
+        """
+        Return if move is legal for the player that plays.
+        Only the moves of the piece in move.origin are generated,
+        and the king safety is checked for this move only
+        (the legal moves of the position are used if they are already generated)
+        @param move:
+        @return:
+        """
+        legal_moves = self.legal_move_cache.peek(self._position_key())
+        if legal_moves is not None:
+            return move in legal_moves
+        piece = self.piece_dict.get(move.origin)
+        if piece is None or piece.color != self.player:
+            return False
+        # The castling verification already checks the attacked squares
+        if isinstance(move, (LongCastling, ShortCastling)):
+            return type(piece) == King and move in self._castling_moves()
+        return move in square_available_moves_no_castling(
+            move.origin, self.board
+        ) and is_move_legal(move, self.board)
+
+    def _position_key(self) -> tuple:
+        """
+        Return a key of everything the legal moves depend on:
+        the pieces, the player, the castling rights and the en passant square
+        (the same position reached by different moves has the same key)
+        @return:
+        """
+        return (
+            self.board.zobrist_key,
+            self.player,
+            game_castling_rights(self),
+            self.board.en_passant_square,
+        )
+
+    def iter_legal_moves(self) -> Iterator[Move]:
+        """
+        Iterate on the legal moves of the player that plays.
+        The moves of a piece are generated only when the iteration reaches it,
+        so the iteration can be stopped early.
+        The game must not be modified during the iteration
+        @return: iterator of Moves
+        """
+        legal_moves = self.legal_move_cache.peek(self._position_key())
+        if legal_moves is not None:
+            yield from legal_moves
+            return
+        # Checks and pins are computed once for all the pieces
+        legality_checker = LegalityChecker(self.player, self.board)
+        # The squares are read from the bitboard: the en passant verification plays
+        # and undoes the moves on the board, which reorders piece_dict
+        for square in self.board.piece_squares(self.player):
+            yield from self.square_available_moves(
+                square,
+                legal_verification=True,
+                legality_checker=legality_checker,
+            )
+
+    def has_legal_move(self) -> bool:
+        """
+        Return if the player that plays has at least one legal move
+        (stops at the first legal move found)
+        @return:
+        """
+        return next(self.iter_legal_moves(), None) is not None
 
     def apply_move(self, move: Move):
         """
@@ -82,7 +266,7 @@ class Game:
         @return:
         """
         LOGGER.info("Call of apply_move")
-        if move not in self.available_moves_list():
+        if not self.is_legal(move):
             LOGGER.error("Invalid moves")
             raise InvalidMoveError(move)
         # Play the moves
@@ -91,16 +275,23 @@ class Game:
         self.game_historic.update_historic(move, self.board)
         # Update the game state
         self.update_castling_state()
-        self.game_state.update_state(self.game_historic, capture)
-        # Draw with no moves
-        king_square = self.board.get_king(self.game_state.player)
-        if (
-            not is_square_in_check(
-                self.game_state.player, king_square, self.board, self.game_historic
-            )
-            and not self.available_moves_list()
-        ):
-            self.game_state.state = GameState.DRAW
+        self.game_state.update_state(self.game_historic, capture, self.board)
+        self.no_legal_move_rule()
+
+    def no_legal_move_rule(self):
+        """
+        Update the state if the player that plays has no legal move:
+        checkmate, or draw (stalemate)
+        @return:
+        """
+        if not self.has_legal_move():
+            king_square = self.board.get_king(self.player)
+            if not is_square_in_check(self.player, king_square, self.board):
+                self.game_state.state = GameState.DRAW
+            elif self.player == Color.WHITE:
+                self.game_state.state = GameState.BLACK_WIN
+            else:
+                self.game_state.state = GameState.WHITE_WIN
 
     def update_castling_state(self):
         """
@@ -118,27 +309,50 @@ class Game:
                 self.game_historic.move_historic[-1]
             )
 
-    def square_available_moves(self, origin, legal_verification=False) -> [Move]:
+    def square_available_moves(
+        self,
+        origin,
+        legal_verification=False,
+        legality_checker: LegalityChecker = None,
+    ) -> [Move]:
         """
         Return a list with all the available moves from origin
         @param legal_verification:
+        @param legality_checker: checks and pins of the position (optional)
         @param origin:
         @return:
         """
+        # The legal moves of the player that plays come from the cache
+        if (
+            legal_verification
+            and legality_checker is None
+            and self.piece_dict[origin].color == self.player
+        ):
+            return self.legal_moves_from(origin)
+        # The en passant square is kept by the board (also for a loaded position)
         available_moves = square_available_moves_no_castling(
-            origin, self.board, self.game_historic, legal_verification
+            origin,
+            self.board,
+            legal_verification=legal_verification,
+            legality_checker=legality_checker,
         )
-        if type(self.piece_dict[origin]) == King:
-            if self.player == Color.WHITE:
-                available_moves.extend(
-                    self.white_castling_state.available_castling(
-                        self.board, self.game_historic
-                    )
-                )
-            else:
-                available_moves.extend(
-                    self.black_castling_state.available_castling(
-                        self.board, self.game_historic
-                    )
-                )
+        piece = self.piece_dict[origin]
+        if type(piece) == King and piece.color == self.player:
+            available_moves.extend(self._castling_moves())
         return available_moves
+
+    def _castling_moves(self) -> [LongCastling, ShortCastling]:
+        """
+        Return the castling moves of the player that plays.
+        The castling rights are the ones of the position key (and of the position
+        snapshot): the rights of the board, restricted by the castling flags
+        @return:
+        """
+        castling_rights = game_castling_rights(self)
+        long_right, short_right = CASTLING_RIGHTS[self.player]
+        return castling_moves(
+            self.player,
+            self.board,
+            bool(castling_rights & long_right),
+            bool(castling_rights & short_right),
+        )
@@ -0,0 +1,224 @@
+"""
+Perft: count the leaf nodes of the tree of the legal moves, to a fixed depth.
+The counts of the reference positions are known: perft checks the move generation,
+and measures its speed.
+The moves are played and undone on one board, without historic.
+The count can be split between processes: a Position is sent to each of them.
+The counts of the positions met again (transpositions) can be read in a PerftTable
+"""
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from typing import Iterator
+
+from app.src.model.events.event_processor.move_counter import count_legal_moves
+from app.src.model.events.moves.move import Move
+from app.src.model.game.game import Game
+from app.src.model.game.perft_table import PerftTable
+from app.src.model.states.board import Board
+from app.src.model.states.position import Position, board_legal_moves
+
+# (name, FEN, {depth: number of leaf nodes})
+# The rook and bishop promotions are not generated (a queen is always better
+# than a rook or a bishop), so only the depths without these promotions
+# in the tree are listed
+REFERENCE_POSITIONS = (
+    (
+        "start",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        {1: 20, 2: 400, 3: 8902, 4: 197281, 5: 4865609},
+    ),
+    (
+        "kiwipete",
+        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+        {1: 48, 2: 2039, 3: 97862},
+    ),
+    (
+        "position3",
+        "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+        {1: 14, 2: 191, 3: 2812, 4: 43238, 5: 674624},
+    ),
+    (
+        "position4",
+        "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+        {1: 6},
+    ),
+    (
+        "position6",
+        "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+        {1: 46, 2: 2079, 3: 89890},
+    ),
+)
+
+
+def perft(
+    game_or_position: Game | Position,
+    depth: int,
+    workers: int = 1,
+    table: PerftTable | None = None,
+) -> int:
+    """
+    Return the number of leaf nodes of the tree of the legal moves
+    @param game_or_position: the root of the tree
+    @param depth: number of plies
+    @param workers: number of processes (the root moves are split between them)
+    @param table: table of the counts of the positions already met (optional)
+    @return:
+    """
+    if depth == 0:
+        return 1
+    if workers > 1:
+        return sum(perft_divide(game_or_position, depth, workers, table=table).values())
+    return _perft(_root_board(game_or_position), depth, table)
+
+
+def perft_divide(
+    game_or_position: Game | Position,
+    depth: int,
+    workers: int = 1,
+    split_depth: int = 1,
+    table: PerftTable | None = None,
+) -> dict[Move, int]:
+    """
+    Return the number of leaf nodes after each legal move of the root
+    (to find the move where a wrong count comes from)
+    With several workers, the positions at split_depth (the root moves by default)
+    are counted in a pool of processes, and the counts merged by root move
+    @param game_or_position: the root of the tree
+    @param depth: number of plies, the root moves included (at least 1)
+    @param workers: number of processes (1: no pool)
+    @param split_depth: depth of the positions sent to the processes
+    (more tasks than root moves, to balance the processes)
+    @param table: table of the counts of the positions already met (optional).
+    With several workers, each process uses its own table of the same size
+    (table is only read for its size and policy)
+    @return: {root move: number of leaf nodes}
+    """
+    board = _root_board(game_or_position)
+    if workers > 1 and depth > 1:
+        return _parallel_divide(
+            board,
+            depth,
+            workers,
+            min(split_depth, depth - 1),
+            None if table is None else (table.memory_mb, table.replacement),
+        )
+    divide = {}
+    for move in board_legal_moves(board):
+        undo = board.make_move(move)
+        divide[move] = _perft(board, depth - 1, table) if depth > 1 else 1
+        board.unmake_move(undo)
+    return divide
+
+
+def _parallel_divide(
+    board: Board,
+    depth: int,
+    workers: int,
+    split_depth: int,
+    table_config: tuple[float, str] | None = None,
+) -> dict[Move, int]:
+    """
+    Count the leaf nodes of each root move in a pool of processes
+    @param board: board of the root position
+    @param depth: number of plies (at least 2)
+    @param workers: number of processes
+    @param split_depth: depth of the positions sent to the processes
+    (between 1 and depth - 1)
+    @param table_config: (memory in MB, replacement policy) of the table
+    of each process (None: no table)
+    @return: {root move: number of leaf nodes}
+    """
+    divide = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for move in board_legal_moves(board):
+            undo = board.make_move(move)
+            futures[move] = [
+                executor.submit(
+                    _perft_task, position, depth - split_depth, table_config
+                )
+                for position in _frontier(board, split_depth - 1)
+            ]
+            board.unmake_move(undo)
+        for move, move_futures in futures.items():
+            divide[move] = sum(future.result() for future in move_futures)
+    return divide
+
+
+def _perft_task(
+    position: Position, depth: int, table_config: tuple[float, str] | None
+) -> int:
+    """
+    Count the leaf nodes under a position, in a process of the pool
+    @param position:
+    @param depth: at least 1
+    @param table_config: (memory in MB, replacement policy) of the table
+    of the process (None: no table)
+    @return:
+    """
+    table = None if table_config is None else _process_table(*table_config)
+    return _perft(position.to_board(), depth, table)
+
+
+@cache
+def _process_table(memory_mb: float, replacement: str) -> PerftTable:
+    """
+    Return the table of the current process
+    (built at the first task, and kept for the next tasks)
+    @param memory_mb:
+    @param replacement:
+    @return:
+    """
+    return PerftTable(memory_mb, replacement)
+
+
+def _frontier(board: Board, depth: int) -> Iterator[Position]:
+    """
+    Iterate on the positions at depth plies under the position of board
+    @param board: modified during the iteration, and restored
+    @param depth:
+    @return: iterator of positions
+    """
+    if depth == 0:
+        yield Position.from_board(board)
+        return
+    for move in board_legal_moves(board):
+        undo = board.make_move(move)
+        yield from _frontier(board, depth - 1)
+        board.unmake_move(undo)
+
+
+def _root_board(game_or_position: Game | Position) -> Board:
+    """
+    Return a board of the root position, that perft can modify
+    @param game_or_position:
+    @return:
+    """
+    if isinstance(game_or_position, Game):
+        game_or_position = game_or_position.position()
+    return game_or_position.to_board()
+
+
+def _perft(board: Board, depth: int, table: PerftTable | None = None) -> int:
+    """
+    Count the leaf nodes under the position of board (depth >= 1)
+    @param board: modified during the count, and restored
+    @param depth:
+    @param table: table of the counts of the positions already met (optional)
+    @return:
+    """
+    # The leaves are counted without building the last moves
+    if depth == 1:
+        return count_legal_moves(board)
+    if table is not None:
+        nodes = table.probe(board.zobrist_key, depth)
+        if nodes is not None:
+            return nodes
+    nodes = 0
+    for move in board_legal_moves(board):
+        undo = board.make_move(move)
+        nodes += _perft(board, depth - 1, table)
+        board.unmake_move(undo)
+    if table is not None:
+        table.store(board.zobrist_key, depth, nodes)
+    return nodes
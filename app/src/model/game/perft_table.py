@@ -0,0 +1,100 @@
+"""
+Transposition table of perft: number of leaf nodes under a position,
+keyed by the zobrist key of the position and the remaining depth.
+Fixed size (a memory budget in MB), stored in flat arrays
+"""
+from array import array
+from typing import NamedTuple
+
+# Bytes per entry: key (8), depth (1), number of nodes (8)
+ENTRY_SIZE = 17
+# Replacement policies, when two positions have the same slot:
+# "depth" keeps the deepest count (the most expensive to compute again),
+# "always" keeps the last count
+REPLACEMENT_POLICIES = ("depth", "always")
+
+
+class TableInfo(NamedTuple):
+    """
+    Statistics of a PerftTable
+    """
+
+    probes: int
+    hits: int
+    stores: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Ratio of the probes that found the count
+        @return: between 0 and 1
+        """
+        return self.hits / self.probes if self.probes else 0.0
+
+
+class PerftTable:  # pylint: disable=R0902
+    """
+    Fixed-size table {(zobrist key, depth): number of leaf nodes}
+    One entry per slot, the slot is given by the low bits of the key
+    probes, hits, stores: counters
+    """
+
+    def __init__(self, memory_mb: float = 16, replacement: str = "depth"):
+        """
+        Constructor
+        @param memory_mb: memory budget of the table, in MB
+        @param replacement: replacement policy ("depth" or "always")
+        """
+        if replacement not in REPLACEMENT_POLICIES:
+            raise ValueError(f"Unknown replacement policy {replacement!r}")
+        # Power of 2 number of slots, in the memory budget
+        entries = max(1, int(memory_mb * 2**20) // ENTRY_SIZE)
+        size = 1 << entries.bit_length() - 1
+        self.memory_mb = memory_mb
+        self.replacement = replacement
+        self.mask = size - 1
+        self.keys = array("Q", bytes(8 * size))
+        # depth 0: empty slot (the positions are stored from depth 2)
+        self.depths = array("B", bytes(size))
+        self.nodes = array("Q", bytes(8 * size))
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def probe(self, key: int, depth: int) -> int | None:
+        """
+        Return the number of leaf nodes under a position
+        @param key: zobrist key of the position
+        @param depth: remaining depth
+        @return: None if the count is not in the table
+        """
+        self.probes += 1
+        slot = key & self.mask
+        if self.keys[slot] != key or self.depths[slot] != depth:
+            return None
+        self.hits += 1
+        return self.nodes[slot]
+
+    def store(self, key: int, depth: int, nodes: int) -> None:
+        """
+        Store the number of leaf nodes under a position,
+        if the replacement policy allows it
+        @param key: zobrist key of the position
+        @param depth: remaining depth (between 1 and 255)
+        @param nodes:
+        """
+        slot = key & self.mask
+        if self.replacement == "depth" and depth < self.depths[slot]:
+            return
+        self.keys[slot] = key
+        self.depths[slot] = depth
+        self.nodes[slot] = nodes
+        self.stores += 1
+
+    def info(self) -> TableInfo:
+        """
+        Return the statistics of the table
+        @return:
+        """
+        return TableInfo(self.probes, self.hits, self.stores, self.mask + 1)
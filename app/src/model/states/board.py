@@ -1,42 +1,348 @@
 """
 Contains the game state (the pieces, and the associated methods)
 """
-from itertools import product
+import copy
+from types import MappingProxyType
+from typing import Iterator, Mapping
 
 from app.src.exceptions.missing_king_error import MissingKingError
 from app.src.logger import LOGGER
+from app.src.model.classes.bitboard import PIECE_TYPES, bitboard_squares
+from app.src.model.classes.const.castling_rights import (
+    BLACK_LONG_CASTLING,
+    BLACK_SHORT_CASTLING,
+    CASTLING_RIGHTS_LOST,
+    WHITE_LONG_CASTLING,
+    WHITE_SHORT_CASTLING,
+)
 from app.src.model.classes.const.color import Color
 from app.src.model.classes.const.column import Column
 from app.src.model.classes.pieces.bishop import Bishop
 from app.src.model.classes.pieces.king import King
 from app.src.model.classes.pieces.knight import Knight
 from app.src.model.classes.pieces.pawn import Pawn
+from app.src.model.classes.pieces.piece import Piece
 from app.src.model.classes.pieces.queen import Queen
 from app.src.model.classes.pieces.rook import Rook
 from app.src.model.classes.square import Square
+from app.src.model.events.moves.move import Move
+from app.src.model.states.material import BISHOPS_KEY, MATERIAL_UNITS
+from app.src.model.states.move_undo import MoveUndo
+from app.src.model.states.zobrist import (
+    BLACK_TO_MOVE_KEY,
+    CASTLING_KEYS,
+    EN_PASSANT_KEYS,
+    PIECE_KEYS,
+)
 
 
-class Board:
+class Board:  # pylint: disable=R0902
     """
     Contains the pieces, and the associated methods
+    The pieces are stored in bitboards (one per piece type and color, and one
+    occupancy bitboard per color), and mirrored in a dict (square -> piece),
+    exposed as a read-only view with piece_dict
+    The square of each king is cached in king_squares (None if there is no king)
+    and the number of pieces of each type in material_key (see material)
+    The board also keeps the side to move, the castling rights, the en passant
+    square (only if a pawn can take en passant), and the zobrist key of the
+    position, all updated by make_move
     """
 
     def __init__(self):
         """
         Constructor
         """
+        self.player = Color.WHITE
         self.piece_dict = Board.initial_config()
 
+    @property
+    def piece_dict(self) -> Mapping[Square, Piece]:
+        """
+        Read-only view of the pieces in the game
+        The pieces must be modified with put_piece, remove_piece and move_piece
+        @return: {square: piece} mapping
+        """
+        return self._piece_view
+
+    @piece_dict.setter
+    def piece_dict(self, piece_dict: dict[Square, Piece]) -> None:
+        """
+        Load the pieces of piece_dict in the board, and build the bitboards.
+        The board takes ownership of piece_dict: it is updated with the board,
+        and must not be modified directly afterwards
+        The castling rights are deduced from the kings and rooks on their initial
+        squares, and the zobrist key is computed from scratch
+        @param piece_dict: {square: piece} dict
+        """
+        self._piece_dict = piece_dict
+        self._piece_view = MappingProxyType(piece_dict)
+        self.bitboards = {color: dict.fromkeys(PIECE_TYPES, 0) for color in Color}
+        self.occupancy = dict.fromkeys(Color, 0)
+        self.king_squares: dict[Color, Square | None] = dict.fromkeys(Color)
+        self.material_key = 0
+        self.zobrist_key = 0
+        for square, piece in piece_dict.items():
+            self._toggle_bit(square, piece)
+        self.castling_rights = self._initial_castling_rights()
+        self.en_passant_square = None
+        self.zobrist_key ^= CASTLING_KEYS[self.castling_rights]
+        if self.player == Color.BLACK:
+            self.zobrist_key ^= BLACK_TO_MOVE_KEY
+
+    def set_position_state(
+        self, castling_rights: int, en_passant_square: Square | None
+    ) -> None:
+        """
+        Set the castling rights and the en passant square of a loaded position
+        (instead of the ones deduced from the pieces), and update the zobrist key
+        @param castling_rights: castling rights mask
+        @param en_passant_square: square behind a pawn that has just moved
+        of 2 squares, if an opponent pawn can take it (else None)
+        """
+        self.zobrist_key ^= (
+            CASTLING_KEYS[self.castling_rights] ^ CASTLING_KEYS[castling_rights]
+        )
+        self.castling_rights = castling_rights
+        if self.en_passant_square is not None:
+            self.zobrist_key ^= EN_PASSANT_KEYS[self.en_passant_square.column.value - 1]
+        self.en_passant_square = en_passant_square
+        if en_passant_square is not None:
+            self.zobrist_key ^= EN_PASSANT_KEYS[en_passant_square.column.value - 1]
+
+    def _initial_castling_rights(self) -> int:
+        """
+        Castling rights of a loaded position: a castling is allowed
+        if the king and the rook are on their initial squares
+        @return: castling rights mask
+        """
+        castling_rights = 0
+        for color, row, short_castling, long_castling in (
+            (Color.WHITE, 1, WHITE_SHORT_CASTLING, WHITE_LONG_CASTLING),
+            (Color.BLACK, 8, BLACK_SHORT_CASTLING, BLACK_LONG_CASTLING),
+        ):
+            if self._piece_dict.get(Square(Column.E, row)) != King(color):
+                continue
+            if self._piece_dict.get(Square(Column.H, row)) == Rook(color):
+                castling_rights |= short_castling
+            if self._piece_dict.get(Square(Column.A, row)) == Rook(color):
+                castling_rights |= long_castling
+        return castling_rights
+
+    @property
+    def all_occupancy(self) -> int:
+        """
+        Bitboard of the occupied squares (both colors)
+        @return:
+        """
+        return self.occupancy[Color.WHITE] | self.occupancy[Color.BLACK]
+
+    def _toggle_bit(self, square: Square, piece: Piece) -> None:
+        """
+        Toggle the bit of square in the bitboards of piece
+        (pieces without a specific type, only used in tests, are only in the occupancy)
+        @param square:
+        @param piece:
+        """
+        bit = 1 << square.index
+        self.occupancy[piece.color] ^= bit
+        if type(piece) in PIECE_TYPES:
+            self.bitboards[piece.color][type(piece)] ^= bit
+            self.zobrist_key ^= PIECE_KEYS[piece.color][type(piece)][square.index]
+            if self.bitboards[piece.color][type(piece)] & bit:
+                self.material_key += MATERIAL_UNITS[piece.color][type(piece)]
+            else:
+                self.material_key -= MATERIAL_UNITS[piece.color][type(piece)]
+            if type(piece) == King:
+                kings = self.bitboards[piece.color][King]
+                self.king_squares[piece.color] = (
+                    Square.from_index((kings & -kings).bit_length() - 1)
+                    if kings
+                    else None
+                )
+
+    def piece_squares(
+        self, color: Color, piece_type: type[Piece] | None = None
+    ) -> Iterator[Square]:
+        """
+        Iterate on the squares of the pieces of color *color* (A1 first, H8 last),
+        read from the bitboards: only the requested pieces are visited
+        @param color:
+        @param piece_type: type of the pieces (default: all the pieces of color)
+        @return: iterator of squares
+        """
+        if piece_type is None:
+            return bitboard_squares(self.occupancy[color])
+        return bitboard_squares(self.bitboards[color][piece_type])
+
+    def piece_count(self, color: Color, piece_type: type[Piece]) -> int:
+        """
+        Return the number of pieces of a type and a color
+        @param color:
+        @param piece_type:
+        @return:
+        """
+        return self.bitboards[color][piece_type].bit_count()
+
+    def put_piece(self, square: Square, piece: Piece) -> None:
+        """
+        Put piece on square (the square must be empty)
+        @param square:
+        @param piece:
+        """
+        self._piece_dict[square] = piece
+        self._toggle_bit(square, piece)
+
+    def remove_piece(self, square: Square) -> Piece:
+        """
+        Remove the piece on square
+        Raises a KeyError if the square is empty
+        @param square:
+        @return: the removed piece
+        """
+        piece = self._piece_dict.pop(square)
+        self._toggle_bit(square, piece)
+        return piece
+
+    def move_piece(self, origin: Square, destination: Square) -> Piece | None:
+        """
+        Move the piece in origin to destination, and remove the piece in destination
+        if there is one. (Does no verification)
+        @param origin:
+        @param destination:
+        @return: the captured piece (None if there is no capture)
+        """
+        captured = (
+            self.remove_piece(destination) if destination in self._piece_dict else None
+        )
+        self.put_piece(destination, self.remove_piece(origin))
+        return captured
+
+    def make_move(self, move: Move) -> MoveUndo:
+        """
+        Apply a move in place (captures, en passant, promotions and castling),
+        update the castling rights, the en passant square, the side to move,
+        and the zobrist key incrementally.
+        Does no legal verification
+        @param move:
+        @return: the information to give to unmake_move to undo the move
+        """
+        undo = MoveUndo(move, self)
+        if undo.captured is not None:
+            self.remove_piece(undo.captured_square)
+        piece = self.remove_piece(move.origin)
+        self.put_piece(move.destination, move.promoted_piece(piece))
+        rook_squares = move.rook_squares()
+        if rook_squares is not None:
+            self.put_piece(rook_squares[1], self.remove_piece(rook_squares[0]))
+        self._update_en_passant_square(move, piece)
+        castling_rights = self.castling_rights & ~(
+            CASTLING_RIGHTS_LOST.get(move.origin.index, 0)
+            | CASTLING_RIGHTS_LOST.get(move.destination.index, 0)
+        )
+        self.zobrist_key ^= (
+            CASTLING_KEYS[self.castling_rights]
+            ^ CASTLING_KEYS[castling_rights]
+            ^ BLACK_TO_MOVE_KEY
+        )
+        self.castling_rights = castling_rights
+        self.player = Color.BLACK if self.player == Color.WHITE else Color.WHITE
+        return undo
+
+    def _update_en_passant_square(self, move: Move, piece: Piece) -> None:
+        """
+        Update the en passant square after a move
+        It is set after a 2 squares pawn move, only if an opponent pawn
+        is next to the destination (so that the key changes only if en passant
+        is possible)
+        @param move: the played move
+        @param piece: the piece that moved
+        """
+        if self.en_passant_square is not None:
+            self.zobrist_key ^= EN_PASSANT_KEYS[self.en_passant_square.column.value - 1]
+            self.en_passant_square = None
+        if type(piece) != Pawn or abs(move.destination.row - move.origin.row) != 2:
+            return
+        index = move.destination.index
+        neighbours = (1 << index - 1 if index % 8 else 0) | (
+            1 << index + 1 if index % 8 != 7 else 0
+        )
+        opponent = Color.BLACK if piece.color == Color.WHITE else Color.WHITE
+        if self.bitboards[opponent][Pawn] & neighbours:
+            self.en_passant_square = Square(
+                move.origin.column, (move.origin.row + move.destination.row) // 2
+            )
+            self.zobrist_key ^= EN_PASSANT_KEYS[self.en_passant_square.column.value - 1]
+
+    def unmake_move(self, undo: MoveUndo) -> None:
+        """
+        Undo a move applied with make_move
+        (the moves must be undone in the reverse order)
+        @param undo: returned by make_move
+        """
+        move = undo.move
+        rook_squares = move.rook_squares()
+        if rook_squares is not None:
+            self.put_piece(rook_squares[0], self.remove_piece(rook_squares[1]))
+        self.remove_piece(move.destination)
+        self.put_piece(move.origin, undo.piece)
+        if undo.captured is not None:
+            self.put_piece(undo.captured_square, undo.captured)
+        self.castling_rights = undo.castling_rights
+        self.en_passant_square = undo.en_passant_square
+        self.zobrist_key = undo.zobrist_key
+        self.player = Color.BLACK if self.player == Color.WHITE else Color.WHITE
+
+    def __deepcopy__(self, memo):
+        """
+        Deep copy (the read-only view can't be copied, so the board is rebuilt)
+        @param memo:
+        @return: copy of the board
+        """
+        board = Board.__new__(Board)
+        board.player = self.player
+        board.piece_dict = copy.deepcopy(self._piece_dict, memo)
+        board.castling_rights = self.castling_rights
+        board.en_passant_square = self.en_passant_square
+        board.zobrist_key = self.zobrist_key
+        return board
+
+    def __getstate__(self) -> dict:
+        """
+        State for pickle (the read-only view can't be pickled:
+        only the pieces and the position state are stored)
+        @return:
+        """
+        return {
+            "piece_dict": self._piece_dict,
+            "player": self.player,
+            "castling_rights": self.castling_rights,
+            "en_passant_square": self.en_passant_square,
+            "zobrist_key": self.zobrist_key,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Rebuild the board from the state given by __getstate__
+        @param state:
+        """
+        self.player = state["player"]
+        self.piece_dict = state["piece_dict"]
+        self.castling_rights = state["castling_rights"]
+        self.en_passant_square = state["en_passant_square"]
+        self.zobrist_key = state["zobrist_key"]
+
     def get_piece_type_counter(self):
         """
         Return a dict with the number of each piece in the game.
         One counter for both players
         @return:
         """
-        piece_counter = {Bishop: 0, King: 0, Knight: 0, Pawn: 0, Queen: 0, Rook: 0}
-        for piece in self.piece_dict.values():
-            piece_counter[piece.__class__] += 1
-        return piece_counter
+        return {
+            piece_type: self.piece_count(Color.WHITE, piece_type)
+            + self.piece_count(Color.BLACK, piece_type)
+            for piece_type in PIECE_TYPES
+        }
 
     def are_bishop_in_dead_position(self) -> bool:
         """
@@ -46,49 +352,11 @@ class Board:
         (king and bishop against king and bishop, with both bishops on squares of the same color)
         @return:
         """
-        if self.get_piece_type_counter() != {
-            Bishop: 2,
-            King: 2,
-            Knight: 0,
-            Pawn: 0,
-            Queen: 0,
-            Rook: 0,
-        }:
+        if self.material_key != BISHOPS_KEY:
             return False
-        square_color = []
-        bishop_color = []
-        for square, piece in self.piece_dict.items():
-            print(piece)
-            if isinstance(piece, Bishop):
-                square_color.append(square.square_color())
-                bishop_color.append(piece.color)
-        return square_color[0] == square_color[1] and bishop_color[0] != bishop_color[1]
-
-    def dict_to_bit(self) -> int:
-        """
-        Return the bit value of a board
-        a square state is encoded on 4 bits abcd
-        a: 1 if white, 0 other
-        bcd: 001 : bishop 9 | 1
-        bcd: 010 : king  a | 2
-        bcd: 011 : knight b | 3
-        bcd: 100 : pawn c | 4
-        bcd: 101 : queen d | 5
-        bcd: 110 : rook e | 6
-        bcd: 111 : piece (only useful for tests)
-        abcd: 0000 : empty square
-        config history bit value : A1A2...H8
-        @return:
-        """
-        config_value = 0b0
-        for (column, row) in product(Column, range(1, 9)):
-            if Square(column, row) not in self.piece_dict:
-                config_value = config_value << 4
-            else:
-                config_value = (config_value << 4) + self.piece_dict[
-                    Square(column, row)
-                ].bit_value()
-        return config_value
+        white_bishop = next(self.piece_squares(Color.WHITE, Bishop))
+        black_bishop = next(self.piece_squares(Color.BLACK, Bishop))
+        return white_bishop.square_color() == black_bishop.square_color()
 
     def get_current_color(
         self,
@@ -112,18 +380,10 @@ class Board:
         @param color: color of the king
         @return: the origin of the king
         """
-        king = next(
-            (
-                square
-                for square in self.piece_dict
-                if type(self.piece_dict[square]) == King
-                   and self.piece_dict[square].color == color
-            ),
-            None,
-        )
-        if king is None:
+        king_square = self.king_squares[color]
+        if king_square is None:
             raise MissingKingError
-        return king
+        return king_square
 
     @staticmethod
     def initial_config():
@@ -12,7 +12,6 @@ from app.src.model.events.moves.move import Move
 from app.src.model.events.moves.rook_move import RookMove
 from app.src.model.events.moves.short_castling import ShortCastling
 from app.src.model.states.board import Board
-from app.src.model.states.game_historic import GameHistoric
 
 
 class CastlingState:
@@ -31,96 +30,46 @@ class CastlingState:
         self.__row = 1 * (color == Color.WHITE) + 8 * (color == Color.BLACK)
         self.color = color
 
+    @property
+    def castling_flags(self) -> tuple[bool, bool]:
+        """
+        Return the flags (long castling available, short castling available)
+        (they tell if the king and the rooks have moved, not if the castling
+        can be played in the current position)
+        @return:
+        """
+        return self.__long_castling_available, self.__short_castling_available
+
+    def set_castling_flags(
+        self, long_castling_available: bool, short_castling_available: bool
+    ) -> None:
+        """
+        Set the flags of a loaded position (e.g. from the castling field of a FEN)
+        @param long_castling_available: false if the king or rook in A has moved
+        @param short_castling_available: false if the king or rook in H has moved
+        """
+        self.__long_castling_available = long_castling_available
+        self.__short_castling_available = short_castling_available
+
     def update_castling_state(self, last_move: Move) -> None:
         """
         Update the castling state with the last moves
         @param last_move:
         @return:
         """
-        if isinstance(last_move, KingMove):
+        if isinstance(last_move, (KingMove, LongCastling, ShortCastling)):
             self.__long_castling_available = False
             self.__short_castling_available = False
         if isinstance(last_move, RookMove) and last_move.origin == Square(
             Column.A, self.__row
         ):
             self.__long_castling_available = False
-        if isinstance(last_move, RookMove) and last_move.origin == Square(Column.H, 1):
-            self.__short_castling_available = False
-
-    def __is_short_castling_available(self, board: Board, historic) -> bool:
-        # sourcery skip: assign-if-exp, boolean-if-exp-identity,
-        # sourcery skip: reintroduce-else, remove-unnecessary-cast
-        """
-        Return if a long castling is available for the current color.
-        | | | | |K|x|x|R|
-         A B C D E F G H
-        neither the king nor the rook has moved
-        the king is not in check
-        x and X must be empty, and not in check
-        (no need to check the position, since the king has not moved)
-
-        @return:
-        """
-        # check if the king is not in check
-        if is_square_in_check(
-            self.color, Square(Column.E, self.__row), board, historic
-        ):
-            return False
-        if (
-            Square(Column.F, self.__row) in board.piece_dict
-            or Square(Column.G, self.__row) in board.piece_dict
-        ):
-            return False
-        # check if x are not in check
-        if is_square_in_check(
-            self.color, Square(Column.F, self.__row), board, historic
-        ) or is_square_in_check(
-            self.color, Square(Column.G, self.__row), board, historic
-        ):
-            return False
-        return True
-
-    def __is_long_castling_available(
-        self, board: Board, historic: GameHistoric
-    ) -> bool:
-        # sourcery skip: assign-if-exp, boolean-if-exp-identity,
-        # sourcery skip: reintroduce-else, remove-unnecessary-cast
-        """
-        Return if a long castling is available for the current color.
-        |R|x|X|X|K| | | |
-         A B C D E F G H
-        neither the king nor the rook has moved
-        the king is not in check
-        x and X must be empty,
-        X must not be in check
-        (no need to check the position, since the king has not moved)
-
-        @return:
-        """
-        # check if the king is not in check
-        if is_square_in_check(
-            self.color, Square(Column.E, self.__row), board, historic
-        ):
-            return False
-        # check if x are empty
-        if (
-            Square(Column.D, self.__row) in board.piece_dict
-            or Square(Column.C, self.__row) in board.piece_dict
-            or Square(Column.B, self.__row) in board.piece_dict
-        ):
-            return False
-        # check if X are not in check
-        if is_square_in_check(
-            self.color, Square(Column.D, self.__row), board, historic
-        ) or is_square_in_check(
-            self.color, Square(Column.C, self.__row), board, historic
+        if isinstance(last_move, RookMove) and last_move.origin == Square(
+            Column.H, self.__row
         ):
-            return False
-        return True
+            self.__short_castling_available = False
 
-    def available_castling(
-        self, board: Board, historic: GameHistoric
-    ) -> [LongCastling, ShortCastling]:
+    def available_castling(self, board: Board) -> [LongCastling, ShortCastling]:
         """
         |R|x|X|X|K| | | |
          A B C D E F G H
@@ -135,11 +84,101 @@ class CastlingState:
         Return the castling available
         @return:
         """
-        long_castling_available = self.__is_long_castling_available(board, historic)
-        short_castling_available = self.__is_short_castling_available(board, historic)
-        available_moves = []
-        if self.__long_castling_available and long_castling_available:
-            available_moves.append(LongCastling(Square(Column.E, self.__row)))
-        if self.__short_castling_available and short_castling_available:
-            available_moves.append(ShortCastling(Square(Column.E, self.__row)))
-        return available_moves
+        return castling_moves(
+            self.color,
+            board,
+            self.__long_castling_available,
+            self.__short_castling_available,
+        )
+
+
+def castling_moves(
+    color: Color,
+    board: Board,
+    long_castling_allowed: bool,
+    short_castling_allowed: bool,
+) -> [LongCastling, ShortCastling]:
+    """
+    Return the castling moves available for color
+    (the castling rights are given, so no historic is needed)
+    @param color:
+    @param board:
+    @param long_castling_allowed: false if the king or rook in A has moved
+    @param short_castling_allowed: false if the king or rook in H has moved
+    @return:
+    """
+    row = 1 if color == Color.WHITE else 8
+    available_moves = []
+    # The flags are checked first, to skip the check verifications
+    if long_castling_allowed and _is_long_castling_available(color, row, board):
+        available_moves.append(LongCastling(Square(Column.E, row)))
+    if short_castling_allowed and _is_short_castling_available(color, row, board):
+        available_moves.append(ShortCastling(Square(Column.E, row)))
+    return available_moves
+
+
+def _is_short_castling_available(color: Color, row: int, board: Board) -> bool:
+    # sourcery skip: assign-if-exp, boolean-if-exp-identity,
+    # sourcery skip: reintroduce-else, remove-unnecessary-cast
+    """
+    Return if a long castling is available for the current color.
+    | | | | |K|x|x|R|
+     A B C D E F G H
+    neither the king nor the rook has moved
+    the king is not in check
+    x and X must be empty, and not in check
+    (no need to check the position, since the king has not moved)
+    @param color: color of the king
+    @param row: row of the king
+    @param board:
+    @return:
+    """
+    # check if the king is not in check
+    if is_square_in_check(color, Square(Column.E, row), board):
+        return False
+    if (
+        Square(Column.F, row) in board.piece_dict
+        or Square(Column.G, row) in board.piece_dict
+    ):
+        return False
+    # check if x are not in check
+    if is_square_in_check(color, Square(Column.F, row), board) or is_square_in_check(
+        color, Square(Column.G, row), board
+    ):
+        return False
+    return True
+
+
+def _is_long_castling_available(color: Color, row: int, board: Board) -> bool:
+    # sourcery skip: assign-if-exp, boolean-if-exp-identity,
+    # sourcery skip: reintroduce-else, remove-unnecessary-cast
+    """
+    Return if a long castling is available for the current color.
+    |R|x|X|X|K| | | |
+     A B C D E F G H
+    neither the king nor the rook has moved
+    the king is not in check
+    x and X must be empty,
+    X must not be in check
+    (no need to check the position, since the king has not moved)
+    @param color: color of the king
+    @param row: row of the king
+    @param board:
+    @return:
+    """
+    # check if the king is not in check
+    if is_square_in_check(color, Square(Column.E, row), board):
+        return False
+    # check if x are empty
+    if (
+        Square(Column.D, row) in board.piece_dict
+        or Square(Column.C, row) in board.piece_dict
+        or Square(Column.B, row) in board.piece_dict
+    ):
+        return False
+    # check if X are not in check
+    if is_square_in_check(color, Square(Column.D, row), board) or is_square_in_check(
+        color, Square(Column.C, row), board
+    ):
+        return False
+    return True
@@ -1,48 +1,65 @@
 """
 Historic of a game
 * played moves
-* hashes of the config
+* keys of the positions since the last irreversible move
 """
+from collections import deque
+from itertools import islice
 
+from app.src.model.classes.const.color import Color
+from app.src.model.classes.pieces.pawn import Pawn
 from app.src.model.events.moves.empty_move import EmptyMove
 from app.src.model.events.moves.move import Move
+from app.src.model.events.moves.move_code import MoveArray
 from app.src.model.states.board import Board
 
+# After 100 plies without capture or pawn move the game is drawn (50 moves rule)
+REPETITION_WINDOW = 100
+
 
 class GameHistoric:
     """
     Contain previous states information
+    position_keys: zobrist keys of the positions since the last irreversible move
+    (capture, pawn move, or castling rights change), oldest first
+    repetition_count: number of times the current position has been reached
     """
 
     def __init__(self):
         """
         Constructor
+        The played moves are stored as 16 bits codes (see move_code)
         """
-        self.move_historic: [Move] = [EmptyMove()]
-        self.config_historic = {}
+        self.move_historic = MoveArray([EmptyMove()])
+        self.position_keys: deque[int] = deque(maxlen=REPETITION_WINDOW)
+        self.repetition_count = 0
+        # What an irreversible move changes: material, castling rights and pawns
+        self.__irreversible_state = None
 
     def update_historic(self, move: Move, board: Board):
         """
         Update the configuration history
-        Use a custom hash from the piece_dict
-        a square state is encoded on 4 bits abcd
-        a: 1 if white, 0 other
-        bcd: 001 : bishop 9 | 1
-        bcd: 010 : king  a | 2
-        bcd: 011 : knight b | 3
-        bcd: 100 : pawn c | 4
-        bcd: 101 : queen d | 5
-        bcd: 110 : rook e | 6
-        bcd: 111 : piece (only useful for tests)
-        abcd: 0000 : empty square
-        config history bit value : A1A2...H8
+        Use the zobrist key of the board (updated incrementally by the board),
+        that covers the pieces, the side to move, the castling rights
+        and the en passant column
+        The previous positions can't come back after an irreversible move:
+        they are dropped
         @return:
         """
         self.move_historic.append(move)
-        # Calcul the config bit value
-        config_value = board.dict_to_bit()
-        # Update the history
-        if config_value in self.config_historic:
-            self.config_historic[config_value] += 1
-        else:
-            self.config_historic[config_value] = 1
+        irreversible_state = (
+            board.material_key,
+            board.castling_rights,
+            board.bitboards[Color.WHITE][Pawn],
+            board.bitboards[Color.BLACK][Pawn],
+        )
+        if irreversible_state != self.__irreversible_state:
+            self.position_keys.clear()
+            self.__irreversible_state = irreversible_state
+        config_value = board.zobrist_key
+        # The positions with the same side to move are 2, 4, ... plies back
+        self.repetition_count = 1 + sum(
+            previous_value == config_value
+            for previous_value in islice(reversed(self.position_keys), 1, None, 2)
+        )
+        self.position_keys.append(config_value)
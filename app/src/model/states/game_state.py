@@ -3,15 +3,10 @@ State (running, draw)
 Associated methods, (state update and getter)
 """
 from app.src.model.classes.const.color import Color
-from app.src.model.classes.pieces.bishop import Bishop
-from app.src.model.classes.pieces.king import King
-from app.src.model.classes.pieces.knight import Knight
-from app.src.model.classes.pieces.pawn import Pawn
-from app.src.model.classes.pieces.queen import Queen
-from app.src.model.classes.pieces.rook import Rook
 from app.src.model.events.moves.pawn_move import PawnMove
 from app.src.model.states.board import Board
 from app.src.model.states.game_historic import GameHistoric
+from app.src.model.states.material import BISHOPS_KEY, DEAD_POSITION_KEYS
 
 
 class GameState:
@@ -33,6 +28,8 @@ class GameState:
         self.state = GameState.RUNNING
         self.fifty_counter = 0
         self.player = Color.WHITE
+        # Starts at 1, incremented after each black move
+        self.fullmove_number = 1
 
     def fifty_move_rule(self, game_historic: GameHistoric, capture: bool):
         """
@@ -45,7 +42,8 @@ class GameState:
             self.fifty_counter = 0
         else:
             self.fifty_counter += 1
-            if self.fifty_counter == 100:
+            # A loaded position can start with a counter of 100 or more
+            if self.fifty_counter >= 100:
                 self.state = GameState.DRAW
 
     def three_fold_rule(self, game_historic: GameHistoric):
@@ -53,7 +51,7 @@ class GameState:
         Update the three-fold state
         @return:
         """
-        if 3 in game_historic.config_historic.values():
+        if game_historic.repetition_count >= 3:
             self.state = GameState.DRAW
 
     def dead_position_rule(self, board: Board):
@@ -62,32 +60,36 @@ class GameState:
         @param board:
         @return:
         """
-        piece_counter = board.get_piece_type_counter()
-        dead_position_boards = [
-            {Bishop: 0, King: 2, Knight: 0, Pawn: 0, Queen: 0, Rook: 0},
-            {Bishop: 1, King: 2, Knight: 0, Pawn: 0, Queen: 0, Rook: 0},
-            {Bishop: 0, King: 2, Knight: 1, Pawn: 0, Queen: 0, Rook: 0},
-        ]
-        if piece_counter in dead_position_boards:
-            self.state = GameState.DRAW
-        if (
-            piece_counter == {Bishop: 2, King: 2, Knight: 0, Pawn: 0, Queen: 0, Rook: 0}
-            and board.are_bishop_in_dead_position()
+        if board.material_key in DEAD_POSITION_KEYS or (
+            board.material_key == BISHOPS_KEY and board.are_bishop_in_dead_position()
         ):
             self.state = GameState.DRAW
 
-    def update_state(self, game_historic: GameHistoric, capture: bool):
+    def loaded_position_rules(self, board: Board):
+        """
+        Update the state of a loaded position (no historic):
+        the fifty-move rule on the loaded counter, and the dead positions rule
+        @param board:
+        @return:
+        """
+        if self.fifty_counter >= 100:
+            self.state = GameState.DRAW
+        self.dead_position_rule(board)
+
+    def update_state(self, game_historic: GameHistoric, capture: bool, board: Board):
         """
         Update the state for all rules
         @param game_historic:
         @param capture: boolean value if the last moves was a capture
+        @param board: the board, once the last move is played
         @return:
         """
         self.fifty_move_rule(game_historic, capture)
         self.three_fold_rule(game_historic)
-        # pylint: disable=W0511
-        # Dead position
-        # TODO
+        # Dead position: lookup of the material key
+        self.dead_position_rule(board)
 
         # Update the player who has to play
+        if self.player == Color.BLACK:
+            self.fullmove_number += 1
         self.player = Color.BLACK if self.player == Color.WHITE else Color.WHITE
@@ -0,0 +1,110 @@
+"""
+LRU cache of the legal moves of the positions already visited
+(the analysis goes back and forth in the games: the positions come back)
+"""
+from collections import OrderedDict
+from typing import NamedTuple
+
+from app.src.model.states.legal_move_index import LegalMoveIndex
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of a LegalMoveCache
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    moves: int
+
+
+class LegalMoveCache:
+    """
+    Bounded LRU cache {position key: LegalMoveIndex}
+    The least recently used positions are evicted when there are more than
+    maxsize positions, or more than max_moves moves stored (memory cap)
+    hits, misses: lookup counters
+    """
+
+    def __init__(self, maxsize: int = 1024, max_moves: int = 65536):
+        """
+        Constructor
+        @param maxsize: maximal number of positions
+        @param max_moves: maximal number of moves, all positions included
+        """
+        self.maxsize = maxsize
+        self.max_moves = max_moves
+        self.hits = 0
+        self.misses = 0
+        self.__moves = 0
+        self.__entries: OrderedDict[tuple, LegalMoveIndex] = OrderedDict()
+
+    def get(self, key: tuple) -> LegalMoveIndex | None:
+        """
+        Return the legal moves of a position, and mark it as recently used
+        @param key: key of the position
+        @return: None if the position is not in the cache
+        """
+        legal_moves = self.__entries.get(key)
+        if legal_moves is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.__entries.move_to_end(key)
+        return legal_moves
+
+    def peek(self, key: tuple) -> LegalMoveIndex | None:
+        """
+        Return the legal moves of a position, without updating
+        the counters and the order
+        @param key: key of the position
+        @return: None if the position is not in the cache
+        """
+        return self.__entries.get(key)
+
+    def put(self, key: tuple, legal_moves: LegalMoveIndex) -> None:
+        """
+        Store the legal moves of a position, and evict the least recently used
+        positions if the cache is full
+        @param key: key of the position
+        @param legal_moves:
+        """
+        previous = self.__entries.pop(key, None)
+        if previous is not None:
+            self.__moves -= len(previous)
+        self.__entries[key] = legal_moves
+        self.__moves += len(legal_moves)
+        while self.__entries and (
+            len(self.__entries) > self.maxsize or self.__moves > self.max_moves
+        ):
+            _, evicted = self.__entries.popitem(last=False)
+            self.__moves -= len(evicted)
+
+    def clear(self) -> None:
+        """
+        Empty the cache and reset the counters
+        """
+        self.__entries.clear()
+        self.__moves = 0
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Return the statistics of the cache
+        @return:
+        """
+        return CacheInfo(
+            self.hits, self.misses, self.maxsize, len(self.__entries), self.__moves
+        )
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+
+# Cache shared by the games: the keys depend on the position only,
+# so a position reached in a game is found from another game
+# (e.g. a game rebuilt from a FEN at each step of an analysis)
+SHARED_LEGAL_MOVE_CACHE = LegalMoveCache()
@@ -0,0 +1,68 @@
+"""
+Legal moves of a position, indexed for the validation and the UI lookups
+"""
+from typing import Iterator
+
+from app.src.model.classes.bitboard import bitboard_squares
+from app.src.model.classes.square import Square
+from app.src.model.events.moves.move import Move
+
+
+class LegalMoveIndex:
+    """
+    Legal moves of a position
+    moves: the moves, in generation order
+    by_origin: {origin square: the moves from this square}
+    destination_masks: {origin square: bitboard of the destinations}
+    """
+
+    def __init__(self, moves: [Move]):
+        """
+        Constructor
+        @param moves: legal moves of the position
+        """
+        self.moves = tuple(moves)
+        # A move hash is built from its class, origin and destination
+        self.__move_set = frozenset(self.moves)
+        self.by_origin: dict[Square, list[Move]] = {}
+        self.destination_masks: dict[Square, int] = {}
+        for move in self.moves:
+            self.by_origin.setdefault(move.origin, []).append(move)
+            self.destination_masks[move.origin] = self.destination_masks.get(
+                move.origin, 0
+            ) | (1 << move.destination.index)
+
+    def from_square(self, origin: Square) -> [Move]:
+        """
+        Return the legal moves from origin
+        @param origin:
+        @return: list of moves (empty if there is no move from origin)
+        """
+        return list(self.by_origin.get(origin, ()))
+
+    def destination_map(self) -> dict[Square, list[Square]]:
+        """
+        Return the legal destinations of each origin square
+        (a square appears once, even with several promotions)
+        @return: {origin square: destination squares (A1 first)}
+        """
+        return {
+            origin: list(bitboard_squares(mask))
+            for origin, mask in self.destination_masks.items()
+        }
+
+    def __contains__(self, move: Move) -> bool:
+        return move in self.__move_set
+
+    def __iter__(self) -> Iterator[Move]:
+        return iter(self.moves)
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # Never modified after its construction: a copied game shares it
+        return self
@@ -0,0 +1,43 @@
+"""
+Material key: the number of pieces of each color and type, packed in an int.
+4 bits per (color, piece type) counter (at most 10 pieces of a type),
+so the key is updated with one addition when a piece is put or removed
+"""
+from app.src.model.classes.bitboard import PIECE_TYPES
+from app.src.model.classes.const.color import Color
+from app.src.model.classes.pieces.bishop import Bishop
+from app.src.model.classes.pieces.king import King
+from app.src.model.classes.pieces.knight import Knight
+
+MATERIAL_UNITS = {
+    color: {
+        piece_type: 1 << 4 * (color_index * len(PIECE_TYPES) + type_index)
+        for type_index, piece_type in enumerate(PIECE_TYPES)
+    }
+    for color_index, color in enumerate(Color)
+}
+
+
+def material_key(pieces: dict[Color, list[type]]) -> int:
+    """
+    Return the material key of a set of pieces
+    @param pieces: {color: list of piece types}
+    @return: material key
+    """
+    return sum(
+        MATERIAL_UNITS[color][piece_type]
+        for color, piece_types in pieces.items()
+        for piece_type in piece_types
+    )
+
+
+# Material that can't checkmate: king against king,
+# king and bishop against king, king and knight against king
+DEAD_POSITION_KEYS = frozenset(
+    material_key({color: [King] + minor_piece, opponent: [King]})
+    for color, opponent in ((Color.WHITE, Color.BLACK), (Color.BLACK, Color.WHITE))
+    for minor_piece in ([], [Bishop], [Knight])
+)
+# King and bishop against king and bishop: dead if the bishops are
+# on squares of the same color
+BISHOPS_KEY = material_key({Color.WHITE: [King, Bishop], Color.BLACK: [King, Bishop]})
@@ -0,0 +1,28 @@
+"""
+Undo information of a move applied on a board
+"""
+from app.src.model.events.moves.move import Move
+
+
+class MoveUndo:
+    """
+    Returned by Board.make_move, and given to Board.unmake_move
+    to restore the board as it was before the move
+    """
+
+    def __init__(self, move: Move, board):
+        """
+        Constructor, to call before the move is applied on board
+        Store the state of the board that can't be deduced from the move
+        @param move: the applied move
+        @param board: the board, before the move
+        """
+        self.move = move
+        # the piece that moved (the pawn for a promotion)
+        self.piece = board.piece_dict[move.origin]
+        # the captured piece (None if there is no capture), and its square
+        self.captured_square = move.captured_square()
+        self.captured = board.piece_dict.get(self.captured_square)
+        self.castling_rights = board.castling_rights
+        self.en_passant_square = board.en_passant_square
+        self.zobrist_key = board.zobrist_key
@@ -0,0 +1,452 @@
+"""
+Position: immutable snapshot of the state of a game
+(pieces, side to move, castling rights, en passant square, halfmove clock).
+It doesn't need the historic of the game: it can be hashed, cached,
+and sent to another process
+"""
+from app.src.model.classes.bitboard import PIECE_TYPES, bitboard_indexes
+from app.src.model.classes.const.castling_rights import (
+    BLACK_LONG_CASTLING,
+    BLACK_SHORT_CASTLING,
+    CASTLING_RIGHTS,
+    WHITE_LONG_CASTLING,
+    WHITE_SHORT_CASTLING,
+)
+from app.src.exceptions.fen_error import FenError
+from app.src.model.classes.const.color import Color
+from app.src.model.classes.const.column import Column
+from app.src.model.classes.pieces.bishop import Bishop
+from app.src.model.classes.pieces.king import King
+from app.src.model.classes.pieces.knight import Knight
+from app.src.model.classes.pieces.pawn import Pawn
+from app.src.model.classes.pieces.queen import Queen
+from app.src.model.classes.pieces.rook import Rook
+from app.src.model.classes.square import Square
+from app.src.model.events.event_processor.legality_checker import LegalityChecker
+from app.src.model.events.event_processor.move_counter import (
+    PROMOTION_ROWS,
+    count_legal_moves,
+)
+from app.src.model.events.event_processor.move_processor import (
+    square_available_moves_no_castling,
+)
+from app.src.model.events.moves.move import Move
+from app.src.model.states.board import Board
+from app.src.model.states.castling_state import castling_moves
+from app.src.model.states.zobrist import (
+    BLACK_TO_MOVE_KEY,
+    CASTLING_KEYS,
+    EN_PASSANT_KEYS,
+    PIECE_KEYS,
+)
+
+# (color, piece type) of the bitboards of a position, in order
+PIECE_KINDS = tuple(
+    (color, piece_type) for color in Color for piece_type in PIECE_TYPES
+)
+FEN_PIECES = {
+    "P": Pawn,
+    "N": Knight,
+    "B": Bishop,
+    "R": Rook,
+    "Q": Queen,
+    "K": King,
+}
+FEN_LETTERS = {piece_type: letter for letter, piece_type in FEN_PIECES.items()}
+FEN_COLORS = {"w": Color.WHITE, "b": Color.BLACK}
+FEN_CASTLING = {
+    "K": WHITE_SHORT_CASTLING,
+    "Q": WHITE_LONG_CASTLING,
+    "k": BLACK_SHORT_CASTLING,
+    "q": BLACK_LONG_CASTLING,
+}
+# {castling right: (color, index of the king, index of the rook)}
+CASTLING_SQUARES = {
+    WHITE_SHORT_CASTLING: (Color.WHITE, 4, 7),
+    WHITE_LONG_CASTLING: (Color.WHITE, 4, 0),
+    BLACK_SHORT_CASTLING: (Color.BLACK, 60, 63),
+    BLACK_LONG_CASTLING: (Color.BLACK, 60, 56),
+}
+
+
+class Position:
+    """
+    Immutable and hashable position
+    pieces: one bitboard per (color, piece type) of PIECE_KINDS
+    player: color of the player that plays
+    castling_rights: castling rights mask
+    en_passant_square: square where a pawn can take en passant (else None)
+    halfmove_clock: number of plies since the last capture or pawn move
+    zobrist_key: zobrist key of the position (the same as the key of the board)
+    Two positions are equal if they have the same pieces, player, castling rights
+    and en passant square: the halfmove clock does not change the legal moves
+    """
+
+    __slots__ = (
+        "pieces",
+        "player",
+        "castling_rights",
+        "en_passant_square",
+        "halfmove_clock",
+        "zobrist_key",
+    )
+    pieces: tuple[int, ...]
+    player: Color
+    castling_rights: int
+    en_passant_square: Square | None
+    halfmove_clock: int
+    zobrist_key: int
+
+    def __init__(
+        self,
+        pieces: tuple[int, ...],
+        player: Color,
+        castling_rights: int,
+        en_passant_square: Square | None = None,
+        halfmove_clock: int = 0,
+    ):
+        """
+        Constructor
+        @param pieces: one bitboard per (color, piece type) of PIECE_KINDS
+        @param player: color of the player that plays
+        @param castling_rights: castling rights mask
+        @param en_passant_square: square where a pawn can take en passant
+        @param halfmove_clock: number of plies since the last capture or pawn move
+        """
+        zobrist_key = CASTLING_KEYS[castling_rights]
+        for (color, piece_type), bitboard in zip(PIECE_KINDS, pieces):
+            for index in bitboard_indexes(bitboard):
+                zobrist_key ^= PIECE_KEYS[color][piece_type][index]
+        if en_passant_square is not None:
+            zobrist_key ^= EN_PASSANT_KEYS[en_passant_square.column.value - 1]
+        if player == Color.BLACK:
+            zobrist_key ^= BLACK_TO_MOVE_KEY
+        for name, value in (
+            ("pieces", tuple(pieces)),
+            ("player", player),
+            ("castling_rights", castling_rights),
+            ("en_passant_square", en_passant_square),
+            ("halfmove_clock", halfmove_clock),
+            ("zobrist_key", zobrist_key),
+        ):
+            object.__setattr__(self, name, value)
+
+    @staticmethod
+    def from_board(board: Board, halfmove_clock: int = 0) -> "Position":
+        """
+        Build the position of a board (player, castling rights and en passant
+        square are read from the board)
+        @param board:
+        @param halfmove_clock:
+        @return:
+        """
+        return Position(
+            tuple(
+                board.bitboards[color][piece_type] for color, piece_type in PIECE_KINDS
+            ),
+            board.player,
+            board.castling_rights,
+            board.en_passant_square,
+            halfmove_clock,
+        )
+
+    @staticmethod
+    def from_game(game) -> "Position":
+        """
+        Build the position of a game: the player and the castling flags
+        of the game are used, as for the legal moves of the game
+        @param game: a Game
+        @return:
+        """
+        board = game.board
+        return Position(
+            tuple(
+                board.bitboards[color][piece_type] for color, piece_type in PIECE_KINDS
+            ),
+            game.player,
+            game_castling_rights(game),
+            board.en_passant_square,
+            game.game_state.fifty_counter,
+        )
+
+    @staticmethod
+    def from_fen(fen: str) -> "Position":
+        """
+        Build a position from a FEN string, in one pass on the piece placement
+        The full move number is optional and ignored (see Game.from_fen).
+        The en passant square is kept only if a pawn can take en passant,
+        and the castling rights only if the king and the rook are on their squares
+        (as the board does)
+        @param fen: e.g. "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1"
+        @return:
+        """
+        fields = fen.split()
+        if len(fields) not in (4, 5, 6):
+            raise FenError(fen, "4 to 6 fields expected")
+        placement, side, castling, en_passant = fields[:4]
+        pieces = _fen_pieces(fen, placement)
+        if side not in FEN_COLORS:
+            raise FenError(fen, f"unknown side to move {side!r}")
+        player = FEN_COLORS[side]
+        halfmove_clock = fields[4] if len(fields) > 4 else "0"
+        # isdigit accepts the digits of the other scripts, e.g. "٣"
+        if not (halfmove_clock.isascii() and halfmove_clock.isdigit()):
+            raise FenError(fen, f"invalid halfmove clock {halfmove_clock!r}")
+        return Position(
+            tuple(pieces.values()),
+            player,
+            _fen_castling_rights(fen, castling, pieces),
+            _fen_en_passant_square(fen, en_passant, player, pieces),
+            int(halfmove_clock),
+        )
+
+    def to_fen(self, fullmove_number: int = 1) -> str:
+        """
+        Return the FEN string of the position
+        (the en passant square is given only if a pawn can take en passant)
+        @param fullmove_number: number of the move (not kept by the position)
+        @return:
+        """
+        squares = [""] * 64
+        for (color, piece_type), bitboard in zip(PIECE_KINDS, self.pieces):
+            letter = FEN_LETTERS[piece_type]
+            for index in bitboard_indexes(bitboard):
+                squares[index] = letter if color == Color.WHITE else letter.lower()
+        rows = []
+        for row_start in range(56, -1, -8):
+            row, empty = "", 0
+            for letter in squares[row_start : row_start + 8]:
+                if not letter:
+                    empty += 1
+                    continue
+                row += (str(empty) if empty else "") + letter
+                empty = 0
+            rows.append(row + (str(empty) if empty else ""))
+        castling = "".join(
+            char
+            for char, castling_right in FEN_CASTLING.items()
+            if self.castling_rights & castling_right
+        )
+        en_passant = (
+            "-"
+            if self.en_passant_square is None
+            else f"{self.en_passant_square.column.name.lower()}"
+            f"{self.en_passant_square.row}"
+        )
+        side = "w" if self.player == Color.WHITE else "b"
+        return (
+            f"{'/'.join(rows)} {side} {castling or '-'} {en_passant} "
+            f"{self.halfmove_clock} {fullmove_number}"
+        )
+
+    def to_board(self) -> Board:
+        """
+        Build a board with the position
+        @return:
+        """
+        board = Board.__new__(Board)
+        board.player = self.player
+        board.piece_dict = {
+            Square.from_index(index): piece_type(color)
+            for (color, piece_type), bitboard in zip(PIECE_KINDS, self.pieces)
+            for index in bitboard_indexes(bitboard)
+        }
+        board.set_position_state(self.castling_rights, self.en_passant_square)
+        return board
+
+    def legal_moves(self) -> [Move]:
+        """
+        Return the legal moves of the player that plays, in the order of the game
+        (the pieces from A1 to H8, the castling after the king moves)
+        @return: list of moves
+        """
+        return board_legal_moves(self.to_board())
+
+    def count_legal_moves(self) -> int:
+        """
+        Return the number of legal moves of the player that plays,
+        without building the moves (see move_counter)
+        @return:
+        """
+        return count_legal_moves(self.to_board())
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Position is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Position is immutable")
+
+    def __eq__(self, other):
+        return (
+            type(other) == Position
+            and self.zobrist_key == other.zobrist_key
+            and self.pieces == other.pieces
+            and self.player == other.player
+            and self.castling_rights == other.castling_rights
+            and self.en_passant_square == other.en_passant_square
+        )
+
+    def __hash__(self):
+        return hash(self.zobrist_key)
+
+    def __reduce__(self):
+        return Position, (
+            self.pieces,
+            self.player,
+            self.castling_rights,
+            self.en_passant_square,
+            self.halfmove_clock,
+        )
+
+
+def board_legal_moves(board: Board) -> [Move]:
+    """
+    Return the legal moves of board.player, without historic:
+    the castling rights and the en passant square of the board are used
+    @param board:
+    @return: list of moves (the pieces from A1 to H8, the castling after the king)
+    """
+    player = board.player
+    legality_checker = LegalityChecker(player, board)
+    long_right, short_right = CASTLING_RIGHTS[player]
+    legal_moves = []
+    for square in board.piece_squares(player):
+        legal_moves.extend(
+            square_available_moves_no_castling(
+                square, board, None, True, legality_checker
+            )
+        )
+        if square == legality_checker.king_square:
+            legal_moves.extend(
+                castling_moves(
+                    player,
+                    board,
+                    bool(board.castling_rights & long_right),
+                    bool(board.castling_rights & short_right),
+                )
+            )
+    return legal_moves
+
+
+def game_castling_rights(game) -> int:
+    """
+    Return the castling rights of a game: the rights of the board,
+    restricted by the castling flags of the game
+    @param game: a Game
+    @return: castling rights mask
+    """
+    castling_rights = 0
+    for castling_state in (game.white_castling_state, game.black_castling_state):
+        for castling_flag, castling_right in zip(
+            castling_state.castling_flags, CASTLING_RIGHTS[castling_state.color]
+        ):
+            if castling_flag:
+                castling_rights |= castling_right
+    return game.board.castling_rights & castling_rights
+
+
+def _fen_pieces(fen: str, placement: str) -> dict[tuple, int]:
+    """
+    Parse the piece placement field of a FEN string
+    @param fen: the FEN string (for the error message)
+    @param placement: e.g. "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR"
+    @return: {(color, piece type): bitboard}, in the order of PIECE_KINDS
+    (one king of each color, no pawn on the rows 1 and 8)
+    """
+    pieces = dict.fromkeys(PIECE_KINDS, 0)
+    # The rows are given from 8 to 1, each row from A to H
+    row_start = index = 56
+    for char in placement:
+        if char == "/":
+            if index != row_start + 8 or row_start == 0:
+                raise FenError(fen, "each row must have 8 squares")
+            row_start -= 8
+            index = row_start
+        elif char in "12345678":
+            index += int(char)
+        elif char.upper() in FEN_PIECES and index < row_start + 8:
+            color = Color.WHITE if char.isupper() else Color.BLACK
+            pieces[color, FEN_PIECES[char.upper()]] |= 1 << index
+            index += 1
+        else:
+            raise FenError(fen, f"unexpected {char!r} in the piece placement")
+    if index != row_start + 8 or row_start != 0:
+        raise FenError(fen, "8 rows of 8 squares expected")
+    for color in Color:
+        if pieces[color, King].bit_count() != 1:
+            raise FenError(fen, f"one {color.name.lower()} king expected")
+    if (pieces[Color.WHITE, Pawn] | pieces[Color.BLACK, Pawn]) & PROMOTION_ROWS:
+        raise FenError(fen, "no pawn expected on the rows 1 and 8")
+    return pieces
+
+
+def _fen_castling_rights(fen: str, castling: str, pieces: dict[tuple, int]) -> int:
+    """
+    Parse the castling field of a FEN string
+    @param fen: the FEN string (for the error message)
+    @param castling: "-" or e.g. "KQkq"
+    @param pieces: {(color, piece type): bitboard}
+    @return: castling rights mask (without the castling whose king or rook moved)
+    """
+    castling_rights = 0
+    if castling != "-":
+        for char in castling:
+            if char not in FEN_CASTLING:
+                raise FenError(fen, f"unknown castling right {char!r}")
+            castling_rights |= FEN_CASTLING[char]
+    for castling_right, (color, king_index, rook_index) in CASTLING_SQUARES.items():
+        if not (
+            pieces[color, King] >> king_index & pieces[color, Rook] >> rook_index & 1
+        ):
+            castling_rights &= ~castling_right
+    return castling_rights
+
+
+def _fen_en_passant_square(
+    fen: str, en_passant: str, player: Color, pieces: dict[tuple, int]
+) -> Square | None:
+    """
+    Parse the en passant field of a FEN string
+    @param fen: the FEN string (for the error message)
+    @param en_passant: "-" or the square behind the pawn, e.g. "e3"
+    @param player: the player that plays
+    @param pieces: {(color, piece type): bitboard}
+    @return: None if no pawn of player can take en passant,
+    or if no pawn of the opponent can have moved of 2 squares
+    """
+    if en_passant == "-":
+        return None
+    row = 6 if player == Color.WHITE else 3
+    if (
+        len(en_passant) != 2
+        or en_passant[0] not in "abcdefgh"
+        or en_passant[1] != str(row)
+    ):
+        raise FenError(fen, f"invalid en passant square {en_passant!r}")
+    square = Square(Column[en_passant[0].upper()], row)
+    # The pawn that has moved of 2 squares is in front of the square,
+    # the square and the start square of the pawn are empty
+    step = -8 if player == Color.WHITE else 8
+    opponent = Color.BLACK if player == Color.WHITE else Color.WHITE
+    occupancy = 0
+    for bitboard in pieces.values():
+        occupancy |= bitboard
+    if (
+        not pieces[opponent, Pawn] >> square.index + step & 1
+        or occupancy >> square.index & 1
+        or occupancy >> square.index - step & 1
+        or not pieces[player, Pawn] & _neighbours(square.index + step)
+    ):
+        return None
+    return square
+
+
+def _neighbours(index: int) -> int:
+    """
+    Return the bitboard of the squares next to index, on the same row
+    @param index:
+    @return:
+    """
+    return (1 << index - 1 if index % 8 else 0) | (
+        1 << index + 1 if index % 8 != 7 else 0
+    )
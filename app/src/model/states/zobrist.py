@@ -0,0 +1,25 @@
+"""
+Zobrist keys, to hash a position in 64 bits.
+One random key per (color, piece type, square), per castling rights mask,
+per en passant column, and one for the side to move.
+The key of a position is the xor of the keys of its features,
+so it is updated incrementally when a move is played
+"""
+import random
+
+from app.src.model.classes.bitboard import PIECE_TYPES
+from app.src.model.classes.const.color import Color
+
+# Fixed seed: the keys are the same in every run (and every process)
+_RANDOM = random.Random(0x5EED)
+
+PIECE_KEYS = {
+    color: {
+        piece_type: tuple(_RANDOM.getrandbits(64) for _ in range(64))
+        for piece_type in PIECE_TYPES
+    }
+    for color in Color
+}
+CASTLING_KEYS = tuple(_RANDOM.getrandbits(64) for _ in range(16))
+EN_PASSANT_KEYS = tuple(_RANDOM.getrandbits(64) for _ in range(8))
+BLACK_TO_MOVE_KEY = _RANDOM.getrandbits(64)
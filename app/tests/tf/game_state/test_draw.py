@@ -160,6 +160,35 @@ def test_dead_position4():
     assert game_state.state == GameState.DRAW
 
 
+def test_dead_position_after_capture():
+    """
+    Test that the dead position rule is checked when a move is applied:
+    the king takes the last rook
+    8 | | | | | | | | |
+    7 | | | | | | | | |
+    6 | | | | | | | | |
+    5 | | | | | | | | |
+    4 | | | | | | | | |
+    3 | | | | | | |k| |
+    2 | | | | | |R| | |
+    1 | | | | | | | |K|
+       A B C D E F G H
+    @return:
+    """
+    game = Game()
+    board = Board()
+    board.piece_dict = {
+        Square(Column.H, 1): King(Color.WHITE),
+        Square(Column.F, 2): Rook(Color.WHITE),
+        Square(Column.G, 3): King(Color.BLACK),
+    }
+    game.board = board
+    game.game_state.player = Color.BLACK
+    assert game.game_state.state == GameState.RUNNING
+    game.apply_move(KingMove(Square(Column.G, 3), Square(Column.F, 2)))
+    assert game.game_state.state == GameState.DRAW
+
+
 def test_threefold_repetition_rule():
     """
     Test the threefold repetition rule
@@ -186,12 +215,21 @@ def test_threefold_repetition_rule():
     game.board = board
     game.game_state.player = Color.BLACK
     move_list = [
-        RookMove(Square(Column.B, 7), Square(Column.A, 7)),  # 1
+        RookMove(Square(Column.B, 7), Square(Column.A, 7)),  # white to play
         RookMove(Square(Column.A, 8), Square(Column.H, 8)),
         RookMove(Square(Column.A, 7), Square(Column.G, 7)),
         RookMove(Square(Column.H, 8), Square(Column.D, 8)),
         RookMove(Square(Column.G, 7), Square(Column.A, 7)),
-        RookMove(Square(Column.D, 8), Square(Column.A, 8)),  # 2
+        RookMove(Square(Column.D, 8), Square(Column.A, 8)),  # 1 (black to play)
+        KingMove(Square(Column.G, 3), Square(Column.G, 4)),
+        KingMove(Square(Column.H, 1), Square(Column.G, 1)),
+        KingMove(Square(Column.G, 4), Square(Column.G, 3)),
+        KingMove(Square(Column.G, 1), Square(Column.H, 1)),  # 2
+    ]
+    list(map(game.apply_move, move_list))
+    # The first position had another player to play: only 2 repetitions
+    assert game.game_state.state == GameState.RUNNING
+    move_list = [
         KingMove(Square(Column.G, 3), Square(Column.G, 4)),
         KingMove(Square(Column.H, 1), Square(Column.G, 1)),
         KingMove(Square(Column.G, 4), Square(Column.G, 3)),
@@ -234,3 +272,28 @@ def test_fifty_move():
     game.game_state.fifty_counter = 98
     game.apply_move(Pawn2SquareMove(Square(Column.E, 2), Square(Column.E, 4)))
     assert game.game_state.fifty_counter == 0
+    # Assert that a counter already over 100 gives a draw
+    game = Game()
+    game.game_state.fifty_counter = 100
+    game.apply_move(KnightMove(Square(Column.G, 1), Square(Column.F, 3)))
+    assert game.game_state.fifty_counter == 101
+    assert game.game_state.state == GameState.DRAW
+
+
+def test_loaded_position_draw():
+    """
+    Test the draw rules on the positions loaded from a FEN:
+    stalemate, dead position, and halfmove clock of 100 or more
+    @return:
+    """
+    for fen in (
+        "7k/5Q2/6K1/8/8/8/8/8 b - - 0 1",
+        "7k/8/6K1/8/8/8/8/8 w - - 0 1",
+        "7k/8/6K1/8/8/8/8/R7 w - - 100 80",
+        "7k/8/6K1/8/8/8/8/R7 w - - 120 80",
+    ):
+        assert Game.from_fen(fen).game_state.state == GameState.DRAW
+    game = Game.from_fen("7k/8/6K1/8/8/8/8/R7 w - - 99 80")
+    assert game.game_state.state == GameState.RUNNING
+    game.apply_move(RookMove(Square(Column.A, 1), Square(Column.B, 1)))
+    assert game.game_state.state == GameState.DRAW
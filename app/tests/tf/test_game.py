@@ -1,12 +1,34 @@
 """
 Tests for the game classes
 """
+import pickle
+import random
+
+import pytest
+
+from app.src.exceptions.fen_error import FenError
+from app.src.model.classes.const.color import Color
 from app.src.model.classes.const.column import Column
+from app.src.model.classes.pieces.king import King
+from app.src.model.classes.pieces.rook import Rook
 from app.src.model.classes.square import Square
+from app.src.model.events.moves.empty_move import EmptyMove
+from app.src.model.events.moves.en_passant import EnPassant
+from app.src.model.events.moves.king_move import KingMove
 from app.src.model.events.moves.knight_move import KnightMove
 from app.src.model.events.moves.pawn_2_square_move import Pawn2SquareMove
 from app.src.model.events.moves.pawn_move import PawnMove
+from app.src.model.events.moves.queen_move import QueenMove
+from app.src.model.events.moves.rook_move import RookMove
+from app.src.model.events.moves.short_castling import ShortCastling
 from app.src.model.game.game import Game
+from app.src.model.states.board import Board
+from app.src.model.states.game_state import GameState
+from app.src.model.states.legal_move_cache import (
+    SHARED_LEGAL_MOVE_CACHE,
+    LegalMoveCache,
+)
+from app.src.model.states.position import Position
 
 
 def test_available_moves_list():
@@ -100,3 +122,349 @@ def test_available_moves_list():
         ),
     ]
     assert game.available_moves_list() == expected_moves
+
+
+def test_legal_moves_from():
+    """
+    Test the lookup of the legal moves by origin square,
+    and that the index follows the position
+    @return:
+    """
+    game = Game()
+    assert game.legal_moves_from(Square(Column.G, 1)) == [
+        KnightMove(Square(Column.G, 1), Square(Column.F, 3)),
+        KnightMove(Square(Column.G, 1), Square(Column.H, 3)),
+    ]
+    assert not game.legal_moves_from(Square(Column.E, 1))
+    assert PawnMove(Square(Column.E, 2), Square(Column.E, 3)) in (
+        game.legal_move_index()
+    )
+    game.game_state.player = Color.BLACK
+    assert not game.legal_moves_from(Square(Column.G, 1))
+    assert len(game.legal_moves_from(Square(Column.G, 8))) == 2
+
+
+def test_is_legal():
+    """
+    Test the verification of a single move, without the legal moves of the position
+    8 |k| | | |r| | | |
+    7 | | | | | | | | |
+    6 | | | | | | | | |
+    5 | | | | | | | | |
+    4 | | | | | | | | |
+    3 | | | | | | | | |
+    2 | | | | |R| | | |
+    1 | | | | |K| | |R|
+       A B C D E F G H
+    @return:
+    """
+    game = Game()
+    assert game.is_legal(PawnMove(Square(Column.E, 2), Square(Column.E, 3)))
+    # black piece, occupied destination
+    assert not game.is_legal(Pawn2SquareMove(Square(Column.E, 7), Square(Column.E, 5)))
+    assert not game.is_legal(KnightMove(Square(Column.B, 1), Square(Column.D, 2)))
+    board = Board()
+    board.piece_dict = {
+        Square(Column.E, 1): King(Color.WHITE),
+        Square(Column.E, 2): Rook(Color.WHITE),
+        Square(Column.H, 1): Rook(Color.WHITE),
+        Square(Column.E, 8): Rook(Color.BLACK),
+        Square(Column.A, 8): King(Color.BLACK),
+    }
+    game.board = board
+    # pinned rook
+    assert game.is_legal(RookMove(Square(Column.E, 2), Square(Column.E, 8)))
+    assert not game.is_legal(RookMove(Square(Column.E, 2), Square(Column.D, 2)))
+    assert not game.is_legal(KingMove(Square(Column.E, 1), Square(Column.E, 3)))
+    assert game.is_legal(ShortCastling(Square(Column.E, 1)))
+    # same answers as the legal moves of the position
+    legal_moves = game.available_moves_list()
+    assert RookMove(Square(Column.E, 2), Square(Column.E, 8)) in legal_moves
+    assert RookMove(Square(Column.E, 2), Square(Column.D, 2)) not in legal_moves
+    assert ShortCastling(Square(Column.E, 1)) in legal_moves
+
+
+def test_iter_legal_moves():
+    """
+    Test the lazy iteration on the legal moves,
+    and the checkmate detection (fool's mate)
+    @return:
+    """
+    game = Game()
+    assert next(game.iter_legal_moves()) == KnightMove(
+        Square(Column.B, 1), Square(Column.A, 3)
+    )
+    assert list(game.iter_legal_moves()) == game.available_moves_list()
+    assert game.has_legal_move()
+    game.apply_move(PawnMove(Square(Column.F, 2), Square(Column.F, 3)))
+    game.apply_move(PawnMove(Square(Column.E, 7), Square(Column.E, 6)))
+    game.apply_move(Pawn2SquareMove(Square(Column.G, 2), Square(Column.G, 4)))
+    assert game.game_state.state == GameState.RUNNING
+    game.apply_move(QueenMove(Square(Column.D, 8), Square(Column.H, 4)))
+    assert not game.has_legal_move()
+    assert game.game_state.state == GameState.BLACK_WIN
+
+
+def test_position():
+    """
+    Test the position snapshot: hash, equality, immutability, pickling,
+    and the legal moves without the historic (en passant)
+    @return:
+    """
+    game = Game()
+    position = game.position()
+    assert position == Position.from_board(Board())
+    assert hash(position) == hash(Position.from_board(Board()))
+    assert position.zobrist_key == game.board.zobrist_key
+    assert pickle.loads(pickle.dumps(position)) == position
+    assert position.legal_moves() == game.available_moves_list()
+    with pytest.raises(AttributeError):
+        position.player = Color.BLACK
+    game.apply_move(Pawn2SquareMove(Square(Column.E, 2), Square(Column.E, 4)))
+    game.apply_move(PawnMove(Square(Column.A, 7), Square(Column.A, 6)))
+    game.apply_move(PawnMove(Square(Column.E, 4), Square(Column.E, 5)))
+    game.apply_move(Pawn2SquareMove(Square(Column.D, 7), Square(Column.D, 5)))
+    position = game.position()
+    assert position != Position.from_board(Board())
+    assert position.en_passant_square == Square(Column.D, 6)
+    assert position.halfmove_clock == 0
+    assert position.zobrist_key == game.board.zobrist_key
+    en_passant = EnPassant(Square(Column.E, 5), Square(Column.D, 6))
+    assert en_passant in position.legal_moves()
+    assert position.legal_moves() == game.available_moves_list()
+    assert position.to_board().piece_dict == game.board.piece_dict
+    loaded_game = pickle.loads(pickle.dumps(game))
+    assert loaded_game.to_fen() == game.to_fen()
+    assert loaded_game.position() == position
+    assert loaded_game.available_moves_list() == game.available_moves_list()
+    loaded_game.apply_move(en_passant)
+    assert loaded_game.board.piece_dict.get(Square(Column.D, 5)) is None
+
+
+def test_legal_move_cache():
+    """
+    Test that a position reached again returns the cached legal moves
+    @return:
+    """
+    game = Game(LegalMoveCache())
+    initial_moves = game.available_moves_list()
+    assert game.legal_move_cache.info().misses == 1
+    for origin, destination in (
+        (Square(Column.G, 1), Square(Column.F, 3)),
+        (Square(Column.G, 8), Square(Column.F, 6)),
+        (Square(Column.F, 3), Square(Column.G, 1)),
+        (Square(Column.F, 6), Square(Column.G, 8)),
+    ):
+        game.apply_move(KnightMove(origin, destination))
+    hits = game.legal_move_cache.info().hits
+    assert game.available_moves_list() == initial_moves
+    assert game.legal_move_cache.info().hits == hits + 1
+    assert game.square_available_moves(
+        Square(Column.B, 1), legal_verification=True
+    ) == [
+        KnightMove(Square(Column.B, 1), Square(Column.A, 3)),
+        KnightMove(Square(Column.B, 1), Square(Column.C, 3)),
+    ]
+
+
+def test_shared_legal_move_cache():
+    """
+    Test that the games share the cache of the legal moves by default:
+    a game rebuilt from a FEN finds the moves of a position seen in another game
+    @return:
+    """
+    assert Game().legal_move_cache is SHARED_LEGAL_MOVE_CACHE
+    legal_move_cache = LegalMoveCache()
+    game = Game(legal_move_cache)
+    game.apply_move(Pawn2SquareMove(Square(Column.E, 2), Square(Column.E, 4)))
+    moves = game.available_moves_list()
+    assert legal_move_cache.info().hits == 0
+    loaded_game = Game.from_fen(game.to_fen(), legal_move_cache)
+    assert loaded_game.available_moves_list() == moves
+    assert legal_move_cache.info().hits == 1
+    loaded_game = pickle.loads(pickle.dumps(Game.from_fen(game.to_fen())))
+    assert loaded_game.legal_move_cache is SHARED_LEGAL_MOVE_CACHE
+
+
+def test_legal_move_map():
+    """
+    Test the destinations of each piece, as lists and as bitboards
+    @return:
+    """
+    game = Game()
+    legal_move_map = game.legal_move_map()
+    assert len(legal_move_map) == 10
+    assert legal_move_map[Square(Column.G, 1)] == [
+        Square(Column.F, 3),
+        Square(Column.H, 3),
+    ]
+    assert game.destination_mask(Square(Column.E, 2)) == (1 << 20) | (1 << 28)
+    assert game.destination_mask(Square(Column.E, 1)) == 0
+    game.apply_move(Pawn2SquareMove(Square(Column.E, 2), Square(Column.E, 4)))
+    # The map of the new position, for black
+    assert Square(Column.G, 1) not in game.legal_move_map()
+    assert game.destination_mask(Square(Column.G, 8)) == (1 << 45) | (1 << 47)
+
+
+def test_position_from_fen():
+    """
+    Test the FEN parsing of a position
+    @return:
+    """
+    assert Position.from_fen(
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+    ) == Position.from_board(Board())
+    position = Position.from_fen(
+        "rnbqkbnr/ppp1pppp/8/3pP3/8/8/PPPP1PPP/RNBQKBNR w Kq d6 3 3"
+    )
+    assert position.player == Color.WHITE
+    assert position.en_passant_square == Square(Column.D, 6)
+    assert position.castling_rights == 0b1001
+    assert position.halfmove_clock == 3
+    # No pawn can take en passant, no rook in H1
+    position = Position.from_fen(
+        "rnbqkbnr/ppp1pppp/8/3p4/8/8/PPPPPPPP/RNBQKBN1 w KQkq d6 0 2"
+    )
+    assert position.en_passant_square is None
+    assert position.castling_rights == 0b1110
+    # No black pawn in E5, or the pawn did not come from E7
+    for fen in (
+        "4k3/8/8/3P4/8/8/8/4K3 w - e6 0 1",
+        "4k3/4p3/8/3Pp3/8/8/8/4K3 w - e6 0 1",
+        "4k3/8/4n3/3Pp3/8/8/8/4K3 w - e6 0 1",
+    ):
+        assert Position.from_fen(fen).en_passant_square is None
+    for fen in (
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP w KQkq - 0 1",
+        "rnbqkbnr/pppppppp/9/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR x KQkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq e4 0 1",
+        "rnbq1bnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQ - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBKKBNR w kq - 0 1",
+        "4k2P/8/8/8/8/8/8/4K3 w - - 0 1",
+        "4k3/8/8/8/8/8/8/p3K3 w - - 0 1",
+        "4k3/8/8/8/8/8/8/4K3 w - - \u0663 1",
+    ):
+        with pytest.raises(FenError):
+            Position.from_fen(fen)
+
+
+def test_fen():
+    """
+    Test the FEN serialization of a game, and the games loaded from a FEN
+    (en passant, castling, clocks)
+    @return:
+    """
+    game = Game()
+    assert game.to_fen() == "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+    for move in (
+        Pawn2SquareMove(Square(Column.E, 2), Square(Column.E, 4)),
+        PawnMove(Square(Column.A, 7), Square(Column.A, 6)),
+        PawnMove(Square(Column.E, 4), Square(Column.E, 5)),
+        Pawn2SquareMove(Square(Column.D, 7), Square(Column.D, 5)),
+    ):
+        game.apply_move(move)
+    fen = "rnbqkbnr/1pp1pppp/p7/3pP3/8/8/PPPP1PPP/RNBQKBNR w KQkq d6 0 3"
+    assert game.to_fen() == fen
+    loaded_game = Game.from_fen(fen)
+    assert loaded_game.to_fen() == fen
+    assert loaded_game.position() == game.position()
+    assert loaded_game.available_moves_list() == game.available_moves_list()
+    # The en passant square is kept by the board: no move added to the historic
+    assert list(loaded_game.game_historic.move_historic) == [EmptyMove()]
+    assert loaded_game.board.en_passant_square == Square(Column.D, 6)
+    loaded_game.apply_move(EnPassant(Square(Column.E, 5), Square(Column.D, 6)))
+    assert (
+        loaded_game.to_fen()
+        == "rnbqkbnr/1pp1pppp/p2P4/8/8/8/PPPP1PPP/RNBQKBNR b KQkq - 0 3"
+    )
+    # Castling rights and clocks
+    fen = "r3k2r/8/8/8/8/8/8/R3K2R w Kq - 5 20"
+    game = Game.from_fen(fen)
+    assert game.to_fen() == fen
+    assert game.white_castling_state.castling_flags == (False, True)
+    assert ShortCastling(Square(Column.E, 1)) in game.available_moves_list()
+    game.apply_move(KingMove(Square(Column.E, 1), Square(Column.D, 1)))
+    assert game.to_fen() == "r3k2r/8/8/8/8/8/8/R2K3R b q - 6 20"
+    with pytest.raises(FenError):
+        Game.from_fen("r3k2r/8/8/8/8/8/8/R3K2R w Kq - 5 0")
+    with pytest.raises(FenError):
+        Game.from_fen("r3k2r/8/8/8/8/8/8/R3K2R w Kq - 5 \u0663")
+    # Checkmate in the loaded position (not a check with an escape square)
+    game = Game.from_fen("7k/6Q1/6K1/8/8/8/8/8 b - - 0 1")
+    assert game.game_state.state == GameState.WHITE_WIN
+    game = Game.from_fen("6rk/5Npp/8/8/8/8/8/K7 b - - 0 1")
+    assert game.game_state.state == GameState.WHITE_WIN
+    game = Game.from_fen("8/8/8/8/8/4qk2/8/4K3 w - - 0 1")
+    assert game.game_state.state == GameState.RUNNING
+    # En passant square without a pawn that has moved of 2 squares: dropped
+    game = Game.from_fen("4k3/8/8/3P4/8/8/8/4K3 w - e6 0 1")
+    assert game.to_fen() == "4k3/8/8/3P4/8/8/8/4K3 w - - 0 1"
+    assert not any(isinstance(move, EnPassant) for move in game.available_moves_list())
+
+
+def test_legal_move_cache_castling():
+    """
+    Test that the cached moves use the castling rights of the position key:
+    the rooks went back to their squares, then the king moved, same key
+    @return:
+    """
+    game = Game.from_fen("r3k2r/8/8/8/8/8/8/4K3 w kq - 0 1")
+    king_moves = (
+        KingMove(Square(Column.E, 1), Square(Column.E, 2)),
+        KingMove(Square(Column.E, 2), Square(Column.E, 1)),
+    )
+    for black_move in (
+        RookMove(Square(Column.A, 8), Square(Column.A, 7)),
+        RookMove(Square(Column.A, 7), Square(Column.A, 8)),
+        RookMove(Square(Column.H, 8), Square(Column.H, 7)),
+        RookMove(Square(Column.H, 7), Square(Column.H, 8)),
+    ):
+        game.apply_move(king_moves[0])
+        game.apply_move(black_move)
+        king_moves = king_moves[::-1]
+    game.apply_move(king_moves[0])
+    short_castling = ShortCastling(Square(Column.E, 8))
+    assert short_castling not in game.available_moves_list()
+    assert game.available_moves_list() == game.position().legal_moves()
+    game.apply_move(KingMove(Square(Column.E, 8), Square(Column.F, 8)))
+    game.apply_move(king_moves[1])
+    game.apply_move(KingMove(Square(Column.F, 8), Square(Column.E, 8)))
+    game.apply_move(king_moves[0])
+    assert short_castling not in game.available_moves_list()
+    game.legal_move_cache.clear()
+    assert short_castling not in game.available_moves_list()
+
+
+def test_castling_flags():
+    """
+    Test the castling flags of the players: the rook in H of black,
+    and the castling moves
+    @return:
+    """
+    game = Game.from_fen("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1")
+    game.apply_move(ShortCastling(Square(Column.E, 1)))
+    assert game.white_castling_state.castling_flags == (False, False)
+    game.apply_move(RookMove(Square(Column.H, 8), Square(Column.H, 7)))
+    assert game.black_castling_state.castling_flags == (True, False)
+    game.apply_move(KingMove(Square(Column.G, 1), Square(Column.G, 2)))
+    game.apply_move(RookMove(Square(Column.H, 7), Square(Column.H, 8)))
+    assert game.to_fen().split()[2] == "q"
+
+
+def test_position_legal_moves_random_games():
+    """
+    Test that the position snapshot and the game give the same legal moves
+    along random games
+    @return:
+    """
+    for seed in range(5):
+        rng = random.Random(seed)
+        game = Game()
+        while (
+            game.game_state.state == GameState.RUNNING
+            and len(game.game_historic.move_historic) < 100
+        ):
+            moves = game.available_moves_list()
+            assert set(moves) == set(game.position().legal_moves())
+            game.apply_move(rng.choice(moves))
@@ -0,0 +1,117 @@
+"""
+Tests for perft (leaf nodes of the legal move tree)
+"""
+import pytest
+
+from app.perft import main
+from app.src.model.classes.const.column import Column
+from app.src.model.classes.square import Square
+from app.src.model.events.moves.pawn_2_square_move import Pawn2SquareMove
+from app.src.model.game.game import Game
+from app.src.model.game.perft import REFERENCE_POSITIONS, perft, perft_divide
+from app.src.model.game.perft_table import PerftTable
+from app.src.model.states.position import Position
+
+
+@pytest.mark.parametrize("name,fen,counts", REFERENCE_POSITIONS)
+def test_perft_reference_positions(name, fen, counts):
+    """
+    Test the known counts of the reference positions (up to depth 2)
+    @return:
+    """
+    position = Position.from_fen(fen)
+    for depth in (1, 2):
+        if depth in counts:
+            assert perft(position, depth) == counts[depth], name
+
+
+@pytest.mark.parametrize(
+    "fen",
+    (
+        # pins, en passant, castling
+        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+        # check, promotions
+        "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+        # en passant that uncovers a check on the row
+        "8/8/8/KPp4r/8/8/8/4k3 w - c6 0 1",
+        # double check
+        "4k3/8/8/8/8/5n2/8/r3K3 w - - 0 1",
+    ),
+)
+def test_count_legal_moves(fen):
+    """
+    Test that the count of the legal moves is the number of legal moves
+    @return:
+    """
+    position = Position.from_fen(fen)
+    assert position.count_legal_moves() == len(position.legal_moves())
+
+
+def test_perft_divide():
+    """
+    Test the divide counts, and perft on a game
+    @return:
+    """
+    game = Game()
+    divide = perft_divide(game, 3)
+    assert len(divide) == 20
+    assert sum(divide.values()) == 8902
+    assert divide[Pawn2SquareMove(Square(Column.E, 2), Square(Column.E, 4))] == 600
+    game.apply_move(Pawn2SquareMove(Square(Column.E, 2), Square(Column.E, 4)))
+    assert perft(game, 2) == 600
+    assert perft(game, 0) == 1
+    # The game is not modified
+    assert game.position() == Position.from_fen(
+        "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1"
+    )
+
+
+def test_perft_workers():
+    """
+    Test that the counts split between processes are merged by root move
+    @return:
+    """
+    position = Position.from_fen(REFERENCE_POSITIONS[1][1])
+    divide = perft_divide(position, 2)
+    assert perft_divide(position, 2, workers=2) == divide
+    assert perft_divide(position, 3, workers=2, split_depth=2) == perft_divide(
+        position, 3
+    )
+    assert perft(Game(), 3, workers=2) == 8902
+
+
+def test_perft_table():
+    """
+    Test that the counts read in the table are right,
+    even in a tiny table where the positions replace each other
+    @return:
+    """
+    position = Position.from_fen(REFERENCE_POSITIONS[1][1])
+    for replacement in ("depth", "always"):
+        for memory_mb in (1, 0.0001):
+            table = PerftTable(memory_mb, replacement)
+            assert perft(position, 3, table=table) == 97862
+        assert table.info().size == 4
+    # The transpositions appear after 3 plies
+    position = Position.from_fen(REFERENCE_POSITIONS[2][1])
+    table = PerftTable(1)
+    assert perft(position, 5, table=table) == 674624
+    assert table.info().hit_rate > 0.1
+    assert perft(position, 5, workers=2, table=table) == 674624
+    with pytest.raises(ValueError):
+        PerftTable(1, "never")
+
+
+def test_perft_command(capsys):
+    """
+    Test the perft command
+    @return:
+    """
+    assert main(["--depth", "2"]) == 0
+    output = capsys.readouterr().out
+    assert "E2E4: 20" in output
+    assert "Nodes: 400" in output
+    assert main(["--depth", "3", "--hash", "1"]) == 0
+    assert "Nodes: 8902" in capsys.readouterr().out
+    assert main(["--check", "--depth", "1"]) == 0
+    assert "FAILED" not in capsys.readouterr().out
@@ -1,6 +1,10 @@
 """
 Tests for GameHistoric
 """
+from app.src.model.classes.const.castling_rights import (
+    BLACK_LONG_CASTLING,
+    BLACK_SHORT_CASTLING,
+)
 from app.src.model.classes.const.color import Color
 from app.src.model.classes.const.column import Column
 from app.src.model.classes.pieces.bishop import Bishop
@@ -10,8 +14,12 @@ from app.src.model.classes.pieces.pawn import Pawn
 from app.src.model.classes.pieces.queen import Queen
 from app.src.model.classes.pieces.rook import Rook
 from app.src.model.classes.square import Square
+from app.src.model.events.moves.king_move import KingMove
+from app.src.model.events.moves.knight_move import KnightMove
+from app.src.model.events.moves.pawn_2_square_move import Pawn2SquareMove
 from app.src.model.states.board import Board
 from app.src.model.states.game_historic import GameHistoric
+from app.src.model.states.zobrist import EN_PASSANT_KEYS
 
 
 def test_update_config_history():
@@ -41,5 +49,91 @@ def test_update_config_history():
     board.piece_dict = piece_dict
     game_historic = GameHistoric()
     game_historic.update_historic(move, board)
-    expected_bit_value = 0xD00C00000000000000B000001000E0000002000 << 64
-    assert game_historic.config_historic[expected_bit_value] == 1
+    assert list(game_historic.position_keys) == [board.zobrist_key]
+    assert game_historic.repetition_count == 1
+
+
+def test_repetition_reset():
+    """
+    Test that the repetitions are counted for the same side to move,
+    and that the positions before an irreversible move are dropped
+    @return:
+    """
+    board = Board()
+    game_historic = GameHistoric()
+    knight_moves = (
+        KnightMove(Square(Column.G, 1), Square(Column.F, 3)),
+        KnightMove(Square(Column.G, 8), Square(Column.F, 6)),
+        KnightMove(Square(Column.F, 3), Square(Column.G, 1)),
+        KnightMove(Square(Column.F, 6), Square(Column.G, 8)),
+    )
+    for move in knight_moves * 2:
+        board.make_move(move)
+        game_historic.update_historic(move, board)
+    assert len(game_historic.position_keys) == 8
+    assert game_historic.repetition_count == 2
+    move = Pawn2SquareMove(Square(Column.E, 2), Square(Column.E, 4))
+    board.make_move(move)
+    game_historic.update_historic(move, board)
+    assert list(game_historic.position_keys) == [board.zobrist_key]
+    assert game_historic.repetition_count == 1
+
+
+def test_zobrist_key_incremental():
+    """
+    Test that the zobrist key updated by the moves is the same as the key
+    computed from scratch, and that it is restored by unmake_move
+    @return:
+    """
+    board = Board()
+    initial_key = board.zobrist_key
+    undo_stack = [
+        board.make_move(move)
+        for move in (
+            Pawn2SquareMove(Square(Column.E, 2), Square(Column.E, 4)),
+            KnightMove(Square(Column.G, 8), Square(Column.F, 6)),
+            KingMove(Square(Column.E, 1), Square(Column.E, 2)),
+        )
+    ]
+    reloaded_board = Board()
+    reloaded_board.player = board.player
+    reloaded_board.piece_dict = dict(board.piece_dict)
+    # The king has moved: no more white castling
+    assert board.castling_rights == BLACK_SHORT_CASTLING | BLACK_LONG_CASTLING
+    assert board.castling_rights == reloaded_board.castling_rights
+    assert board.zobrist_key == reloaded_board.zobrist_key
+    for undo in reversed(undo_stack):
+        board.unmake_move(undo)
+    assert board.zobrist_key == initial_key
+
+
+def test_zobrist_key_state():
+    """
+    Test that the key covers the side to move and the en passant column:
+    the same pieces lead to different keys
+    8 | | | | |k| | | |
+    7 | | | | | | | | |
+    6 | | | | | | | | |
+    5 | | | | | | | | |
+    4 | | | | | |p| | |
+    3 | | | | | | | | |
+    2 | | | | |P| | | |
+    1 | | | | |K| | | |
+       A B C D E F G H
+    @return:
+    """
+    board = Board()
+    board.piece_dict = {
+        Square(Column.E, 1): King(Color.WHITE),
+        Square(Column.E, 2): Pawn(Color.WHITE),
+        Square(Column.F, 4): Pawn(Color.BLACK),
+        Square(Column.E, 8): King(Color.BLACK),
+    }
+    board.make_move(Pawn2SquareMove(Square(Column.E, 2), Square(Column.E, 4)))
+    assert board.en_passant_square == Square(Column.E, 3)
+    same_pieces = Board()
+    same_pieces.piece_dict = dict(board.piece_dict)
+    assert same_pieces.zobrist_key != board.zobrist_key
+    same_pieces.player = Color.BLACK
+    same_pieces.piece_dict = dict(board.piece_dict)
+    assert same_pieces.zobrist_key == board.zobrist_key ^ EN_PASSANT_KEYS[4]
@@ -1,6 +1,8 @@
 """
 Tests moves application
 """
+import copy
+
 from app.src.model.classes.const.color import Color
 from app.src.model.classes.const.column import Column
 from app.src.model.classes.pieces.king import King
@@ -272,3 +274,125 @@ def test_apply_short_castling():
     assert Square(Column.E, 1) not in piece_dict
     assert piece_dict[Square(Column.G, 1)] == King(Color.WHITE)
     assert piece_dict[Square(Column.F, 1)] == Rook(Color.WHITE)
+
+
+def test_make_unmake_capture():
+    """
+    Test that a capture is applied and undone on the board
+    8 | | | | | | | | |
+    7 | | | | | | | | |
+    6 | | | | | | | | |
+    5 | | | | | | | | |
+    4 | | | | |r| | | |
+    3 | | | | | | | | |
+    2 | | | | | | | | |
+    1 | | | | |R| | | |
+       A B C D E F G H
+    @return:
+    """
+    board = Board()
+    board.piece_dict = {
+        Square(Column.E, 1): Rook(Color.WHITE),
+        Square(Column.E, 4): Rook(Color.BLACK),
+    }
+    bitboards = copy.deepcopy(board.bitboards)
+    undo = board.make_move(Move(Square(Column.E, 1), Square(Column.E, 4)))
+    assert undo.captured == Rook(Color.BLACK)
+    assert board.piece_dict == {Square(Column.E, 4): Rook(Color.WHITE)}
+    board.unmake_move(undo)
+    assert board.piece_dict == {
+        Square(Column.E, 1): Rook(Color.WHITE),
+        Square(Column.E, 4): Rook(Color.BLACK),
+    }
+    assert board.bitboards == bitboards
+
+
+def test_make_unmake_en_passant():
+    """
+    Test that an en passant is applied and undone on the board
+    8 | | | | | | | | |
+    7 | | | | | | | | |
+    6 | | | | | | | | |
+    5 | | | | |P|p| | |
+    4 | | | | | | | | |
+    3 | | | | | | | | |
+    2 | | | | | | | | |
+    1 | | | | | | | | |
+       A B C D E F G H
+    @return:
+    """
+    board = Board()
+    board.piece_dict = {
+        Square(Column.E, 5): Pawn(Color.WHITE),
+        Square(Column.F, 5): Pawn(Color.BLACK),
+    }
+    undo = board.make_move(EnPassant(Square(Column.E, 5), Square(Column.F, 6)))
+    assert undo.captured == Pawn(Color.BLACK)
+    assert board.piece_dict == {Square(Column.F, 6): Pawn(Color.WHITE)}
+    board.unmake_move(undo)
+    assert board.piece_dict == {
+        Square(Column.E, 5): Pawn(Color.WHITE),
+        Square(Column.F, 5): Pawn(Color.BLACK),
+    }
+    assert board.occupancy[Color.BLACK] == 1 << 37
+
+
+def test_make_unmake_promotion_capture():
+    """
+    Test that a promotion with capture is applied and undone on the board
+    8 | | | | | |r| | |
+    7 | | | | |P| | | |
+       A B C D E F G H
+    @return:
+    """
+    board = Board()
+    board.piece_dict = {
+        Square(Column.E, 7): Pawn(Color.WHITE),
+        Square(Column.F, 8): Rook(Color.BLACK),
+    }
+    undo = board.make_move(
+        QueenPromotionCapture(Square(Column.E, 7), Square(Column.F, 8))
+    )
+    assert board.piece_dict == {Square(Column.F, 8): Queen(Color.WHITE)}
+    assert board.bitboards[Color.WHITE][Pawn] == 0
+    board.unmake_move(undo)
+    assert board.piece_dict == {
+        Square(Column.E, 7): Pawn(Color.WHITE),
+        Square(Column.F, 8): Rook(Color.BLACK),
+    }
+    assert board.bitboards[Color.WHITE][Queen] == 0
+
+
+def test_make_unmake_castling():
+    """
+    Test that the castling are applied and undone on the board
+    8 |r| | | |k| | |r|
+       A B C D E F G H
+    @return:
+    """
+    board = Board()
+    board.piece_dict = {
+        Square(Column.E, 8): King(Color.BLACK),
+        Square(Column.A, 8): Rook(Color.BLACK),
+        Square(Column.H, 8): Rook(Color.BLACK),
+    }
+    undo = board.make_move(LongCastling(Square(Column.E, 8)))
+    assert board.piece_dict == {
+        Square(Column.C, 8): King(Color.BLACK),
+        Square(Column.D, 8): Rook(Color.BLACK),
+        Square(Column.H, 8): Rook(Color.BLACK),
+    }
+    board.unmake_move(undo)
+    undo = board.make_move(ShortCastling(Square(Column.E, 8)))
+    assert board.piece_dict == {
+        Square(Column.A, 8): Rook(Color.BLACK),
+        Square(Column.G, 8): King(Color.BLACK),
+        Square(Column.F, 8): Rook(Color.BLACK),
+    }
+    board.unmake_move(undo)
+    assert board.piece_dict == {
+        Square(Column.E, 8): King(Color.BLACK),
+        Square(Column.A, 8): Rook(Color.BLACK),
+        Square(Column.H, 8): Rook(Color.BLACK),
+    }
+    assert board.get_king(Color.BLACK) == Square(Column.E, 8)
@@ -25,7 +25,7 @@ def test_bishop_move():
     1 | | | | | | | | |
        A B C D E F G H
     No need to do extensive tests, since they are done in the Piece tests
-    (The bishop moves uses _available_square_on_side_line, already completely
+    (The bishop moves uses available_squares_from_attacks, already completely
     tested)
     @return:
     """
@@ -34,7 +34,7 @@ def test_available_king_moves():
     1 | | | | | | | | |
        A B C D E F G H
     No need to do extensive tests, since they are done in the Piece tests
-    (The rook moves uses _available_square_on_side_line, already completely
+    (The rook moves uses available_squares_from_attacks, already completely
     tested)
     @return:
     """
@@ -1,19 +1,33 @@
 """
 Tests for Move classes
 """
+import pytest
+
 from app.src.model.classes.const.color import Color
 from app.src.model.classes.const.column import Column
+from app.src.model.classes.pieces.bishop import Bishop
 from app.src.model.classes.pieces.king import King
+from app.src.model.classes.pieces.knight import Knight
+from app.src.model.classes.pieces.pawn import Pawn
 from app.src.model.classes.pieces.piece import Piece
+from app.src.model.classes.pieces.queen import Queen
 from app.src.model.classes.pieces.rook import Rook
 from app.src.model.classes.square import Square
+from app.src.model.events.event_processor.legality_checker import LegalityChecker
 from app.src.model.events.event_processor.move_processor import (
     is_move_legal,
     square_available_moves_no_castling,
 )
+from app.src.model.events.moves.bishop_move import BishopMove
+from app.src.model.events.moves.en_passant import EnPassant
+from app.src.model.events.moves.king_move import KingMove
+from app.src.model.events.moves.knight_move import KnightMove
 from app.src.model.events.moves.move import Move
+from app.src.model.events.moves.pawn_2_square_move import Pawn2SquareMove
+from app.src.model.events.moves.pawn_move import PawnMove
 from app.src.model.events.moves.rook_move import RookMove
 from app.src.model.states.board import Board
+from app.src.model.states.game_historic import GameHistoric
 
 
 def test_is_legal():
@@ -120,3 +134,159 @@ def test_get_move_with_legal_verification():
         )
         == expected_moves
     )
+
+
+def test_legality_checker_pin():
+    """
+    The bishop in D2 is pinned by the queen in A5: it can only move on the pin ray
+    8 | | | | | | | | |
+    7 | | | | | | | | |
+    6 | | | | | | | | |
+    5 |q| | | | | | | |
+    4 | | | | | | | | |
+    3 | | | | | | | | |
+    2 | | | |B| | | | |
+    1 | | | | |K| | | |
+       A B C D E F G H
+    @return:
+    """
+    piece_dict = {
+        Square(Column.E, 1): King(Color.WHITE),
+        Square(Column.D, 2): Bishop(Color.WHITE),
+        Square(Column.A, 5): Queen(Color.BLACK),
+    }
+    board = Board()
+    board.piece_dict = piece_dict
+    legality_checker = LegalityChecker(Color.WHITE, board)
+    assert not legality_checker.checkers
+    assert legality_checker.pin_rays == {
+        Square(Column.D, 2).index: (1 << Square(Column.D, 2).index)
+        | (1 << Square(Column.C, 3).index)
+        | (1 << Square(Column.B, 4).index)
+        | (1 << Square(Column.A, 5).index)
+    }
+    assert square_available_moves_no_castling(
+        Square(Column.D, 2), board, legal_verification=True
+    ) == [
+        BishopMove(Square(Column.D, 2), Square(Column.C, 3)),
+        BishopMove(Square(Column.D, 2), Square(Column.B, 4)),
+        BishopMove(Square(Column.D, 2), Square(Column.A, 5)),
+    ]
+
+
+def test_legality_checker_check_evasion():
+    """
+    The king is in check by the rook: the knight can only block or capture,
+    and the king can't stay on the rook line
+    8 | | | | |r| | | |
+    7 | | | | | | | | |
+    6 | | | | | | | | |
+    5 | | | | | | | | |
+    4 | | | | | | | | |
+    3 | | | | | | |N| |
+    2 | | | | | | | | |
+    1 | | | | |K| | | |
+       A B C D E F G H
+    @return:
+    """
+    piece_dict = {
+        Square(Column.E, 1): King(Color.WHITE),
+        Square(Column.G, 3): Knight(Color.WHITE),
+        Square(Column.E, 8): Rook(Color.BLACK),
+    }
+    board = Board()
+    board.piece_dict = piece_dict
+    legality_checker = LegalityChecker(Color.WHITE, board)
+    assert legality_checker.checkers == [Square(Column.E, 8)]
+    assert square_available_moves_no_castling(
+        Square(Column.G, 3),
+        board,
+        legal_verification=True,
+        legality_checker=legality_checker,
+    ) == [
+        KnightMove(Square(Column.G, 3), Square(Column.E, 2)),
+        KnightMove(Square(Column.G, 3), Square(Column.E, 4)),
+    ]
+    assert not legality_checker.is_legal(
+        KingMove(Square(Column.E, 1), Square(Column.E, 2))
+    )
+    assert legality_checker.is_legal(KingMove(Square(Column.E, 1), Square(Column.D, 2)))
+
+
+def test_legality_checker_double_check():
+    """
+    The king is in check by the rook and the knight: only the king can move
+    8 | | | | |r| | | |
+    7 | | | | | | | | |
+    6 | | | | | | | | |
+    5 | | | | | | | | |
+    4 | | | | | | | | |
+    3 | | | | | |k| | |
+    2 | | | |Q| | | | |
+    1 | | | | |K| | | |
+       A B C D E F G H
+    @return:
+    """
+    piece_dict = {
+        Square(Column.E, 1): King(Color.WHITE),
+        Square(Column.D, 2): Queen(Color.WHITE),
+        Square(Column.E, 8): Rook(Color.BLACK),
+        Square(Column.F, 3): Knight(Color.BLACK),
+    }
+    board = Board()
+    board.piece_dict = piece_dict
+    assert not square_available_moves_no_castling(
+        Square(Column.D, 2), board, legal_verification=True
+    )
+
+
+def test_legality_checker_en_passant_discovered_check():
+    """
+    The en passant would remove both pawns from the row 5:
+    the rook would give check to the king
+    8 | | | | | | | | |
+    7 | | | | | | | | |
+    6 | | | | | | | | |
+    5 |K| | |P|p| | |r|
+    4 | | | | | | | | |
+    3 | | | | | | | | |
+    2 | | | | | | | | |
+    1 | | | | | | | | |
+       A B C D E F G H
+    @return:
+    """
+    piece_dict = {
+        Square(Column.A, 5): King(Color.WHITE),
+        Square(Column.D, 5): Pawn(Color.WHITE),
+        Square(Column.E, 5): Pawn(Color.BLACK),
+        Square(Column.H, 5): Rook(Color.BLACK),
+    }
+    board = Board()
+    board.piece_dict = piece_dict
+    historic = GameHistoric()
+    historic.move_historic[-1] = Pawn2SquareMove(
+        Square(Column.E, 7), Square(Column.E, 5)
+    )
+    assert EnPassant(
+        Square(Column.D, 5), Square(Column.E, 6)
+    ) in square_available_moves_no_castling(Square(Column.D, 5), board, historic)
+    assert square_available_moves_no_castling(
+        Square(Column.D, 5), board, historic, legal_verification=True
+    ) == [PawnMove(Square(Column.D, 5), Square(Column.D, 6))]
+    assert board.piece_dict == piece_dict
+
+
+def test_move_hash():
+    """
+    Test that the moves are hashable (class, origin and destination),
+    and immutable
+    @return:
+    """
+    move = KnightMove(Square(Column.B, 1), Square(Column.C, 3))
+    moves = {move, KnightMove(Square(Column.B, 1), Square(Column.C, 3))}
+    assert len(moves) == 1
+    assert KnightMove(Square(Column.B, 1), Square(Column.C, 3)) in moves
+    assert BishopMove(Square(Column.B, 1), Square(Column.C, 3)) not in moves
+    assert KnightMove(Square(Column.C, 3), Square(Column.B, 1)) not in moves
+    with pytest.raises(AttributeError):
+        move.destination = Square(Column.A, 3)
@@ -0,0 +1,83 @@
+"""
+Tests of the 16 bits move encoding
+"""
+from app.src.model.classes.const.column import Column
+from app.src.model.classes.square import Square
+from app.src.model.events.moves.empty_move import EmptyMove
+from app.src.model.events.moves.en_passant import EnPassant
+from app.src.model.events.moves.knight_promotion_capture import KnightPromotionCapture
+from app.src.model.events.moves.long_castling import LongCastling
+from app.src.model.events.moves.move_code import (
+    MOVE_CLASSES,
+    MoveArray,
+    decode_move,
+    encode_move,
+    move_code_class,
+)
+from app.src.model.events.moves.pawn_2_square_move import Pawn2SquareMove
+from app.src.model.events.moves.short_castling import ShortCastling
+
+
+def test_encode_decode_move():
+    """
+    Test that every move class goes through the encoding unchanged
+    @return:
+    """
+    for move_class in MOVE_CLASSES:
+        move = move_class.from_squares(Square(Column.B, 7), Square(Column.C, 8))
+        code = encode_move(move)
+        assert 0 <= code < 1 << 16
+        assert move_code_class(code) == move_class
+        assert decode_move(code) == move
+    assert decode_move(encode_move(EmptyMove())) == EmptyMove()
+    assert decode_move(encode_move(ShortCastling(Square(Column.E, 8)))) == (
+        ShortCastling(Square(Column.E, 8))
+    )
+    assert decode_move(encode_move(LongCastling(Square(Column.E, 1)))) == (
+        LongCastling(Square(Column.E, 1))
+    )
+
+
+def test_move_array():
+    """
+    Test that a MoveArray is used as a list of moves
+    @return:
+    """
+    moves = MoveArray([EmptyMove()])
+    moves.append(Pawn2SquareMove(Square(Column.D, 2), Square(Column.D, 4)))
+    moves.extend(
+        (
+            EnPassant(Square(Column.E, 4), Square(Column.D, 3)),
+            KnightPromotionCapture(Square(Column.A, 2), Square(Column.B, 1)),
+        )
+    )
+    assert len(moves) == 4
+    assert moves.codes.itemsize == 2
+    assert moves[1] == Pawn2SquareMove(Square(Column.D, 2), Square(Column.D, 4))
+    moves[-1] = EnPassant(Square(Column.A, 4), Square(Column.B, 3))
+    assert list(moves) == [
+        EmptyMove(),
+        Pawn2SquareMove(Square(Column.D, 2), Square(Column.D, 4)),
+        EnPassant(Square(Column.E, 4), Square(Column.D, 3)),
+        EnPassant(Square(Column.A, 4), Square(Column.B, 3)),
+    ]
+    assert moves.pop() == EnPassant(Square(Column.A, 4), Square(Column.B, 3))
+    assert len(moves) == 3
+
+
+def test_move_array_last_move():
+    """
+    Test that the last move is read without decoding its code
+    @return:
+    """
+    move = Pawn2SquareMove(Square(Column.D, 2), Square(Column.D, 4))
+    moves = MoveArray([EmptyMove()])
+    moves.append(move)
+    assert moves[-1] is move
+    assert moves[1] is move
+    moves[1] = EnPassant(Square(Column.A, 4), Square(Column.B, 3))
+    assert moves[-1] == EnPassant(Square(Column.A, 4), Square(Column.B, 3))
+    moves.pop()
+    assert moves[-1] == EmptyMove()
+    moves.pop()
+    assert len(MoveArray()) == 0
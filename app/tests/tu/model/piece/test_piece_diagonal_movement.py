@@ -5,14 +5,36 @@ from app.src.model.classes.const.color import Color
 from app.src.model.classes.const.column import Column
 from app.src.model.classes.pieces.piece import Piece
 from app.src.model.classes.square import Square
+from app.src.model.events.event_getter.square_getter.slider_attack_tables import (
+    bishop_attacks,
+)
 from app.src.model.events.event_getter.square_getter.utils_available_squares_getter import (
-    available_squares_diagonal_right_up,
-    available_squares_diagonal_right_down,
-    available_squares_diagonal_left_up,
-    available_squares_diagonal_left_down,
+    available_squares_from_attacks,
 )
 from app.src.model.states.board import Board
 
+# (column, row) steps
+RIGHT_UP = (1, 1)
+RIGHT_DOWN = (1, -1)
+LEFT_UP = (-1, 1)
+LEFT_DOWN = (-1, -1)
+
+
+def _diagonal_squares(
+    origin: Square, board: Board, direction: tuple[int, int]
+) -> [Square]:
+    """
+    Return the available squares of a piece that moves in diagonal,
+    in only one direction
+    @param origin:
+    @param board:
+    @param direction: (column, row) step
+    @return:
+    """
+    return available_squares_from_attacks(
+        origin, board, bishop_attacks(origin.index, board.all_occupancy), (direction,)
+    )
+
 
 class TestPiece:
     """
@@ -42,8 +64,7 @@ class TestPiece:
             Square(Column.E, 5),
         ]
         assert (
-            available_squares_diagonal_right_up(Square(Column.D, 4), board)
-            == expected_squares
+            _diagonal_squares(Square(Column.D, 4), board, RIGHT_UP) == expected_squares
         )
 
     def test_available_squares_diagonal_right_up_case2(self):
@@ -70,8 +91,7 @@ class TestPiece:
             Square(Column.F, 6),
         ]
         assert (
-            available_squares_diagonal_right_up(Square(Column.D, 4), board)
-            == expected_squares
+            _diagonal_squares(Square(Column.D, 4), board, RIGHT_UP) == expected_squares
         )
 
     def test_available_squares_diagonal_right_up_case3(self):
@@ -98,8 +118,7 @@ class TestPiece:
             Square(Column.G, 8),
         ]
         assert (
-            available_squares_diagonal_right_up(Square(Column.D, 5), board)
-            == expected_squares
+            _diagonal_squares(Square(Column.D, 5), board, RIGHT_UP) == expected_squares
         )
 
     def test_available_squares_diagonal_right_up_case4(self):
@@ -122,8 +141,7 @@ class TestPiece:
         board.piece_dict = piece_dict
         expected_squares = []
         assert (
-            available_squares_diagonal_right_up(Square(Column.H, 7), board)
-            == expected_squares
+            _diagonal_squares(Square(Column.H, 7), board, RIGHT_UP) == expected_squares
         )
 
     def test_available_squares_diagonal_right_up_case5(self):
@@ -147,8 +165,7 @@ class TestPiece:
         board.piece_dict = piece_dict
         expected_squares = []
         assert (
-            available_squares_diagonal_right_up(Square(Column.D, 4), board)
-            == expected_squares
+            _diagonal_squares(Square(Column.D, 4), board, RIGHT_UP) == expected_squares
         )
 
     def test_available_squares_diagonal_right_down_case1(self):
@@ -174,7 +191,7 @@ class TestPiece:
             Square(Column.E, 3),
         ]
         assert (
-            available_squares_diagonal_right_down(Square(Column.D, 4), board)
+            _diagonal_squares(Square(Column.D, 4), board, RIGHT_DOWN)
             == expected_squares
         )
 
@@ -202,7 +219,7 @@ class TestPiece:
             Square(Column.F, 2),
         ]
         assert (
-            available_squares_diagonal_right_down(Square(Column.D, 4), board)
+            _diagonal_squares(Square(Column.D, 4), board, RIGHT_DOWN)
             == expected_squares
         )
 
@@ -230,7 +247,7 @@ class TestPiece:
             Square(Column.G, 1),
         ]
         assert (
-            available_squares_diagonal_right_down(Square(Column.D, 4), board)
+            _diagonal_squares(Square(Column.D, 4), board, RIGHT_DOWN)
             == expected_squares
         )
 
@@ -254,7 +271,7 @@ class TestPiece:
         board.piece_dict = piece_dict
         expected_squares = []
         assert (
-            available_squares_diagonal_right_down(Square(Column.F, 1), board)
+            _diagonal_squares(Square(Column.F, 1), board, RIGHT_DOWN)
             == expected_squares
         )
 
@@ -279,7 +296,7 @@ class TestPiece:
         board.piece_dict = piece_dict
         expected_squares = []
         assert (
-            available_squares_diagonal_right_down(Square(Column.D, 3), board)
+            _diagonal_squares(Square(Column.D, 3), board, RIGHT_DOWN)
             == expected_squares
         )
 
@@ -306,8 +323,7 @@ class TestPiece:
             Square(Column.C, 5),
         ]
         assert (
-            available_squares_diagonal_left_up(Square(Column.D, 4), board)
-            == expected_squares
+            _diagonal_squares(Square(Column.D, 4), board, LEFT_UP) == expected_squares
         )
 
     def test_available_squares_diagonal_left_up_case2(self):
@@ -334,8 +350,7 @@ class TestPiece:
             Square(Column.B, 6),
         ]
         assert (
-            available_squares_diagonal_left_up(Square(Column.D, 4), board)
-            == expected_squares
+            _diagonal_squares(Square(Column.D, 4), board, LEFT_UP) == expected_squares
         )
 
     def test_available_squares_diagonal_left_up_case3(self):
@@ -362,8 +377,7 @@ class TestPiece:
             Square(Column.A, 7),
         ]
         assert (
-            available_squares_diagonal_left_up(Square(Column.D, 4), board)
-            == expected_squares
+            _diagonal_squares(Square(Column.D, 4), board, LEFT_UP) == expected_squares
         )
 
     def test_available_squares_diagonal_left_up_case4(self):
@@ -386,8 +400,7 @@ class TestPiece:
         board.piece_dict = piece_dict
         expected_squares = []
         assert (
-            available_squares_diagonal_left_up(Square(Column.A, 7), board)
-            == expected_squares
+            _diagonal_squares(Square(Column.A, 7), board, LEFT_UP) == expected_squares
         )
 
     def test_available_squares_diagonal_left_up_case5(self):
@@ -411,8 +424,7 @@ class TestPiece:
         board.piece_dict = piece_dict
         expected_squares = []
         assert (
-            available_squares_diagonal_left_up(Square(Column.D, 4), board)
-            == expected_squares
+            _diagonal_squares(Square(Column.D, 4), board, LEFT_UP) == expected_squares
         )
 
     def test_available_squares_diagonal_left_down_case1(self):
@@ -438,8 +450,7 @@ class TestPiece:
             Square(Column.C, 3),
         ]
         assert (
-            available_squares_diagonal_left_down(Square(Column.D, 4), board)
-            == expected_squares
+            _diagonal_squares(Square(Column.D, 4), board, LEFT_DOWN) == expected_squares
         )
 
     def test_available_squares_diagonal_left_down_case2(self):
@@ -466,8 +477,7 @@ class TestPiece:
             Square(Column.B, 2),
         ]
         assert (
-            available_squares_diagonal_left_down(Square(Column.D, 4), board)
-            == expected_squares
+            _diagonal_squares(Square(Column.D, 4), board, LEFT_DOWN) == expected_squares
         )
 
     def test_available_squares_diagonal_left_down_case3(self):
@@ -494,8 +504,7 @@ class TestPiece:
             Square(Column.A, 1),
         ]
         assert (
-            available_squares_diagonal_left_down(Square(Column.D, 4), board)
-            == expected_squares
+            _diagonal_squares(Square(Column.D, 4), board, LEFT_DOWN) == expected_squares
         )
 
     def test_available_squares_diagonal_left_down_case4(self):
@@ -518,8 +527,7 @@ class TestPiece:
         board.piece_dict = piece_dict
         expected_squares = []
         assert (
-            available_squares_diagonal_left_down(Square(Column.A, 2), board)
-            == expected_squares
+            _diagonal_squares(Square(Column.A, 2), board, LEFT_DOWN) == expected_squares
         )
 
     def test_available_squares_diagonal_left_down_case5(self):
@@ -543,6 +551,5 @@ class TestPiece:
         board.piece_dict = piece_dict
         expected_squares = []
         assert (
-            available_squares_diagonal_left_down(Square(Column.D, 4), board)
-            == expected_squares
+            _diagonal_squares(Square(Column.D, 4), board, LEFT_DOWN) == expected_squares
         )
@@ -5,14 +5,34 @@ from app.src.model.classes.const.color import Color
 from app.src.model.classes.const.column import Column
 from app.src.model.classes.pieces.piece import Piece
 from app.src.model.classes.square import Square
+from app.src.model.events.event_getter.square_getter.slider_attack_tables import (
+    rook_attacks,
+)
 from app.src.model.events.event_getter.square_getter.utils_available_squares_getter import (
-    available_squares_on_right,
-    available_squares_on_left,
-    available_squares_upper,
-    available_squares_below,
+    available_squares_from_attacks,
 )
 from app.src.model.states.board import Board
 
+# (column, row) steps
+RIGHT = (1, 0)
+LEFT = (-1, 0)
+UP = (0, 1)
+DOWN = (0, -1)
+
+
+def _line_squares(origin: Square, board: Board, direction: tuple[int, int]) -> [Square]:
+    """
+    Return the available squares of a piece that moves in line,
+    in only one direction
+    @param origin:
+    @param board:
+    @param direction: (column, row) step
+    @return:
+    """
+    return available_squares_from_attacks(
+        origin, board, rook_attacks(origin.index, board.all_occupancy), (direction,)
+    )
+
 
 class TestMoveAvailableSquare:
     """
@@ -35,9 +55,7 @@ class TestMoveAvailableSquare:
             Square(Column.D, 1),
             Square(Column.E, 1),
         ]
-        assert (
-            available_squares_on_right(Square(Column.C, 1), board) == expected_squares
-        )
+        assert _line_squares(Square(Column.C, 1), board, RIGHT) == expected_squares
 
     def test_available_square_on_right_case2(self):
         """
@@ -56,9 +74,7 @@ class TestMoveAvailableSquare:
             Square(Column.E, 1),
             Square(Column.F, 1),
         ]
-        assert (
-            available_squares_on_right(Square(Column.C, 1), board) == expected_squares
-        )
+        assert _line_squares(Square(Column.C, 1), board, RIGHT) == expected_squares
 
     def test_available_square_on_right_case3(self):
         """
@@ -78,9 +94,7 @@ class TestMoveAvailableSquare:
             Square(Column.G, 1),
             Square(Column.H, 1),
         ]
-        assert (
-            available_squares_on_right(Square(Column.C, 1), board) == expected_squares
-        )
+        assert _line_squares(Square(Column.C, 1), board, RIGHT) == expected_squares
 
     def test_available_square_on_right_case4(self):
         """
@@ -94,9 +108,7 @@ class TestMoveAvailableSquare:
         board = Board()
         board.piece_dict = piece_dict
         expected_squares = []
-        assert (
-            available_squares_on_right(Square(Column.H, 1), board) == expected_squares
-        )
+        assert _line_squares(Square(Column.H, 1), board, RIGHT) == expected_squares
 
     def test_available_square_on_right_case5(self):
         """
@@ -111,9 +123,7 @@ class TestMoveAvailableSquare:
         board = Board()
         board.piece_dict = piece_dict
         expected_squares = []
-        assert (
-            available_squares_on_right(Square(Column.C, 1), board) == expected_squares
-        )
+        assert _line_squares(Square(Column.C, 1), board, RIGHT) == expected_squares
 
     def test_available_square_on_left_case1(self):
         """
@@ -131,7 +141,7 @@ class TestMoveAvailableSquare:
             Square(Column.E, 1),
             Square(Column.D, 1),
         ]
-        assert available_squares_on_left(Square(Column.F, 1), board) == expected_squares
+        assert _line_squares(Square(Column.F, 1), board, LEFT) == expected_squares
 
     def test_available_square_on_left_case2(self):
         """
@@ -150,7 +160,7 @@ class TestMoveAvailableSquare:
             Square(Column.D, 1),
             Square(Column.C, 1),
         ]
-        assert available_squares_on_left(Square(Column.F, 1), board) == expected_squares
+        assert _line_squares(Square(Column.F, 1), board, LEFT) == expected_squares
 
     def test_available_square_on_left_case3(self):
         """
@@ -167,7 +177,7 @@ class TestMoveAvailableSquare:
             Square(Column.B, 1),
             Square(Column.A, 1),
         ]
-        assert available_squares_on_left(Square(Column.C, 1), board) == expected_squares
+        assert _line_squares(Square(Column.C, 1), board, LEFT) == expected_squares
 
     def test_available_square_on_left_case4(self):
         """
@@ -181,7 +191,7 @@ class TestMoveAvailableSquare:
         board = Board()
         board.piece_dict = piece_dict
         expected_squares = []
-        assert available_squares_on_left(Square(Column.A, 1), board) == expected_squares
+        assert _line_squares(Square(Column.A, 1), board, LEFT) == expected_squares
 
     def test_available_square_on_left_case5(self):
         """
@@ -196,7 +206,7 @@ class TestMoveAvailableSquare:
         board = Board()
         board.piece_dict = piece_dict
         expected_squares = []
-        assert available_squares_on_left(Square(Column.D, 1), board) == expected_squares
+        assert _line_squares(Square(Column.D, 1), board, LEFT) == expected_squares
 
     def test_available_square_upper_case1(self):
         """
@@ -222,7 +232,7 @@ class TestMoveAvailableSquare:
             Square(Column.A, 4),
             Square(Column.A, 5),
         ]
-        assert available_squares_upper(Square(Column.A, 2), board) == expected_squares
+        assert _line_squares(Square(Column.A, 2), board, UP) == expected_squares
 
     def test_available_square_upper_case2(self):
         """
@@ -249,7 +259,7 @@ class TestMoveAvailableSquare:
             Square(Column.A, 5),
             Square(Column.A, 6),
         ]
-        assert available_squares_upper(Square(Column.A, 2), board) == expected_squares
+        assert _line_squares(Square(Column.A, 2), board, UP) == expected_squares
 
     def test_available_square_upper_case3(self):
         """
@@ -277,7 +287,7 @@ class TestMoveAvailableSquare:
             Square(Column.A, 7),
             Square(Column.A, 8),
         ]
-        assert available_squares_upper(Square(Column.A, 2), board) == expected_squares
+        assert _line_squares(Square(Column.A, 2), board, UP) == expected_squares
 
     def test_available_square_upper_case4(self):
         """
@@ -298,7 +308,7 @@ class TestMoveAvailableSquare:
         board = Board()
         board.piece_dict = piece_dict
         expected_squares = []
-        assert available_squares_upper(Square(Column.A, 8), board) == expected_squares
+        assert _line_squares(Square(Column.A, 8), board, UP) == expected_squares
 
     def test_available_square_upper_case5(self):
         """
@@ -320,7 +330,7 @@ class TestMoveAvailableSquare:
         board = Board()
         board.piece_dict = piece_dict
         expected_squares = []
-        assert available_squares_upper(Square(Column.A, 2), board) == expected_squares
+        assert _line_squares(Square(Column.A, 2), board, UP) == expected_squares
 
     def test_available_square_below_case1(self):
         """
@@ -346,7 +356,7 @@ class TestMoveAvailableSquare:
             Square(Column.A, 4),
             Square(Column.A, 3),
         ]
-        assert available_squares_below(Square(Column.A, 6), board) == expected_squares
+        assert _line_squares(Square(Column.A, 6), board, DOWN) == expected_squares
 
     def test_available_square_below_case2(self):
         """
@@ -373,7 +383,7 @@ class TestMoveAvailableSquare:
             Square(Column.A, 3),
             Square(Column.A, 2),
         ]
-        assert available_squares_below(Square(Column.A, 6), board) == expected_squares
+        assert _line_squares(Square(Column.A, 6), board, DOWN) == expected_squares
 
     def test_available_square_below_case3(self):
         """
@@ -396,7 +406,7 @@ class TestMoveAvailableSquare:
         expected_squares = [
             Square(Column.A, 1),
         ]
-        assert available_squares_below(Square(Column.A, 2), board) == expected_squares
+        assert _line_squares(Square(Column.A, 2), board, DOWN) == expected_squares
 
     def test_available_square_below_case4(self):
         """
@@ -417,7 +427,7 @@ class TestMoveAvailableSquare:
         board = Board()
         board.piece_dict = piece_dict
         expected_squares = []
-        assert available_squares_below(Square(Column.A, 1), board) == expected_squares
+        assert _line_squares(Square(Column.A, 1), board, DOWN) == expected_squares
 
     def test_available_square_below_case5(self):
         """
@@ -439,4 +449,4 @@ class TestMoveAvailableSquare:
         board = Board()
         board.piece_dict = piece_dict
         expected_squares = []
-        assert available_squares_below(Square(Column.A, 3), board) == expected_squares
+        assert _line_squares(Square(Column.A, 3), board, DOWN) == expected_squares
@@ -1,6 +1,8 @@
 """
 Tests for the functions in utils.py
 """
+import pickle
+
 import pytest
 
 from app.src.exceptions.missing_king_error import MissingKingError
@@ -13,51 +15,52 @@ from app.src.model.classes.pieces.pawn import Pawn
 from app.src.model.classes.pieces.queen import Queen
 from app.src.model.classes.pieces.rook import Rook
 from app.src.model.classes.square import Square
+from app.src.model.events.moves.king_move import KingMove
+from app.src.model.events.moves.knight_move import KnightMove
+from app.src.model.events.moves.pawn_2_square_move import Pawn2SquareMove
+from app.src.model.events.moves.pawn_move import PawnMove
+from app.src.model.events.moves.short_castling import ShortCastling
+from app.src.model.events.moves.queen_promotion_capture import QueenPromotionCapture
 from app.src.model.states.board import Board
+from app.src.model.states.material import material_key
 
 
-def test_update_config_history():
+def test_get_king():
     """
-    Test the method update_config_history
-    8 | | | | | | | | |
-    7 | | | | | | | | |
-    6 | | | | |R| | | |
-    5 | |P| | | |k| | |
-    4 | | | |N| | | | |
-    3 | | | | | | | | |
-    2 | |Q| | |b| | | |
-    1 | | | | | | | | |
-       A B C D  E F G H
-    @return: None
+    test the method is test_is_king_in_check in check
+    when the king is in check
+    @return:
     """
     piece_dict = {
-        Square(Column.D, 4): Knight(Color.WHITE),
-        Square(Column.E, 6): Rook(Color.WHITE),
-        Square(Column.F, 5): King(Color.BLACK),
-        Square(Column.E, 2): Bishop(Color.BLACK),
-        Square(Column.B, 5): Pawn(Color.WHITE),
-        Square(Column.B, 2): Queen(Color.WHITE),
+        Square(Column.E, 1): King(Color.WHITE),
+        Square(Column.E, 8): King(Color.BLACK),
     }
     board = Board()
     board.piece_dict = piece_dict
-    expected_bit_value = 0xD00C00000000000000B000001000E0000002000 << 64
-    assert board.dict_to_bit() == expected_bit_value
+    assert Square(Column.E, 1) == board.get_king(Color.WHITE)
+    assert Square(Column.E, 8) == board.get_king(Color.BLACK)
 
 
-def test_get_king():
+def test_get_king_after_moves():
     """
-    test the method is test_is_king_in_check in check
-    when the king is in check
+    Test that the king squares follow the moves applied and undone
     @return:
     """
     piece_dict = {
         Square(Column.E, 1): King(Color.WHITE),
+        Square(Column.H, 1): Rook(Color.WHITE),
         Square(Column.E, 8): King(Color.BLACK),
     }
     board = Board()
     board.piece_dict = piece_dict
-    assert Square(Column.E, 1) == board.get_king(Color.WHITE)
-    assert Square(Column.E, 8) == board.get_king(Color.BLACK)
+    castling_undo = board.make_move(ShortCastling(Square(Column.E, 1)))
+    assert board.get_king(Color.WHITE) == Square(Column.G, 1)
+    king_undo = board.make_move(KingMove(Square(Column.E, 8), Square(Column.D, 7)))
+    assert board.get_king(Color.BLACK) == Square(Column.D, 7)
+    board.unmake_move(king_undo)
+    board.unmake_move(castling_undo)
+    assert board.get_king(Color.WHITE) == Square(Column.E, 1)
+    assert board.get_king(Color.BLACK) == Square(Column.E, 8)
 
 
 def test_get_king_no_king():
@@ -178,3 +181,135 @@ def test_bishop_not_in_dead_position_invalid_position():
     board = Board()
     board.piece_dict = piece_dict
     assert not board.are_bishop_in_dead_position()
+
+
+def test_initial_bitboards():
+    """
+    Test that the bitboards of the initial config are built
+    @return:
+    """
+    board = Board()
+    assert board.bitboards[Color.WHITE][Pawn] == 0xFF00
+    assert board.bitboards[Color.BLACK][Pawn] == 0xFF << 48
+    assert board.bitboards[Color.WHITE][King] == 1 << 4
+    assert board.bitboards[Color.BLACK][Rook] == 0x81 << 56
+    assert board.occupancy[Color.WHITE] == 0xFFFF
+    assert board.occupancy[Color.BLACK] == 0xFFFF << 48
+    assert board.all_occupancy == 0xFFFF00000000FFFF
+
+
+def test_piece_dict_read_only():
+    """
+    Test that piece_dict can't be modified directly
+    @return:
+    """
+    board = Board()
+    with pytest.raises(TypeError):
+        board.piece_dict[Square(Column.E, 4)] = Pawn(Color.WHITE)
+
+
+def test_move_piece():
+    """
+    Test that moving a piece updates the piece_dict and the bitboards
+    8 | | | | | | | | |
+    7 | | | | | | | | |
+    6 | | | | | | | | |
+    5 | | | | | | | | |
+    4 | | | | |r| | | |
+    3 | | | | | | | | |
+    2 | | | | | | | | |
+    1 | | | | |R| | | |
+       A B C D E F G H
+    @return:
+    """
+    board = Board()
+    board.piece_dict = {
+        Square(Column.E, 1): Rook(Color.WHITE),
+        Square(Column.E, 4): Rook(Color.BLACK),
+    }
+    captured = board.move_piece(Square(Column.E, 1), Square(Column.E, 4))
+    assert captured == Rook(Color.BLACK)
+    assert board.piece_dict == {Square(Column.E, 4): Rook(Color.WHITE)}
+    assert board.bitboards[Color.WHITE][Rook] == 1 << 28
+    assert board.bitboards[Color.BLACK][Rook] == 0
+    assert board.occupancy[Color.BLACK] == 0
+    assert board.move_piece(Square(Column.E, 4), Square(Column.E, 5)) is None
+    assert board.all_occupancy == 1 << 36
+
+
+def test_piece_squares():
+    """
+    Test the iteration on the pieces of a color (and of a type)
+    @return:
+    """
+    board = Board()
+    assert list(board.piece_squares(Color.WHITE, Knight)) == [
+        Square(Column.B, 1),
+        Square(Column.G, 1),
+    ]
+    assert len(list(board.piece_squares(Color.BLACK))) == 16
+    assert board.piece_count(Color.BLACK, Pawn) == 8
+    board.make_move(KnightMove(Square(Column.B, 1), Square(Column.C, 3)))
+    assert list(board.piece_squares(Color.WHITE, Knight)) == [
+        Square(Column.G, 1),
+        Square(Column.C, 3),
+    ]
+
+
+def test_material_key():
+    """
+    Test that the material key follows the captures and the promotions
+    8 | | | | | |n| | |
+    7 | | | | |P| | | |
+    6 | | | | | | | | |
+    5 | | | | | | | | |
+    4 | | | | | | | | |
+    3 | | | | | | | | |
+    2 | | | | | | | | |
+    1 |k| | | | | | |K|
+       A B C D E F G H
+    @return:
+    """
+    board = Board()
+    board.piece_dict = {
+        Square(Column.H, 1): King(Color.WHITE),
+        Square(Column.E, 7): Pawn(Color.WHITE),
+        Square(Column.A, 1): King(Color.BLACK),
+        Square(Column.F, 8): Knight(Color.BLACK),
+    }
+    initial_key = board.material_key
+    assert initial_key == material_key(
+        {Color.WHITE: [King, Pawn], Color.BLACK: [King, Knight]}
+    )
+    undo = board.make_move(
+        QueenPromotionCapture(Square(Column.E, 7), Square(Column.F, 8))
+    )
+    assert board.material_key == material_key(
+        {Color.WHITE: [King, Queen], Color.BLACK: [King]}
+    )
+    board.unmake_move(undo)
+    assert board.material_key == initial_key
+
+
+def test_pickle():
+    """
+    Test that a board can be pickled, with its position state
+    (en passant square, castling rights, zobrist key)
+    @return:
+    """
+    board = Board()
+    board.make_move(Pawn2SquareMove(Square(Column.E, 2), Square(Column.E, 4)))
+    board.make_move(PawnMove(Square(Column.A, 7), Square(Column.A, 6)))
+    board.make_move(PawnMove(Square(Column.E, 4), Square(Column.E, 5)))
+    board.make_move(Pawn2SquareMove(Square(Column.D, 7), Square(Column.D, 5)))
+    board.make_move(KingMove(Square(Column.E, 1), Square(Column.E, 2)))
+    loaded_board = pickle.loads(pickle.dumps(board))
+    assert loaded_board.piece_dict == board.piece_dict
+    assert loaded_board.bitboards == board.bitboards
+    assert loaded_board.player == board.player
+    assert loaded_board.castling_rights == board.castling_rights
+    assert loaded_board.en_passant_square == board.en_passant_square
+    assert loaded_board.zobrist_key == board.zobrist_key
+    assert loaded_board.material_key == board.material_key
+    with pytest.raises(TypeError):
+        loaded_board.piece_dict[Square(Column.E, 4)] = Pawn(Color.WHITE)
@@ -0,0 +1,57 @@
+"""
+Tests for the LRU cache of the legal moves
+"""
+from app.src.model.classes.const.column import Column
+from app.src.model.classes.square import Square
+from app.src.model.events.moves.knight_move import KnightMove
+from app.src.model.states.legal_move_cache import LegalMoveCache
+from app.src.model.states.legal_move_index import LegalMoveIndex
+
+
+def _legal_moves(count: int) -> LegalMoveIndex:
+    """
+    Build an index of count knight moves
+    @param count:
+    @return:
+    """
+    return LegalMoveIndex(
+        [
+            KnightMove(Square(Column.B, 1), Square.from_index(index))
+            for index in range(16, 16 + count)
+        ]
+    )
+
+
+def test_legal_move_cache_lru():
+    """
+    Test the counters and the eviction of the least recently used position
+    @return:
+    """
+    cache = LegalMoveCache(maxsize=2)
+    first, second, third = _legal_moves(1), _legal_moves(2), _legal_moves(3)
+    assert cache.get((1,)) is None
+    cache.put((1,), first)
+    cache.put((2,), second)
+    assert cache.get((1,)) is first
+    cache.put((3,), third)
+    # (2,) is the least recently used
+    assert cache.peek((2,)) is None
+    assert cache.get((1,)) is first
+    assert cache.get((3,)) is third
+    assert cache.info() == (3, 1, 2, 2, 4)
+
+
+def test_legal_move_cache_memory_cap():
+    """
+    Test the eviction when too many moves are stored
+    @return:
+    """
+    cache = LegalMoveCache(max_moves=5)
+    cache.put((1,), _legal_moves(3))
+    cache.put((2,), _legal_moves(2))
+    assert len(cache) == 2
+    cache.put((3,), _legal_moves(1))
+    assert cache.peek((1,)) is None
+    assert cache.info().moves == 3
+    cache.clear()
+    assert cache.info() == (0, 0, 1024, 0, 0)
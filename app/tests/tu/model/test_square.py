@@ -1,6 +1,12 @@
 """
 Unit tests for the Square classes
 """
+import copy
+import pickle
+
+import pytest
+
+from app.src.exceptions.row_error import RowError
 from app.src.model.classes.const.color import Color
 from app.src.model.classes.const.column import Column
 from app.src.model.classes.square import Square
@@ -28,3 +34,27 @@ def test_square_color():
     assert Square(Column.A, 2).square_color() == Color.WHITE
     assert Square(Column.B, 3).square_color() == Color.WHITE
     assert Square(Column.D, 6).square_color() == Color.BLACK
+
+
+def test_square_interned():
+    """
+    Test that a square is built once, and reachable by coordinates or index
+    @return:
+    """
+    assert Square(Column.C, 4) is Square(Column.C, 4)
+    assert Square.from_index(26) is Square(Column.C, 4)
+    assert Square(Column.H, 8).index == 63
+    assert copy.deepcopy(Square(Column.C, 4)) is Square(Column.C, 4)
+    assert pickle.loads(pickle.dumps(Square(Column.C, 4))) is Square(Column.C, 4)
+
+
+def test_square_immutable():
+    """
+    Test that the coordinates of a square can't be modified,
+    and that a square outside the board can't be built
+    @return:
+    """
+    with pytest.raises(AttributeError):
+        Square(Column.A, 1).row = 2
+    with pytest.raises(RowError):
+        Square(Column.A, 9)
@@ -2,11 +2,39 @@
 Tests for utils
 To moves or rename properly.
 """
+import random
+
 from app.src.model.classes.const.color import Color
 from app.src.model.classes.const.column import Column
 from app.src.model.classes.pieces.bishop import Bishop
+from app.src.model.classes.pieces.king import King
+from app.src.model.classes.pieces.knight import Knight
+from app.src.model.classes.pieces.pawn import Pawn
+from app.src.model.classes.pieces.queen import Queen
 from app.src.model.classes.pieces.rook import Rook
 from app.src.model.classes.square import Square
+from app.src.model.events.event_getter.square_getter.attackers_getter import (
+    attackers_to,
+)
+from app.src.model.events.event_getter.square_getter.leaper_tables import (
+    KING_ATTACKS,
+    KNIGHT_ATTACKS,
+    KNIGHT_SQUARES,
+    PAWN_ATTACKS,
+)
+from app.src.model.events.event_getter.square_getter.ray_tables import (
+    DIAGONAL_DIRECTIONS,
+    LINE_DIRECTIONS,
+    RAY_MASKS,
+    RAY_SQUARES,
+    first_blocker,
+)
+from app.src.model.events.event_getter.square_getter.slider_attack_tables import (
+    bishop_attacks,
+    queen_attacks,
+    rook_attacks,
+    sliding_attacks,
+)
 from app.src.model.events.event_processor.move_processor import is_square_in_check
 from app.src.model.states.board import Board
 
@@ -73,3 +101,163 @@ def test_is_square_not_in_check2():
     board = Board()
     board.piece_dict = piece_dict
     assert not is_square_in_check(Color.WHITE, Square(Column.D, 4), board)
+
+
+def test_attackers_to():
+    """
+    8 | | | | | | |b| |
+    7 | | | |r| | | | |
+    6 | | | |P| |k| | |
+    5 | | | |X|p| | | |
+    4 | | | | | | | | |
+    3 | | | |q| | | | |
+    2 | | | | | | | | |
+    1 |q| | | | | | | |
+       A B C D E F G H
+    The rook is blocked by the pawn, the pawn in E5 does not attack D5
+    (black pawns attack downward), the queen in A1 is on another diagonal
+    @return:
+    """
+    piece_dict = {
+        Square(Column.D, 7): Rook(Color.BLACK),
+        Square(Column.D, 6): Pawn(Color.WHITE),
+        Square(Column.F, 6): Knight(Color.BLACK),
+        Square(Column.E, 5): Pawn(Color.BLACK),
+        Square(Column.G, 8): Bishop(Color.BLACK),
+        Square(Column.D, 3): Queen(Color.BLACK),
+        Square(Column.A, 1): Queen(Color.BLACK),
+    }
+    board = Board()
+    board.piece_dict = piece_dict
+    assert set(attackers_to(Square(Column.D, 5), Color.WHITE, board)) == {
+        Square(Column.F, 6),
+        Square(Column.G, 8),
+        Square(Column.D, 3),
+    }
+
+
+def test_attackers_to_pawn_and_king():
+    """
+    8 | | | | | | | | |
+    7 | | | | | | | | |
+    6 | | | | | | | | |
+    5 | | | | | | | | |
+    4 | | | | | | | | |
+    3 | | | | | | | | |
+    2 | | |K|P| | | | |
+    1 | | | | |X| | | |
+       A B C D E F G H
+    The white pawn attacks upward, so it does not attack E1
+    @return:
+    """
+    piece_dict = {
+        Square(Column.C, 2): King(Color.WHITE),
+        Square(Column.D, 2): Pawn(Color.WHITE),
+    }
+    board = Board()
+    board.piece_dict = piece_dict
+    assert not list(attackers_to(Square(Column.E, 1), Color.BLACK, board))
+    assert list(attackers_to(Square(Column.E, 3), Color.BLACK, board)) == [
+        Square(Column.D, 2)
+    ]
+    assert list(attackers_to(Square(Column.D, 1), Color.BLACK, board)) == [
+        Square(Column.C, 2)
+    ]
+
+
+def test_leaper_tables():
+    """
+    Test the precomputed knight, king and pawn capture tables
+    @return:
+    """
+    assert KNIGHT_SQUARES[Square(Column.A, 1).index] == (
+        Square(Column.B, 3),
+        Square(Column.C, 2),
+    )
+    assert KNIGHT_ATTACKS[Square(Column.D, 4).index].bit_count() == 8
+    assert KING_ATTACKS[Square(Column.H, 8).index] == (
+        1 << Square(Column.G, 7).index
+        | 1 << Square(Column.G, 8).index
+        | 1 << Square(Column.H, 7).index
+    )
+    assert PAWN_ATTACKS[Color.WHITE][Square(Column.A, 2).index] == (
+        1 << Square(Column.B, 3).index
+    )
+    assert PAWN_ATTACKS[Color.BLACK][Square(Column.E, 7).index] == (
+        1 << Square(Column.D, 6).index | 1 << Square(Column.F, 6).index
+    )
+
+
+def test_ray_tables():
+    """
+    Test the precomputed rays, and the first piece met on a ray
+    @return:
+    """
+    assert RAY_SQUARES[(1, 1)][Square(Column.E, 5).index] == (
+        Square(Column.F, 6),
+        Square(Column.G, 7),
+        Square(Column.H, 8),
+    )
+    assert not RAY_SQUARES[(-1, 0)][Square(Column.A, 3).index]
+    assert RAY_MASKS[(0, -1)][Square(Column.B, 3).index] == (
+        1 << Square(Column.B, 2).index | 1 << Square(Column.B, 1).index
+    )
+    occupancy = 1 << Square(Column.B, 1).index | 1 << Square(Column.B, 2).index
+    assert first_blocker((0, -1), Square(Column.B, 8).index, occupancy) == (
+        Square(Column.B, 2).index
+    )
+    assert first_blocker((0, 1), Square(Column.B, 1).index, occupancy) == (
+        Square(Column.B, 2).index
+    )
+    assert first_blocker((0, 1), Square(Column.B, 2).index, occupancy) is None
+
+
+def test_slider_attack_tables():
+    """
+    Test that the attack tables give the same attacks as the ray walk,
+    for any occupancy (the squares out of the rays are ignored)
+    8 | | | | | | | | |
+    7 | | | |x| | | | |
+    6 | | | | | | | | |
+    5 | | | | | | | | |
+    4 | |x| |R| | |x| |
+    3 | | | | | | | | |
+    2 | | | | | | | | |
+    1 | | | | | | | | |
+       A B C D E F G H
+    @return:
+    """
+    occupancy = (
+        1 << Square(Column.D, 7).index
+        | 1 << Square(Column.B, 4).index
+        | 1 << Square(Column.G, 4).index
+    )
+    expected_squares = [
+        Square(Column.B, 4),
+        Square(Column.C, 4),
+        Square(Column.E, 4),
+        Square(Column.F, 4),
+        Square(Column.G, 4),
+        Square(Column.D, 1),
+        Square(Column.D, 2),
+        Square(Column.D, 3),
+        Square(Column.D, 5),
+        Square(Column.D, 6),
+        Square(Column.D, 7),
+    ]
+    assert rook_attacks(Square(Column.D, 4).index, occupancy) == sum(
+        1 << square.index for square in expected_squares
+    )
+    random_generator = random.Random(0)
+    for _ in range(200):
+        index = random_generator.randrange(64)
+        occupancy = random_generator.getrandbits(64) & random_generator.getrandbits(64)
+        assert rook_attacks(index, occupancy) == sliding_attacks(
+            index, occupancy, LINE_DIRECTIONS
+        )
+        assert bishop_attacks(index, occupancy) == sliding_attacks(
+            index, occupancy, DIAGONAL_DIRECTIONS
+        )
+        assert queen_attacks(index, occupancy) == sliding_attacks(
+            index, occupancy, LINE_DIRECTIONS + DIAGONAL_DIRECTIONS
+        )